@@ -20,8 +20,40 @@
 
 from .admins import Admins                                         # noqa: F401
 from .agents import Agents                                         # noqa: F401
-from .api import Api                                               # noqa: F401
+from .api import Api, ApiError                                     # noqa: F401
+from .async_api import AsyncApi                                    # noqa: F401
+from .async_attachments import AsyncAttachments                    # noqa: F401
+from .async_tickets import AsyncTickets                            # noqa: F401
+from .async_users import AsyncUsers                                # noqa: F401
+from .checkpoints import (CheckpointStore,                         # noqa: F401
+                          FileCheckpointStore,                     # noqa: F401
+                          MemoryCheckpointStore)                   # noqa: F401
 from .constants import APP_VERSION as __version__                  # noqa: F401
+from .etagstore import (DirectoryEtagStore,                        # noqa: F401
+                        EtagStore,                                 # noqa: F401
+                        MemoryEtagStore)                           # noqa: F401
+from .exporters import (CsvExporter,                               # noqa: F401
+                        Exporter,                                  # noqa: F401
+                        JsonLinesExporter)                         # noqa: F401
+from .jobs import (JOB_STATUS_QUEUED,                              # noqa: F401
+                   JOB_STATUS_WORKING,                             # noqa: F401
+                   JOB_STATUS_FAILED,                              # noqa: F401
+                   JOB_STATUS_COMPLETED,                           # noqa: F401
+                   JOB_STATUS_KILLED,                              # noqa: F401
+                   JobStatus,                                      # noqa: F401
+                   JobSubmitError)                                 # noqa: F401
+from .jsoncodecs import (get_default_codec,                        # noqa: F401
+                         JsonCodec,                                # noqa: F401
+                         OrjsonCodec,                              # noqa: F401
+                         StandardJsonCodec)                        # noqa: F401
+from .jsonstream import JsonStream                                 # noqa: F401
+from .observers import (MetricsObserver,                           # noqa: F401
+                        RequestInfo,                               # noqa: F401
+                        RequestObserver)                           # noqa: F401
+from .profiler import Profiler                                     # noqa: F401
+from .ratelimiter import RateLimiter                               # noqa: F401
+from .responsecache import ResponseCache                           # noqa: F401
+from .retrypolicy import RetryPolicy                               # noqa: F401
 from .tickets import (TICKET_STATUS_NEW,                           # noqa: F401
                       TICKET_STATUS_OPEN,                          # noqa: F401
                       TICKET_STATUS_PENDING,                       # noqa: F401
@@ -30,4 +62,7 @@ from .tickets import (TICKET_STATUS_NEW,                           # noqa: F401
                       TICKET_STATUS_CLOSED,                        # noqa: F401
                       Tickets)                                     # noqa: F401
 from .attachments import Attachments                               # noqa: F401
+from .uploadcache import (DirectoryUploadCache,                    # noqa: F401
+                          MemoryUploadCache,                       # noqa: F401
+                          UploadCache)                             # noqa: F401
 from .users import Users                                           # noqa: F401
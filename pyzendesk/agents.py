@@ -18,29 +18,21 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 ##
 
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from .api import Api
+from .constants import SHOW_MANY_MAX_IDS
+from .exporters import Exporter
 from .users import Users
 
 
 class Agents(Api):
-    def __init__(self, website: str):
-        super().__init__(website=website)
-        self._users = Users(website=website)
-
-    def authenticate(self, username: str, password: str) -> None:
-        """
-        Set authentication username and password
-
-        :param username: user name for login
-        :param password: user password for login
-        :return: None
-        """
-        super().authenticate(username=username,
-                             password=password)
-        self._users.authenticate(username=username,
-                                 password=password)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Share the same connections pool with the inner users object
+        self._users = Users(website=self.website,
+                            session=self.session)
+        self.add_child(child=self._users)
 
     def me(self) -> dict:
         """
@@ -59,14 +51,43 @@ class Agents(Api):
         """
         return self._users.get(user_id=agent_id)
 
-    def get_many(self, agent_ids: list[int]) -> dict:
+    def get_many(self,
+                 agent_ids: Iterable[int],
+                 chunk_size: int = SHOW_MANY_MAX_IDS,
+                 max_workers: int = 4) -> dict:
         """
-        Get many agents' details
+        Get many agents' details using concurrent requests for chunks of IDs
 
         :param agent_ids: list of agents ID to get data from
-        :return: dictionary with the agent details
+        :param chunk_size: maximum number of IDs for each request
+        :param max_workers: maximum number of concurrent requests
+        :return: dictionary with the agent details in the same order of the
+                 IDs and the list of the IDs not found
+        """
+        return self._users.get_many(user_ids=agent_ids,
+                                    chunk_size=chunk_size,
+                                    max_workers=max_workers)
+
+    def iter_many(self,
+                  agent_ids: Iterable[int],
+                  chunk_size: int = SHOW_MANY_MAX_IDS,
+                  max_workers: int = 4,
+                  missing_ids: Optional[list[int]] = None) -> Iterator[dict]:
         """
-        return self._users.get_many(user_ids=agent_ids)
+        Get many agents' details one at a time using concurrent requests for
+        chunks of IDs
+
+        :param agent_ids: list of agents ID to get data from
+        :param chunk_size: maximum number of IDs for each request
+        :param max_workers: maximum number of concurrent requests
+        :param missing_ids: list to fill with the IDs not found or None
+        :return: iterator over the agent details in the same order of the IDs
+        :raise ApiError: if any request returned an error
+        """
+        return self._users.iter_many(user_ids=agent_ids,
+                                     chunk_size=chunk_size,
+                                     max_workers=max_workers,
+                                     missing_ids=missing_ids)
 
     def get_related(self, agent_id: int) -> dict:
         """
@@ -119,3 +140,42 @@ class Agents(Api):
             criteria_list_copy.append('role:admin')
         results = self._users.search_all(criteria_list=criteria_list_copy)
         return results
+
+    def iter_search_all(self,
+                        include_admins: bool,
+                        criteria_list: list) -> Iterator[dict]:
+        """
+        Get the agents matching the specified criterias one at a time,
+        as soon as each page arrives
+
+        :param include_admins: include administrator as agents
+        :param criteria_list: list of string criterias
+        :return: iterator over the agents found
+        :raise ApiError: if any page returned an error
+        """
+        criteria_list_copy = criteria_list.copy()
+        criteria_list_copy.append('role:agent')
+        if include_admins:
+            criteria_list_copy.append('role:admin')
+        return self._users.iter_search_all(criteria_list=criteria_list_copy)
+
+    def save_search(self,
+                    exporter: Exporter,
+                    include_admins: bool,
+                    criteria_list: list) -> int:
+        """
+        Save the agents matching the specified criterias to a file,
+        writing each page as soon as it arrives
+
+        :param exporter: exporter used to write the agents
+        :param include_admins: include administrator as agents
+        :param criteria_list: list of string criterias
+        :return: number of agents written
+        :raise ApiError: if any page returned an error
+        """
+        criteria_list_copy = criteria_list.copy()
+        criteria_list_copy.append('role:agent')
+        if include_admins:
+            criteria_list_copy.append('role:admin')
+        return self._users.save_search(exporter=exporter,
+                                       criteria_list=criteria_list_copy)
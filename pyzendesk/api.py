@@ -18,18 +18,100 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 ##
 
+import collections
+import contextlib
+import concurrent.futures
 import logging
-from typing import Optional
+import time
+import urllib.parse
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, Union
 
 import requests
+import requests.adapters
 import requests.auth
+import requests.utils
+
+from .checkpoints import CheckpointStore
+from .etagstore import EtagStore
+from .jsoncodecs import JsonCodec, StandardJsonCodec
+from .jsonstream import JsonStream
+from .observers import RequestInfo, RequestObserver
+from .profiler import Profiler
+from .ratelimiter import RateLimiter
+from .responsecache import ResponseCache
+from .retrypolicy import RetryPolicy
+
+
+class ApiError(Exception):
+    def __init__(self, results: dict):
+        """
+        Error returned by Zendesk in place of the expected results
+
+        :param results: dictionary with the error details
+        """
+        self.results = results
+        self.error = results.get('error')
+        self.description = results.get('description')
+        super().__init__(f'{self.error}: {self.description}'
+                         if self.description else self.error)
 
 
 class Api(object):
-    def __init__(self, website: str):
+    def __init__(self,
+                 website: str,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 keep_alive: bool = True,
+                 session: Optional[requests.Session] = None):
+        """
+        Zendesk API base object
+
+        :param website: Zendesk website URL
+        :param pool_connections: number of connection pools to cache
+        :param pool_maxsize: maximum number of connections for each host
+        :param keep_alive: keep the connections open between requests
+        :param session: existing session to share instead of creating one
+        """
         self.website = website[:-1] if website.endswith('/') else website
         self.username = None
         self.password = None
+        self._auth = None
+        self.rate_limiter = None
+        self.retry_policy = RetryPolicy()
+        self.response_cache = None
+        self.etag_store = None
+        self.codec = StandardJsonCodec()
+        self.observers = []
+        self.profiler = None
+        # Inner API objects sharing the authentication and the settings
+        self._children = []
+        # Use a persistent session to reuse the connections between requests
+        self._session_owner = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            if not keep_alive:
+                session.headers['Connection'] = 'close'
+        self.session = session
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the connections pool if owned by this object
+
+        :return: None
+        """
+        if self._session_owner:
+            self.session.close()
 
     def authenticate(self, username: str, password: str) -> None:
         """
@@ -41,14 +123,129 @@ class Api(object):
         """
         self.username = username
         self.password = password
+        self._auth = requests.auth.HTTPBasicAuth(username=username,
+                                                 password=password)
+        # Share the rate limits with every object using the same account
+        self.rate_limiter = RateLimiter.get_instance(website=self.website,
+                                                     username=username)
+        for child in self._children:
+            child.authenticate(username=username, password=password)
+
+    def set_retry_policy(self, retry_policy: Optional[RetryPolicy]) -> None:
+        """
+        Set the policy to repeat the requests failed for transient errors
+
+        :param retry_policy: retry policy to use or None to disable retries
+        :return: None
+        """
+        self.retry_policy = retry_policy
+        for child in self._children:
+            child.set_retry_policy(retry_policy=retry_policy)
+
+    def set_response_cache(self,
+                           response_cache: Optional[ResponseCache]) -> None:
+        """
+        Set the cache for the responses of the entities requests
+
+        :param response_cache: response cache to use or None to disable it
+        :return: None
+        """
+        self.response_cache = response_cache
+        for child in self._children:
+            child.set_response_cache(response_cache=response_cache)
+
+    def set_etag_store(self, etag_store: Optional[EtagStore]) -> None:
+        """
+        Set the store for the validators used to revalidate the responses
+        of the entities requests using conditional requests
+
+        :param etag_store: validators store to use or None to disable it
+        :return: None
+        """
+        self.etag_store = etag_store
+        for child in self._children:
+            child.set_etag_store(etag_store=etag_store)
+
+    def set_codec(self, codec: JsonCodec) -> None:
+        """
+        Set the codec used to encode the requests JSON data and to decode
+        the responses JSON data
+
+        :param codec: JSON codec to use
+        :return: None
+        """
+        self.codec = codec
+        for child in self._children:
+            child.set_codec(codec=codec)
+
+    def set_profiler(self, profiler: Optional[Profiler]) -> None:
+        """
+        Set the profiler recording the time spent in each phase of the
+        page requests, like the rate limit wait, the connection, the time
+        to first byte, the body transfer, the JSON decode and the merge
+
+        :param profiler: profiler to use or None to disable the profiling
+        :return: None
+        """
+        if profiler is not self.profiler:
+            if self.profiler is not None:
+                self.profiler.uninstall(session=self.session)
+            if profiler is not None:
+                profiler.install(session=self.session)
+        self.profiler = profiler
+        for child in self._children:
+            child.set_profiler(profiler=profiler)
+
+    def add_observer(self, observer: RequestObserver) -> None:
+        """
+        Add an observer notified before and after every request
+
+        :param observer: request observer to add
+        :return: None
+        """
+        self.observers.append(observer)
+        for child in self._children:
+            child.add_observer(observer=observer)
+
+    def remove_observer(self, observer: RequestObserver) -> None:
+        """
+        Remove a previously added request observer
+
+        :param observer: request observer to remove
+        :return: None
+        """
+        self.observers.remove(observer)
+        for child in self._children:
+            child.remove_observer(observer=observer)
+
+    def add_child(self, child: 'Api') -> None:
+        """
+        Add an inner API object which will share the authentication and
+        the settings set afterwards on this object
+
+        :param child: inner API object
+        :return: None
+        """
+        self._children.append(child)
+
+    def invalidate_cache(self, path: str) -> None:
+        """
+        Remove the cached responses for an updated entity
+
+        :param path: API path of the entity (like tickets/1 or users/1)
+        :return: None
+        """
+        if self.response_cache is not None:
+            self.response_cache.invalidate(path=path)
 
     def request_raw(self,
                     method: str,
                     path: str,
                     headers: dict,
                     params: Optional[dict],
-                    data: Optional[bytes],
-                    json: Optional[dict]) -> requests.Response:
+                    data: Optional[Union[bytes, BinaryIO]],
+                    json: Optional[dict],
+                    stream: bool = False) -> requests.Response:
         """
         Send a raw REST request to Zendesk
 
@@ -56,43 +253,255 @@ class Api(object):
         :param path: API path which will be added to the base API path
         :param headers: dictionary with HTTP headers
         :param params: additional query string to send along with the request
-        :param data: additional raw data to send along with the request
+        :param data: additional raw data or file object to send along with
+                     the request
         :param json: additional JSON data to send along with the request
+        :param stream: don't download the response body immediately
         :return: raw requests response
         """
-        logging_path = path.replace('\n', '\\n')
-        logging.debug(f'Executing {method} request '
-                      f'for url {self.website}/api/v2/{logging_path}')
-        req = requests.request(method=method,
-                               url=f'{self.website}/api/v2/{path}',
-                               auth=requests.auth.HTTPBasicAuth(
-                                   username=self.username,
-                                   password=self.password),
-                               headers=headers,
-                               params=params,
-                               data=data,
-                               json=json)
+        return self.request_url(method=method,
+                                url=f'{self.website}/api/v2/{path}',
+                                headers=headers,
+                                params=params,
+                                data=data,
+                                json=json,
+                                stream=stream)
+
+    def request_url(self,
+                    method: str,
+                    url: str,
+                    headers: dict,
+                    params: Optional[dict],
+                    data: Optional[Union[bytes, BinaryIO]],
+                    json: Optional[dict],
+                    stream: bool = False,
+                    rate_limited: bool = True) -> requests.Response:
+        """
+        Send a raw request to an absolute URL, like the attachments URLs
+
+        :param method: REST method to use (get, post, put, delete)
+        :param url: absolute URL for the request
+        :param headers: dictionary with HTTP headers
+        :param params: additional query string to send along with the request
+        :param data: additional raw data or file object to send along with
+                     the request
+        :param json: additional JSON data to send along with the request
+        :param stream: don't download the response body immediately
+        :param rate_limited: apply the API rate limits to the request
+        :return: raw requests response
+        """
+        logging_url = url.replace('\n', '\\n')
+        logging.debug(f'Executing {method} request for url {logging_url}')
+        if json is not None:
+            # Encode the JSON data using the codec instead of requests
+            data = self.codec.dumps(json)
+            headers = {**headers, 'Content-Type': 'application/json'}
+        # Save the file position to send the same data again on retries,
+        # the file objects which cannot be rewound are sent only once
+        data_position = None
+        repeatable = True
+        if hasattr(data, 'read'):
+            if data.seekable():
+                data_position = data.tell()
+            else:
+                repeatable = False
+        info = self._notify_before_request(method=method,
+                                           url=url,
+                                           data=data)
+        page = (self.profiler.start_page(
+                    method=method,
+                    endpoint=RequestInfo.get_endpoint(website=self.website,
+                                                      url=url))
+                if self.profiler is not None
+                else None)
+        failures = 0
+        throttled = 0
+        status = None
+        try:
+            while True:
+                if data_position is not None:
+                    data.seek(data_position)
+                if rate_limited and self.rate_limiter is not None:
+                    delay = self.rate_limiter.reserve()
+                    if delay > 0:
+                        logging.debug(f'Waiting {delay:.3f} seconds '
+                                      f'for the rate limit')
+                        time.sleep(delay)
+                        self._record_profile(phase='rate_limit_wait',
+                                             duration=delay)
+                req = None
+                attempt_started = time.perf_counter()
+                try:
+                    # When profiling, the body is read later to time it
+                    req = self.session.request(
+                        method=method,
+                        url=url,
+                        auth=self._auth,
+                        headers=headers,
+                        params=params,
+                        data=data,
+                        stream=stream or page is not None)
+                    if page is not None:
+                        self.profiler.record_attempt(
+                            duration=time.perf_counter() - attempt_started)
+                        if not stream:
+                            # Read the whole body during the attempt to
+                            # repeat the request for the read errors
+                            started = time.perf_counter()
+                            req.content
+                            self.profiler.record(
+                                phase='transfer',
+                                duration=time.perf_counter() - started)
+                except Exception as error:
+                    if page is not None and req is None:
+                        self.profiler.record_attempt(
+                            duration=time.perf_counter() - attempt_started)
+                    failures += 1
+                    if (not repeatable or
+                            self.retry_policy is None or
+                            not self.retry_policy.should_retry(
+                                method=method,
+                                attempt=failures,
+                                exception=error)):
+                        self._notify_after_request(
+                            info=info,
+                            retries=failures + throttled - 1,
+                            response=None,
+                            error=error)
+                        raise
+                    delay = self.retry_policy.get_delay(attempt=failures)
+                    logging.debug(f'Repeating {method} request after '
+                                  f'{error!r} in {delay:.3f} seconds')
+                    time.sleep(delay)
+                    self._record_profile(phase='retry_wait', duration=delay)
+                    continue
+                if rate_limited and self.rate_limiter is not None:
+                    self.rate_limiter.update(status=req.status_code,
+                                             headers=req.headers)
+                    if (repeatable and
+                            req.status_code == 429 and
+                            throttled < self.rate_limiter.max_retries):
+                        # Throttled request, repeat it after the rate limit
+                        # delay
+                        throttled += 1
+                        req.close()
+                        continue
+                if (repeatable and
+                        self.retry_policy is not None and
+                        self.retry_policy.should_retry(
+                            method=method,
+                            attempt=failures + 1,
+                            status=req.status_code)):
+                    failures += 1
+                    delay = self.retry_policy.get_delay(
+                        attempt=failures,
+                        retry_after=RateLimiter.get_retry_after(
+                            headers=req.headers))
+                    logging.debug(f'Repeating {method} request after status '
+                                  f'{req.status_code} in {delay:.3f} seconds')
+                    req.close()
+                    time.sleep(delay)
+                    self._record_profile(phase='retry_wait', duration=delay)
+                    continue
+                status = req.status_code
+                break
+        finally:
+            if page is not None:
+                self.profiler.stop_page(page=page, status=status)
+        self._notify_after_request(info=info,
+                                   retries=failures + throttled,
+                                   response=req,
+                                   error=None,
+                                   stream=stream)
         return req
 
     def request(self,
                 method: str,
                 path: str,
-                json: Optional[dict]) -> dict:
+                json: Optional[dict],
+                cached: bool = False) -> dict:
         """
         Send a JSON REST request to Zendesk
 
         :param method: REST method to use (get, post, put, delete)
         :param path: API path which will be added to the base API path
         :param json: additional JSON data to send along with the request
+        :param cached: use the response cache and the conditional requests,
+                       if set
         :return: response from JSON data
         """
+        if cached and self.response_cache is not None:
+            content = self.response_cache.get(method=method, path=path)
+            if content is not None:
+                return self.codec.loads(content)
+        headers = {'Content-Type': 'application/json'}
+        stored = None
+        if cached and method == 'get' and self.etag_store is not None:
+            # Revalidate the stored response using a conditional request
+            stored = self.etag_store.get(path=path)
+            if stored is not None:
+                etag, last_modified, _ = stored
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
         req = self.request_raw(method=method,
                                path=path,
-                               headers={'Content-Type': 'application/json'},
+                               headers=headers,
                                params=None,
                                data=None,
                                json=json)
-        return req.json()
+        if stored is not None and req.status_code == 304:
+            # Not modified, use the stored response
+            content = stored[2]
+        elif cached and req.status_code == 200:
+            content = req.content
+            etag = req.headers.get('ETag')
+            last_modified = req.headers.get('Last-Modified')
+            if (method == 'get' and
+                    self.etag_store is not None and
+                    (etag or last_modified)):
+                self.etag_store.set(path=path,
+                                    etag=etag,
+                                    last_modified=last_modified,
+                                    content=content)
+        else:
+            return self._decode_json(content=req.content)
+        if self.response_cache is not None:
+            self.response_cache.set(method=method,
+                                    path=path,
+                                    content=content)
+        return self._decode_json(content=content)
+
+    def request_stream(self,
+                       method: str,
+                       path: str,
+                       key: str,
+                       chunk_size: int = 65536) -> JsonStream:
+        """
+        Send a REST request to Zendesk, decoding the records from the
+        response as soon as each chunk arrives
+
+        :param method: REST method to use (get, post, put, delete)
+        :param path: API path which will be added to the base API path
+        :param key: results key containing the records
+        :param chunk_size: size of the chunks read from the response
+        :return: stream over the records, with the other results keys
+                 available after all the records were processed
+        """
+        req = self.request_raw(method=method,
+                               path=path,
+                               headers={},
+                               params=None,
+                               data=None,
+                               json=None,
+                               stream=True)
+
+        def iter_content() -> Iterator[bytes]:
+            with req:
+                yield from req.iter_content(chunk_size=chunk_size)
+        return JsonStream(chunks=iter_content(),
+                          key=key)
 
     def request_delete(self,
                        path: str) -> dict:
@@ -105,14 +514,17 @@ class Api(object):
         return self.request(method='delete', path=path, json=None)
 
     def request_get(self,
-                    path: str) -> dict:
+                    path: str,
+                    cached: bool = False) -> dict:
         """
         Send a GET REST request to Zendesk
 
         :param path: API path which will be added to the base API path
+        :param cached: use the response cache and the conditional requests,
+                       if set
         :return: response from JSON data
         """
-        return self.request(method='get', path=path, json=None)
+        return self.request(method='get', path=path, json=None, cached=cached)
 
     def request_post(self,
                      path: str,
@@ -137,3 +549,413 @@ class Api(object):
         :return: response from JSON data
         """
         return self.request(method='put', path=path, json=json)
+
+    def paginate(self,
+                 request_page: Callable[[int], dict],
+                 page: int = 1) -> Iterator[dict]:
+        """
+        Get all the pages for a paginated request by page number.
+        The pagination stops after the last page or after the first error.
+
+        :param request_page: function to get the page with the passed number
+        :param page: page number to start from
+        :return: iterator over the pages results
+        """
+        current_page = page - 1
+        next_page_url = 'initial value'
+        while next_page_url:
+            current_page += 1
+            page_results = request_page(current_page)
+            yield page_results
+            if 'error' not in page_results:
+                # Continue processing the next page
+                next_page_url = page_results['next_page']
+            else:
+                # Stop search if any error occurred
+                next_page_url = None
+
+    def paginate_cursor(self,
+                        request_page: Callable[[Optional[str]], dict],
+                        after_cursor: Optional[str] = None
+                        ) -> Iterator[dict]:
+        """
+        Get all the pages for a paginated request by cursor.
+        The pagination stops after the last page or after the first error.
+
+        :param request_page: function to get the page after the passed cursor
+        :param after_cursor: cursor to start from or None for the first page
+        :return: iterator over the pages results
+        """
+        next_token = 'initial value'
+        while next_token:
+            page_results = request_page(after_cursor)
+            yield page_results
+            if ('error' not in page_results and
+                    page_results['meta']['has_more']):
+                # Continue processing the next page
+                next_token = page_results['meta']['after_cursor']
+                after_cursor = next_token
+            else:
+                # Stop search if any error occurred
+                next_token = None
+
+    def paginate_incremental(self,
+                             request_page: Callable[[Optional[str]], dict],
+                             after_cursor: Optional[str] = None
+                             ) -> Iterator[dict]:
+        """
+        Get all the pages for an incremental export by cursor.
+        The pagination stops at the end of the stream or after the first
+        error.
+
+        :param request_page: function to get the page after the passed cursor
+        :param after_cursor: cursor to start from or None for the first page
+        :return: iterator over the pages results
+        """
+        while True:
+            page_results = request_page(after_cursor)
+            yield page_results
+            if 'error' in page_results or page_results['end_of_stream']:
+                # Stop export at the end of the stream or for any error
+                break
+            after_cursor = page_results['after_cursor']
+
+    def get_next_page(self, page_results: dict) -> Optional[str]:
+        """
+        Get the next page number from the results of a paginated request
+        by page number
+
+        :param page_results: dictionary with the page results
+        :return: next page number or None after the last page
+        """
+        if not page_results['next_page']:
+            return None
+        query = urllib.parse.urlparse(page_results['next_page']).query
+        return urllib.parse.parse_qs(query)['page'][0]
+
+    def get_next_cursor(self, page_results: dict) -> Optional[str]:
+        """
+        Get the next cursor from the results of a paginated request by cursor
+
+        :param page_results: dictionary with the page results
+        :return: cursor of the next page or None after the last page
+        """
+        if not page_results['meta']['has_more']:
+            return None
+        return page_results['meta']['after_cursor']
+
+    def get_next_incremental_cursor(self,
+                                    page_results: dict) -> Optional[str]:
+        """
+        Get the next cursor from the results of an incremental export
+
+        :param page_results: dictionary with the page results
+        :return: cursor of the next page or None at the end of the stream
+        """
+        if page_results['end_of_stream']:
+            return None
+        return page_results['after_cursor']
+
+    def merge_pages(self,
+                    pages: Iterator[dict],
+                    key: str,
+                    sideloads: Optional[Iterable[str]] = None) -> dict:
+        """
+        Merge the results for many pages into a single dictionary
+
+        :param pages: iterator over the pages results
+        :param key: results key containing the records
+        :param sideloads: list of side-loaded keys to merge or None
+        :return: dictionary with the merged results
+        """
+        results = {}
+        with (self.profiler.call()
+              if self.profiler is not None
+              else contextlib.nullcontext()):
+            for page_results in pages:
+                started = time.perf_counter()
+                if not results:
+                    # First page of results
+                    results = page_results
+                elif 'error' in page_results:
+                    # Too many results, search interrupted server side
+                    results['error'] = page_results['error']
+                    results['description'] = page_results['description']
+                else:
+                    # Append results
+                    results[key].extend(page_results[key])
+                    for sideload in sideloads or ():
+                        if isinstance(page_results.get(sideload), list):
+                            results.setdefault(sideload, []).extend(
+                                page_results[sideload])
+                self._record_profile(phase='merge',
+                                     duration=time.perf_counter() - started)
+        return results
+
+    def index_sideloads(self,
+                        results: dict,
+                        sideloads: Iterable[str]) -> dict[str, dict]:
+        """
+        Get the side-loaded records indexed by ID
+
+        :param results: dictionary with the results containing the
+                        side-loaded records
+        :param sideloads: list of side-loaded keys to index
+        :return: dictionary with a dictionary of records by ID for each
+                 side-loaded key
+        """
+        return {sideload: {record['id']: record
+                           for record in results.get(sideload) or []
+                           if isinstance(record, dict) and 'id' in record}
+                for sideload in sideloads}
+
+    def iter_records(self, pages: Iterator[dict], key: str) -> Iterator[dict]:
+        """
+        Get the records for many pages one at a time
+
+        :param pages: iterator over the pages results
+        :param key: results key containing the records
+        :return: iterator over the records
+        :raise ApiError: if any page returned an error
+        """
+        for page_results in pages:
+            if 'error' in page_results:
+                raise ApiError(results=page_results)
+            yield from page_results[key]
+
+    def iter_incremental_records(self,
+                                 pages: Iterator[dict],
+                                 key: str,
+                                 checkpoint_store: Optional[CheckpointStore],
+                                 checkpoint_key: str) -> Iterator[dict]:
+        """
+        Get the records for many incremental export pages one at a time,
+        saving the cursor after all the records of each page were processed
+
+        :param pages: iterator over the pages results
+        :param key: results key containing the records
+        :param checkpoint_store: store to save the cursor or None
+        :param checkpoint_key: checkpoint name used to save the cursor
+        :return: iterator over the records
+        :raise ApiError: if any page returned an error
+        """
+        for page_results in pages:
+            if 'error' in page_results:
+                raise ApiError(results=page_results)
+            yield from page_results[key]
+            if checkpoint_store is not None and page_results['after_cursor']:
+                checkpoint_store.set(key=checkpoint_key,
+                                     value=page_results['after_cursor'])
+
+    def iter_stream_records(self,
+                            request_page: Callable[[Optional[str]],
+                                                   JsonStream],
+                            get_cursor: Callable[[dict], Optional[str]],
+                            cursor: Optional[str] = None,
+                            checkpoint_store: Optional[
+                                CheckpointStore] = None,
+                            checkpoint_key: Optional[str] = None
+                            ) -> Iterator[dict]:
+        """
+        Get the records for many streamed pages one at a time, as soon as
+        each record is decoded
+
+        :param request_page: function to get the streamed page after the
+                             passed cursor or the first page for None
+        :param get_cursor: function to get the cursor of the next page from
+                           the page results or None after the last page
+        :param cursor: cursor to start from or None for the first page
+        :param checkpoint_store: store to save the after_cursor of every
+                                 processed page or None
+        :param checkpoint_key: checkpoint name used to save the cursor
+        :return: iterator over the records
+        :raise ApiError: if any page returned an error
+        """
+        while True:
+            stream = request_page(cursor)
+            yield from stream
+            page_results = stream.results
+            if 'error' in page_results:
+                raise ApiError(results=page_results)
+            if (checkpoint_store is not None and
+                    page_results.get('after_cursor')):
+                checkpoint_store.set(key=checkpoint_key,
+                                     value=page_results['after_cursor'])
+            cursor = get_cursor(page_results)
+            if cursor is None:
+                break
+
+    def iter_chunks(self,
+                    items: Iterable,
+                    chunk_size: int) -> Iterator[list]:
+        """
+        Split the items in chunks without loading all of them
+
+        :param items: iterable over the items to split
+        :param chunk_size: maximum number of items for each chunk
+        :return: iterator over the lists of items
+        """
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def iter_show_many(self,
+                       path: str,
+                       key: str,
+                       ids: Iterable[int],
+                       chunk_size: int,
+                       max_workers: int,
+                       missing_ids: Optional[list[int]] = None
+                       ) -> Iterator[dict]:
+        """
+        Get many records by ID, splitting the IDs in chunks which are
+        requested concurrently. The duplicated IDs are requested only once
+        and the records are returned in the same order of the IDs.
+
+        :param path: API path for the show many request
+        :param key: results key containing the records
+        :param ids: list of IDs to get data from
+        :param chunk_size: maximum number of IDs for each request
+        :param max_workers: maximum number of concurrent requests
+        :param missing_ids: list to fill with the IDs not found or None
+        :return: iterator over the records found
+        :raise ApiError: if any request returned an error
+        """
+        ids = list(dict.fromkeys(ids))
+        chunks = [ids[index:index + chunk_size]
+                  for index in range(0, len(ids), chunk_size)]
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers) as executor:
+            # Keep a limited number of chunks in progress
+            pending = collections.deque()
+            for chunk in chunks:
+                pending.append((chunk, executor.submit(
+                    self.request_get,
+                    path=f'{path}?ids={",".join(map(str, chunk))}')))
+                if len(pending) >= max_workers * 2:
+                    yield from self._get_show_many_records(
+                        *pending.popleft(),
+                        key=key,
+                        missing_ids=missing_ids)
+            while pending:
+                yield from self._get_show_many_records(
+                    *pending.popleft(),
+                    key=key,
+                    missing_ids=missing_ids)
+
+    def _get_show_many_records(self,
+                               chunk: list[int],
+                               future: concurrent.futures.Future,
+                               key: str,
+                               missing_ids: Optional[list[int]]
+                               ) -> Iterator[dict]:
+        """
+        Get the records for a chunk of IDs in the same order of the IDs
+
+        :param chunk: list of requested IDs
+        :param future: future for the show many request
+        :param key: results key containing the records
+        :param missing_ids: list to fill with the IDs not found or None
+        :return: iterator over the records found
+        :raise ApiError: if the request returned an error
+        """
+        results = future.result()
+        if 'error' in results:
+            raise ApiError(results=results)
+        records = {record['id']: record for record in results[key]}
+        for record_id in chunk:
+            if record_id in records:
+                yield records[record_id]
+            elif missing_ids is not None:
+                missing_ids.append(record_id)
+
+    def _notify_before_request(self,
+                               method: str,
+                               url: str,
+                               data: Optional[Union[bytes, BinaryIO]]
+                               ) -> Optional[RequestInfo]:
+        """
+        Notify the observers before sending a request
+
+        :param method: REST method used
+        :param url: absolute URL of the request
+        :param data: raw data or file object to send along with the request
+        :return: request details or None without observers
+        """
+        if not self.observers:
+            return None
+        info = RequestInfo(
+            method=method,
+            url=url,
+            endpoint=RequestInfo.get_endpoint(website=self.website,
+                                              url=url),
+            bytes_sent=requests.utils.super_len(data) if data else 0)
+        for observer in self.observers:
+            observer.before_request(info=info)
+        return info
+
+    def _notify_after_request(self,
+                              info: Optional[RequestInfo],
+                              retries: int,
+                              response: Optional[requests.Response],
+                              error: Optional[Exception],
+                              stream: bool = False) -> None:
+        """
+        Notify the observers after the request was completed or failed
+
+        :param info: request details or None without observers
+        :param retries: number of repeated attempts
+        :param response: response received or None after an error
+        :param error: exception raised or None
+        :param stream: the response body was not downloaded yet
+        :return: None
+        """
+        if info is None:
+            return
+        info.duration = time.monotonic() - info.started
+        info.retries = retries
+        info.error = error
+        if response is not None:
+            if not stream:
+                # The whole body was already read
+                size = len(response.content)
+            else:
+                size = response.headers.get('Content-Length')
+                size = int(size) if size and size.isdigit() else None
+            info.set_response(status=response.status_code,
+                              headers=response.headers,
+                              size=size)
+        for observer in self.observers:
+            observer.after_request(info=info)
+
+    def _decode_json(self, content: bytes) -> dict:
+        """
+        Decode the JSON data of a response, recording the decode time
+        when profiling
+
+        :param content: raw JSON data
+        :return: response from JSON data
+        """
+        if self.profiler is None:
+            return self.codec.loads(content)
+        started = time.perf_counter()
+        results = self.codec.loads(content)
+        self.profiler.record(phase='decode',
+                             duration=time.perf_counter() - started)
+        return results
+
+    def _record_profile(self, phase: str, duration: float) -> None:
+        """
+        Record the time spent in a phase when profiling
+
+        :param phase: phase name
+        :param duration: time spent in seconds
+        :return: None
+        """
+        if self.profiler is not None:
+            self.profiler.record(phase=phase, duration=duration)
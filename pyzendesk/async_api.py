@@ -0,0 +1,595 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import asyncio
+import io
+import logging
+import time
+from typing import (AsyncIterator, Awaitable, BinaryIO, Callable, Optional,
+                    Union)
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .api import ApiError
+from .jsoncodecs import JsonCodec, StandardJsonCodec
+from .observers import RequestInfo, RequestObserver
+from .ratelimiter import RateLimiter
+from .retrypolicy import RetryPolicy
+
+
+class UnclosedFile(io.RawIOBase):
+    def __init__(self, file: BinaryIO):
+        """
+        File object wrapper ignoring the close requests, as aiohttp closes
+        the sent file objects and the same file is sent again on retries
+
+        :param file: binary file object to wrap
+        """
+        super().__init__()
+        self.file = file
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self.file.read(size)
+
+    def readinto(self, buffer: bytearray) -> int:
+        return self.file.readinto(buffer)
+
+    def seekable(self) -> bool:
+        return self.file.seekable()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self.file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def close(self) -> None:
+        # Leave the wrapped file open
+        pass
+
+
+class AsyncApi(object):
+    def __init__(self,
+                 website: str,
+                 max_concurrency: int = 10,
+                 pool_maxsize: int = 10,
+                 keep_alive: bool = True,
+                 session: Optional['aiohttp.ClientSession'] = None):
+        """
+        Zendesk asynchronous API base object
+
+        :param website: Zendesk website URL
+        :param max_concurrency: maximum number of requests in progress
+        :param pool_maxsize: maximum number of connections for each host
+        :param keep_alive: keep the connections open between requests
+        :param session: existing session to share instead of creating one
+        """
+        if aiohttp is None:
+            raise ImportError('aiohttp is required for the asynchronous API, '
+                              'install it using: pip install PyZendesk[async]')
+        self.website = website[:-1] if website.endswith('/') else website
+        self.username = None
+        self.password = None
+        self._auth = None
+        self.rate_limiter = None
+        self.retry_policy = RetryPolicy()
+        self.codec = StandardJsonCodec()
+        self.observers = []
+        self._pool_maxsize = pool_maxsize
+        self._keep_alive = keep_alive
+        self._max_concurrency = max_concurrency
+        self._semaphore = None
+        # The session is created on the first request as it requires a
+        # running event loop
+        self._session_owner = session is None
+        self.session = session
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the connections pool if owned by this object
+
+        :return: None
+        """
+        if self._session_owner and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def authenticate(self, username: str, password: str) -> None:
+        """
+        Set authentication username and password
+
+        :param username: user name for login
+        :param password: user password for login
+        :return: None
+        """
+        self.username = username
+        self.password = password
+        self._auth = aiohttp.BasicAuth(login=username,
+                                       password=password)
+        # Share the rate limits with every object using the same account
+        self.rate_limiter = RateLimiter.get_instance(website=self.website,
+                                                     username=username)
+
+    def set_retry_policy(self, retry_policy: Optional[RetryPolicy]) -> None:
+        """
+        Set the policy to repeat the requests failed for transient errors
+
+        :param retry_policy: retry policy to use or None to disable retries
+        :return: None
+        """
+        self.retry_policy = retry_policy
+
+    def set_codec(self, codec: JsonCodec) -> None:
+        """
+        Set the codec used to encode the requests JSON data and to decode
+        the responses JSON data
+
+        :param codec: JSON codec to use
+        :return: None
+        """
+        self.codec = codec
+
+    def add_observer(self, observer: RequestObserver) -> None:
+        """
+        Add an observer notified before and after every request
+
+        :param observer: request observer to add
+        :return: None
+        """
+        self.observers.append(observer)
+
+    def remove_observer(self, observer: RequestObserver) -> None:
+        """
+        Remove a previously added request observer
+
+        :param observer: request observer to remove
+        :return: None
+        """
+        self.observers.remove(observer)
+
+    def get_session(self) -> 'aiohttp.ClientSession':
+        """
+        Get the session used for the requests, creating it if needed
+
+        :return: session object
+        """
+        if self.session is None:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self._pool_maxsize,
+                force_close=not self._keep_alive)
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    def get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore limiting the requests in progress
+
+        :return: semaphore object
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphore
+
+    async def request_raw(self,
+                          method: str,
+                          path: str,
+                          headers: dict,
+                          params: Optional[dict],
+                          data: Optional[Union[bytes, BinaryIO]],
+                          json: Optional[dict]) -> 'aiohttp.ClientResponse':
+        """
+        Send a raw REST request to Zendesk
+
+        :param method: REST method to use (get, post, put, delete)
+        :param path: API path which will be added to the base API path
+        :param headers: dictionary with HTTP headers
+        :param params: additional query string to send along with the request
+        :param data: additional raw data or file object to send along with
+                     the request
+        :param json: additional JSON data to send along with the request
+        :return: raw aiohttp response with the body already read
+        """
+        req, _ = await self._request_content(method=method,
+                                             path=path,
+                                             headers=headers,
+                                             params=params,
+                                             data=data,
+                                             json=json)
+        return req
+
+    async def request_json(self,
+                           method: str,
+                           path: str,
+                           headers: dict,
+                           params: Optional[dict],
+                           data: Optional[Union[bytes, BinaryIO]],
+                           json: Optional[dict]) -> Optional[dict]:
+        """
+        Send a REST request to Zendesk, decoding the raw response body
+        using the codec
+
+        :param method: REST method to use (get, post, put, delete)
+        :param path: API path which will be added to the base API path
+        :param headers: dictionary with HTTP headers
+        :param params: additional query string to send along with the request
+        :param data: additional raw data or file object to send along with
+                     the request
+        :param json: additional JSON data to send along with the request
+        :return: response from JSON data or None for an empty response
+        """
+        _, content = await self._request_content(method=method,
+                                                 path=path,
+                                                 headers=headers,
+                                                 params=params,
+                                                 data=data,
+                                                 json=json)
+        if not content.strip():
+            return None
+        return self.codec.loads(content)
+
+    async def _request_content(self,
+                               method: str,
+                               path: str,
+                               headers: dict,
+                               params: Optional[dict],
+                               data: Optional[Union[bytes, BinaryIO]],
+                               json: Optional[dict]
+                               ) -> tuple['aiohttp.ClientResponse', bytes]:
+        """
+        Send a raw REST request to Zendesk, reading the whole body
+
+        :param method: REST method to use (get, post, put, delete)
+        :param path: API path which will be added to the base API path
+        :param headers: dictionary with HTTP headers
+        :param params: additional query string to send along with the request
+        :param data: additional raw data or file object to send along with
+                     the request
+        :param json: additional JSON data to send along with the request
+        :return: tuple with the raw aiohttp response and its body
+        """
+        logging_path = path.replace('\n', '\\n')
+        logging.debug(f'Executing {method} request '
+                      f'for url {self.website}/api/v2/{logging_path}')
+        if json is not None:
+            # Encode the JSON data using the codec instead of aiohttp
+            data = self.codec.dumps(json)
+            headers = {**headers, 'Content-Type': 'application/json'}
+        # Save the file position to send the same data again on retries,
+        # the file objects which cannot be rewound are sent only once
+        data_position = None
+        repeatable = True
+        if hasattr(data, 'read'):
+            if data.seekable():
+                data_position = data.tell()
+            else:
+                repeatable = False
+        info = self._notify_before_request(
+            method=method,
+            url=f'{self.website}/api/v2/{path}',
+            data=data)
+        failures = 0
+        throttled = 0
+        while True:
+            if data_position is not None:
+                data.seek(data_position)
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve()
+                if delay > 0:
+                    logging.debug(f'Waiting {delay:.3f} seconds '
+                                  f'for the rate limit')
+                    await asyncio.sleep(delay)
+            try:
+                async with self.get_semaphore():
+                    async with self.get_session().request(
+                            method=method,
+                            url=f'{self.website}/api/v2/{path}',
+                            auth=self._auth,
+                            headers=headers,
+                            params=params,
+                            data=(UnclosedFile(file=data)
+                                  if hasattr(data, 'read')
+                                  else data)) as req:
+                        # Read the whole body before releasing the connection
+                        content = await req.read()
+            except Exception as error:
+                failures += 1
+                if (not repeatable or
+                        self.retry_policy is None or
+                        not self.retry_policy.should_retry(
+                            method=method,
+                            attempt=failures,
+                            exception=error)):
+                    self._notify_after_request(
+                        info=info,
+                        retries=failures + throttled - 1,
+                        response=None,
+                        size=None,
+                        error=error)
+                    raise
+                delay = self.retry_policy.get_delay(attempt=failures)
+                logging.debug(f'Repeating {method} request after {error!r} '
+                              f'in {delay:.3f} seconds')
+                await asyncio.sleep(delay)
+                continue
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(status=req.status,
+                                         headers=req.headers)
+                if (repeatable and
+                        req.status == 429 and
+                        throttled < self.rate_limiter.max_retries):
+                    # Throttled request, repeat it after the rate limit delay
+                    throttled += 1
+                    continue
+            if (repeatable and
+                    self.retry_policy is not None and
+                    self.retry_policy.should_retry(
+                        method=method,
+                        attempt=failures + 1,
+                        status=req.status)):
+                failures += 1
+                delay = self.retry_policy.get_delay(
+                    attempt=failures,
+                    retry_after=RateLimiter.get_retry_after(
+                        headers=req.headers))
+                logging.debug(f'Repeating {method} request after status '
+                              f'{req.status} in {delay:.3f} seconds')
+                await asyncio.sleep(delay)
+                continue
+            break
+        self._notify_after_request(info=info,
+                                   retries=failures + throttled,
+                                   response=req,
+                                   size=len(content),
+                                   error=None)
+        return req, content
+
+    def _notify_before_request(self,
+                               method: str,
+                               url: str,
+                               data: Optional[Union[bytes, BinaryIO]]
+                               ) -> Optional[RequestInfo]:
+        """
+        Notify the observers before sending a request
+
+        :param method: REST method used
+        :param url: absolute URL of the request
+        :param data: raw data or file object to send along with the request
+        :return: request details or None without observers
+        """
+        if not self.observers:
+            return None
+        if data is None:
+            size = 0
+        elif isinstance(data, (bytes, bytearray)):
+            size = len(data)
+        elif data.seekable():
+            position = data.tell()
+            size = data.seek(0, io.SEEK_END) - position
+            data.seek(position)
+        else:
+            size = None
+        info = RequestInfo(
+            method=method,
+            url=url,
+            endpoint=RequestInfo.get_endpoint(website=self.website,
+                                              url=url),
+            bytes_sent=size)
+        for observer in self.observers:
+            observer.before_request(info=info)
+        return info
+
+    def _notify_after_request(self,
+                              info: Optional[RequestInfo],
+                              retries: int,
+                              response: Optional['aiohttp.ClientResponse'],
+                              size: Optional[int],
+                              error: Optional[Exception]) -> None:
+        """
+        Notify the observers after the request was completed or failed
+
+        :param info: request details or None without observers
+        :param retries: number of repeated attempts
+        :param response: response received or None after an error
+        :param size: size of the response data or None after an error
+        :param error: exception raised or None
+        :return: None
+        """
+        if info is None:
+            return
+        info.duration = time.monotonic() - info.started
+        info.retries = retries
+        info.error = error
+        if response is not None:
+            info.set_response(status=response.status,
+                              headers=response.headers,
+                              size=size)
+        for observer in self.observers:
+            observer.after_request(info=info)
+
+    async def request(self,
+                      method: str,
+                      path: str,
+                      json: Optional[dict]) -> dict:
+        """
+        Send a JSON REST request to Zendesk
+
+        :param method: REST method to use (get, post, put, delete)
+        :param path: API path which will be added to the base API path
+        :param json: additional JSON data to send along with the request
+        :return: response from JSON data
+        """
+        return await self.request_json(
+            method=method,
+            path=path,
+            headers={'Content-Type': 'application/json'},
+            params=None,
+            data=None,
+            json=json)
+
+    async def request_delete(self,
+                             path: str) -> dict:
+        """
+        Send a DELETE REST request to Zendesk
+
+        :param path: API path which will be added to the base API path
+        :return: response from JSON data
+        """
+        return await self.request(method='delete', path=path, json=None)
+
+    async def request_get(self,
+                          path: str) -> dict:
+        """
+        Send a GET REST request to Zendesk
+
+        :param path: API path which will be added to the base API path
+        :return: response from JSON data
+        """
+        return await self.request(method='get', path=path, json=None)
+
+    async def request_post(self,
+                           path: str,
+                           json: dict) -> dict:
+        """
+        Send a POST REST request to Zendesk
+
+        :param path: API path which will be added to the base API path
+        :param json: additional JSON data to send along with the request
+        :return: response from JSON data
+        """
+        return await self.request(method='post', path=path, json=json)
+
+    async def request_put(self,
+                          path: str,
+                          json: dict) -> dict:
+        """
+        Send a PUT REST request to Zendesk
+
+        :param path: API path which will be added to the base API path
+        :param json: additional JSON data to send along with the request
+        :return: response from JSON data
+        """
+        return await self.request(method='put', path=path, json=json)
+
+    async def paginate(self,
+                       request_page: Callable[[int], Awaitable[dict]]
+                       ) -> AsyncIterator[dict]:
+        """
+        Get all the pages for a paginated request by page number.
+        The pagination stops after the last page or after the first error.
+
+        :param request_page: coroutine function to get the page with the
+                             passed number
+        :return: asynchronous iterator over the pages results
+        """
+        current_page = 0
+        next_page_url = 'initial value'
+        while next_page_url:
+            current_page += 1
+            page_results = await request_page(current_page)
+            yield page_results
+            if 'error' not in page_results:
+                # Continue processing the next page
+                next_page_url = page_results['next_page']
+            else:
+                # Stop search if any error occurred
+                next_page_url = None
+
+    async def paginate_cursor(self,
+                              request_page: Callable[[Optional[str]],
+                                                     Awaitable[dict]],
+                              after_cursor: Optional[str] = None
+                              ) -> AsyncIterator[dict]:
+        """
+        Get all the pages for a paginated request by cursor.
+        The pagination stops after the last page or after the first error.
+
+        :param request_page: coroutine function to get the page after the
+                             passed cursor
+        :param after_cursor: cursor to start from or None for the first page
+        :return: asynchronous iterator over the pages results
+        """
+        next_token = 'initial value'
+        while next_token:
+            page_results = await request_page(after_cursor)
+            yield page_results
+            if ('error' not in page_results and
+                    page_results['meta']['has_more']):
+                # Continue processing the next page
+                next_token = page_results['meta']['after_cursor']
+                after_cursor = next_token
+            else:
+                # Stop search if any error occurred
+                next_token = None
+
+    async def merge_pages(self,
+                          pages: AsyncIterator[dict],
+                          key: str) -> dict:
+        """
+        Merge the results for many pages into a single dictionary
+
+        :param pages: asynchronous iterator over the pages results
+        :param key: results key containing the records
+        :return: dictionary with the merged results
+        """
+        results = {}
+        async for page_results in pages:
+            if not results:
+                # First page of results
+                results = page_results
+            elif 'error' in page_results:
+                # Too many results, search interrupted server side
+                results['error'] = page_results['error']
+                results['description'] = page_results['description']
+            else:
+                # Append results
+                results[key].extend(page_results[key])
+        return results
+
+    async def iter_records(self,
+                           pages: AsyncIterator[dict],
+                           key: str) -> AsyncIterator[dict]:
+        """
+        Get the records for many pages one at a time
+
+        :param pages: asynchronous iterator over the pages results
+        :param key: results key containing the records
+        :return: asynchronous iterator over the records
+        :raise ApiError: if any page returned an error
+        """
+        async for page_results in pages:
+            if 'error' in page_results:
+                raise ApiError(results=page_results)
+            for record in page_results[key]:
+                yield record
@@ -0,0 +1,91 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import asyncio
+import os
+from typing import Optional
+
+from .api import ApiError
+from .async_api import AsyncApi
+from .attachments import AttachmentData, Attachments
+
+
+class AsyncAttachments(AsyncApi):
+    async def upload(self,
+                     content_type: Optional[str],
+                     filename: Optional[str],
+                     data: AttachmentData) -> dict:
+        """
+        Upload an attachment using the specified content type.
+        Files are sent in chunks while they are read, without loading
+        the whole file in memory.
+        The file objects which cannot be rewound, like the pipes, are sent
+        only once, without repeating the failed uploads.
+
+        :param content_type: HTTP content_type or None to detect it from
+                             the filename
+        :param filename: filename for the uploaded file or None to use the
+                         name of the file
+        :param data: raw data, path of the file or binary file object
+                     to upload
+        :return: upload JSON results
+        """
+        if isinstance(data, (str, os.PathLike)):
+            with open(data, 'rb') as file:
+                return await self.upload(content_type=content_type,
+                                         filename=filename,
+                                         data=file)
+        if filename is None:
+            name = getattr(data, 'name', None)
+            filename = (os.path.basename(name)
+                        if isinstance(name, str)
+                        else 'attachment')
+        if content_type is None:
+            content_type = Attachments.get_content_type(filename=filename)
+        return await self.request_json(
+            method='post',
+            path='uploads.json',
+            headers={'Content-Type': content_type},
+            params={'filename': filename},
+            data=data,
+            json=None)
+
+    async def upload_many(self,
+                          attachments: list[AttachmentData]) -> list[str]:
+        """
+        Upload many attachments concurrently, detecting the filename and
+        the content type for each of them
+
+        :param attachments: list of paths of the files or binary file
+                            objects to upload
+        :return: list of upload tokens in the same order of the attachments
+        :raise ApiError: if any upload returned an error
+        """
+        results = await asyncio.gather(
+            *(self.upload(content_type=None,
+                          filename=None,
+                          data=data)
+              for data in attachments))
+        tokens = []
+        for upload_results in results:
+            if 'error' in upload_results:
+                raise ApiError(results=upload_results)
+            tokens.append(upload_results['upload']['token'])
+        return tokens
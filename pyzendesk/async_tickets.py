@@ -0,0 +1,326 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+from typing import AsyncIterator, Optional
+
+from .async_api import AsyncApi
+
+
+class AsyncTickets(AsyncApi):
+    async def get(self, ticket_id: int) -> dict:
+        """
+        Get a ticket details
+
+        :param ticket_id: ticket ID to get data from
+        :return: dictionary with the ticket details
+        """
+        return await self.request_get(path=f'tickets/{ticket_id}.json')
+
+    async def get_comments(self, ticket_id: int) -> dict:
+        """
+        Get a ticket comments
+
+        :param ticket_id: ticket ID to get data from
+        :return: dictionary with the ticket details
+        """
+        return await self.request_get(
+            path=f'tickets/{ticket_id}/comments.json')
+
+    async def get_comments_all(self, ticket_id: int) -> dict:
+        """
+        Get all ticket comments
+
+        :param ticket_id: ticket ID to get data from
+        :return: dictionary with the ticket details
+        """
+        return await self.merge_pages(
+            pages=self.get_comments_pages(ticket_id=ticket_id),
+            key='comments')
+
+    def get_comments_pages(self, ticket_id: int) -> AsyncIterator[dict]:
+        """
+        Get all ticket comments pages
+
+        :param ticket_id: ticket ID to get data from
+        :return: asynchronous iterator over the comments pages
+        """
+        return self.paginate(
+            request_page=lambda page: self.request_get(
+                path=f'tickets/{ticket_id}/comments.json?page={page}'))
+
+    def iter_comments_all(self, ticket_id: int) -> AsyncIterator[dict]:
+        """
+        Get all ticket comments one at a time, as soon as each page arrives
+
+        :param ticket_id: ticket ID to get data from
+        :return: asynchronous iterator over the ticket comments
+        :raise ApiError: if any page returned an error
+        """
+        return self.iter_records(
+            pages=self.get_comments_pages(ticket_id=ticket_id),
+            key='comments')
+
+    async def count(self, criteria_list: list) -> Optional[int]:
+        """
+        Get the number of tickets matching the specified criterias
+
+        :param criteria_list: list of string criterias
+        :return: number of tickets found
+        """
+        criteria = ' '.join(criteria_list)
+        results = await self.request_get(
+            path=f'search/count?query=type:ticket {criteria}')
+        return results.get('count')
+
+    async def search(self, criteria_list: list) -> dict:
+        """
+        Get the tickets matching the specified criterias
+
+        :param criteria_list: list of string criterias
+        :return: dictionary with tickets details found
+        """
+        criteria = ' '.join(criteria_list)
+        return await self.request_get(
+            path=f'search?query=type:ticket {criteria}')
+
+    async def search_all(self, criteria_list: list) -> dict:
+        """
+        Get the tickets matching the specified criterias processing all the
+        results by requesting also the next pages
+
+        :param criteria_list: list of string criterias
+        :return: dictionary with tickets details found
+        """
+        return await self.merge_pages(
+            pages=self.search_pages(criteria_list=criteria_list),
+            key='results')
+
+    def search_pages(self, criteria_list: list) -> AsyncIterator[dict]:
+        """
+        Get the tickets pages matching the specified criterias
+
+        :param criteria_list: list of string criterias
+        :return: asynchronous iterator over the tickets pages
+        """
+        return self.paginate(
+            request_page=lambda page: self.search(
+                criteria_list=[*criteria_list, f'&page={page}']))
+
+    def iter_search_all(self, criteria_list: list) -> AsyncIterator[dict]:
+        """
+        Get the tickets matching the specified criterias one at a time,
+        as soon as each page arrives
+
+        :param criteria_list: list of string criterias
+        :return: asynchronous iterator over the tickets found
+        :raise ApiError: if any page returned an error
+        """
+        return self.iter_records(
+            pages=self.search_pages(criteria_list=criteria_list),
+            key='results')
+
+    async def search_export(self, criteria_list: list) -> dict:
+        """
+        Get the tickets matching the specified criterias
+        using the search export API
+
+        :param criteria_list: list of string criterias
+        :return: dictionary with tickets details found
+        """
+        criteria = ' '.join(criteria_list)
+        return await self.request_get(
+            path=f'search/export?filter[type]=ticket&query={criteria}')
+
+    async def search_export_all(self, criteria_list: list) -> dict:
+        """
+        Get the tickets matching the specified criterias processing all the
+        results by requesting also the next pages using the search export API
+
+        :param criteria_list: list of string criterias
+        :return: dictionary with tickets details found
+        """
+        return await self.merge_pages(
+            pages=self.search_export_pages(criteria_list=criteria_list),
+            key='results')
+
+    def search_export_pages(self,
+                            criteria_list: list,
+                            after_cursor: Optional[str] = None
+                            ) -> AsyncIterator[dict]:
+        """
+        Get the tickets pages matching the specified criterias
+        using the search export API
+
+        :param criteria_list: list of string criterias
+        :param after_cursor: cursor to start from or None for the first page
+        :return: asynchronous iterator over the tickets pages
+        """
+        return self.paginate_cursor(
+            request_page=lambda cursor: self.search_export(
+                criteria_list=(criteria_list
+                               if cursor is None
+                               else [*criteria_list,
+                                     f'&page[after]={cursor}'])),
+            after_cursor=after_cursor)
+
+    def iter_search_export_all(self,
+                               criteria_list: list) -> AsyncIterator[dict]:
+        """
+        Get the tickets matching the specified criterias one at a time
+        using the search export API, as soon as each page arrives
+
+        :param criteria_list: list of string criterias
+        :return: asynchronous iterator over the tickets found
+        :raise ApiError: if any page returned an error
+        """
+        return self.iter_records(
+            pages=self.search_export_pages(criteria_list=criteria_list),
+            key='results')
+
+    async def add_comment(self,
+                          ticket_id: int,
+                          public: bool,
+                          text: str,
+                          attachments: Optional[list[str]],
+                          status: str = None) -> dict:
+        """
+        Add a public comment to a ticket
+
+        :param ticket_id: ticket ID to update
+        :param public: boolean value to make the comment public
+        :param text: text to add to the ticket
+        :param attachments: list of tokens for attached files
+        :param status: new status after the saving the comment
+        :return: updated ticket details
+        """
+        ticket_data = {
+            'ticket': {
+                'comment': {
+                    'public': public,
+                    'body': text,
+                    'uploads': attachments
+                }
+            }
+        }
+        if status is not None:
+            ticket_data['ticket']['status'] = status
+        return await self.request_put(path=f'tickets/{ticket_id}.json',
+                                      json=ticket_data)
+
+    async def add_private_comment(self,
+                                  ticket_id: int,
+                                  text: str,
+                                  attachments: Optional[list[str]],
+                                  status: str = None) -> dict:
+        """
+        Add a private comment to a ticket
+
+        :param ticket_id: ticket ID to update
+        :param text: text to add to the ticket
+        :param attachments: list of tokens for attached files
+        :param status: new status after the saving the comment
+        :return: updated ticket details
+        """
+        return await self.add_comment(ticket_id=ticket_id,
+                                      public=False,
+                                      text=text,
+                                      attachments=attachments,
+                                      status=status)
+
+    async def add_public_comment(self,
+                                 ticket_id: int,
+                                 text: str,
+                                 attachments: Optional[list[str]],
+                                 status: str = None) -> dict:
+        """
+        Add a public comment to a ticket
+
+        :param ticket_id: ticket ID to update
+        :param text: text to add to the ticket
+        :param attachments: list of tokens for attached files
+        :param status: new status after the saving the comment
+        :return: updated ticket details
+        """
+        return await self.add_comment(ticket_id=ticket_id,
+                                      public=True,
+                                      text=text,
+                                      attachments=attachments,
+                                      status=status)
+
+    async def set_status(self, ticket_id: int, status: str) -> dict:
+        """
+        Update ticket status
+
+        :param ticket_id: ticket ID to update
+        :param status: new ticket status
+        :return: updated ticket details
+        """
+        return await self.request_put(path=f'tickets/{ticket_id}.json',
+                                      json={
+                                          'ticket': {
+                                              'status': status
+                                          }
+                                      })
+
+    async def update_custom_fields(self,
+                                   ticket_id: int,
+                                   fields: dict) -> dict:
+        """
+        Update custom fields for a ticket
+
+        :param ticket_id: ticket ID to update
+        :param fields: dictionary object with key as field ID
+        :return: updated ticket details
+        """
+        data = [{'id': key, 'value': value}
+                for key, value in fields.items()]
+        return await self.request_put(path=f'tickets/{ticket_id}.json',
+                                      json={
+                                          'ticket': {
+                                              'custom_fields': data
+                                          }
+                                      })
+
+    async def get_requester_email(self, ticket: dict) -> Optional[str]:
+        """
+        Get the sender address from a ticket dictionary.
+        In the case the ticket object doesn't contain a valid address try to
+        process a new Zendesk search using a previous ticket followup
+
+        :param ticket: dictionary with ticket body
+        :return: requester email address
+        """
+        try:
+            from_data = ticket['via']['source']['from']
+            if 'address' in from_data:
+                # Requester email address
+                result = from_data['address'].lower()
+            elif 'ticket_id' in from_data:
+                # Missing requester address, check in the referenced ticket
+                search_results = await self.get(
+                    ticket_id=from_data['ticket_id'])
+                from_data = search_results['ticket']['via']['source']['from']
+                result = from_data['address'].lower()
+            else:
+                # Missing fields for email address
+                raise KeyError
+        except KeyError:
+            result = None
+        return result
@@ -0,0 +1,260 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+from typing import AsyncIterator, Optional
+
+from .async_api import AsyncApi
+
+
+class AsyncUsers(AsyncApi):
+    async def me(self) -> dict:
+        """
+        Zendesk requester user information
+
+        :return: user information
+        """
+        return await self.request_get(path='users/me.json')
+
+    async def autocomplete(self, name: str) -> dict:
+        """
+        Get the users with matching name
+
+        :param name: user name to match
+        :return: dictionary with the user details
+        """
+        return await self.request_get(path=f'users/autocomplete?name={name}')
+
+    async def autocomplete_all(self, name: str) -> dict:
+        """
+        Get all the users with matching name
+
+        :param name: user name to match
+        :return: dictionary with the user details
+        """
+        return await self.merge_pages(pages=self.autocomplete_pages(name=name),
+                                      key='users')
+
+    def autocomplete_pages(self, name: str) -> AsyncIterator[dict]:
+        """
+        Get all the users pages with matching name
+
+        :param name: user name to match
+        :return: asynchronous iterator over the users pages
+        """
+        return self.paginate(
+            request_page=lambda page: self.autocomplete(
+                name=f'{name}&page={page}'))
+
+    def iter_autocomplete_all(self, name: str) -> AsyncIterator[dict]:
+        """
+        Get all the users with matching name one at a time,
+        as soon as each page arrives
+
+        :param name: user name to match
+        :return: asynchronous iterator over the users found
+        :raise ApiError: if any page returned an error
+        """
+        return self.iter_records(pages=self.autocomplete_pages(name=name),
+                                 key='users')
+
+    async def get(self, user_id: int) -> dict:
+        """
+        Get a user's details
+
+        :param user_id: user ID to get data from
+        :return: dictionary with the user details
+        """
+        return await self.request_get(path=f'users/{user_id}')
+
+    async def get_many(self, user_ids: list[int]) -> dict:
+        """
+        Get many users' details
+
+        :param user_ids: list of users ID to get data from
+        :return: dictionary with the user details
+        """
+        ids = ','.join(map(str, user_ids))
+        return await self.request_get(path=f'users/show_many?ids={ids}')
+
+    async def get_related(self, user_id: int) -> dict:
+        """
+        Get a user's related details
+
+        :param user_id: user ID to get data from
+        :return: dictionary with the user related details
+        """
+        return await self.request_get(path=f'users/{user_id}/related')
+
+    async def merge(self, user_id: int, user_id_final: int) -> dict:
+        """
+        Merge a user into another
+
+        :param user_id: user ID to get data from
+        :param user_id_final: final user ID to merge data to
+        :return: dictionary with the user related details
+        """
+        return await self.request_put(path=f'users/{user_id}/merge',
+                                      json={'user': {
+                                          'id': user_id_final}})
+
+    async def get_deleted(self, user_id: int) -> dict:
+        """
+        Get a deleted user's details
+
+        :param user_id: user ID to get data from
+        :return: dictionary with the user related details
+        """
+        return await self.request_get(path=f'deleted_users/{user_id}')
+
+    async def list_deleted(self) -> dict:
+        """
+        Get the deleted users list
+
+        :return: dictionary with the deleted users details
+        """
+        return await self.request_get(path='deleted_users')
+
+    async def count(self, criteria_list: list) -> Optional[int]:
+        """
+        Get the number of users matching the specified criterias
+
+        :param criteria_list: list of string criterias
+        :return: number of users found
+        """
+        criteria = ' '.join(criteria_list)
+        results = await self.request_get(
+            path=f'users/search?query={criteria}')
+        return results.get('count')
+
+    async def search(self, criteria_list: list) -> dict:
+        """
+        Get the users matching the specified criterias
+
+        :param criteria_list: list of string criterias
+        :return: dictionary with users details found
+        """
+        criteria = ' '.join(criteria_list)
+        return await self.request_get(
+            path=f'users/search?query={criteria}')
+
+    async def search_all(self, criteria_list: list) -> dict:
+        """
+        Get the users matching the specified criterias processing all the
+        results by requesting also the next pages.
+
+        :param criteria_list: list of string criterias
+        :return: dictionary with users details found
+        """
+        return await self.merge_pages(
+            pages=self.search_pages(criteria_list=criteria_list),
+            key='users')
+
+    def search_pages(self, criteria_list: list) -> AsyncIterator[dict]:
+        """
+        Get the users pages matching the specified criterias
+
+        :param criteria_list: list of string criterias
+        :return: asynchronous iterator over the users pages
+        """
+        return self.paginate(
+            request_page=lambda page: self.search(
+                criteria_list=[*criteria_list, f'&page={page}']))
+
+    def iter_search_all(self, criteria_list: list) -> AsyncIterator[dict]:
+        """
+        Get the users matching the specified criterias one at a time,
+        as soon as each page arrives
+
+        :param criteria_list: list of string criterias
+        :return: asynchronous iterator over the users found
+        :raise ApiError: if any page returned an error
+        """
+        return self.iter_records(
+            pages=self.search_pages(criteria_list=criteria_list),
+            key='users')
+
+    async def create(self, user: dict) -> dict:
+        """
+        Create a new user
+
+        :param user: user details dictionary
+        :return: updated user details
+        """
+        return await self.request_post(path='users',
+                                       json={'user': user})
+
+    async def create_many(self, users: list[dict]) -> dict:
+        """
+        Create many new users
+
+        :param user: user details dictionary
+        :return: updated users details
+        """
+        return await self.request_post(path='users/create_many',
+                                       json={'users': users})
+
+    async def create_or_update(self, user: dict) -> dict:
+        """
+        Create a new user or update an existing user
+
+        :param user: user details dictionary
+        :return: updated user details
+        """
+        return await self.request_post(path='users/create_or_update',
+                                       json={'user': user})
+
+    async def create_or_update_many(self, users: list[dict]) -> dict:
+        """
+        Create many new users or update many existing users
+
+        :param users: user details list of dictionaries
+        :return: updated user details
+        """
+        return await self.request_post(path='users/create_or_update_many',
+                                       json={'users': users})
+
+    async def delete(self, user_id: int) -> dict:
+        """
+        Delete a user
+
+        :param user_id: user ID to delete
+        :return: deleted user details
+        """
+        return await self.request_delete(path=f'users/{user_id}')
+
+    async def purge(self, user_id: int) -> dict:
+        """
+        Permanently delete a deleted user
+
+        :param user_id: user ID to delete permanently
+        :return: deleted user details
+        """
+        return await self.request_delete(path=f'deleted_users/{user_id}')
+
+    async def update(self, user_id: int, user: dict) -> dict:
+        """
+        Updated an existing user
+
+        :param user_id: user ID to update
+        :param user: user details dictionary
+        :return: updated user details
+        """
+        return await self.request_put(path=f'users/{user_id}',
+                                      json={'user': user})
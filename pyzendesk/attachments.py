@@ -18,22 +18,376 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 ##
 
-from .api import Api
+import collections
+import concurrent.futures
+import hashlib
+import logging
+import mimetypes
+import os
+import time
+from typing import BinaryIO, Iterable, Iterator, Optional, Union
+
+import requests
+
+from .api import Api, ApiError
+from .uploadcache import UploadCache
+
+# Attachment data as raw data, file path or binary file object
+AttachmentData = Union[bytes, str, os.PathLike, BinaryIO]
 
 
 class Attachments(Api):
-    def upload(self, content_type: str, filename: str, data: bytes) -> dict:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.upload_cache = None
+
+    def set_upload_cache(self, upload_cache: Optional[UploadCache]) -> None:
+        """
+        Set the cache for the upload tokens, to reuse the token of a
+        previous upload with the same data, filename and content type
+
+        :param upload_cache: upload cache to use or None to disable it
+        :return: None
         """
-        Upload an attachment using the specified content type
+        self.upload_cache = upload_cache
 
-        :param content_type: HTTP content_type
-        :param filename: filename for the uploaded file
-        :param data: raw data to upload
+    def upload(self,
+               content_type: Optional[str],
+               filename: Optional[str],
+               data: AttachmentData) -> dict:
+        """
+        Upload an attachment using the specified content type.
+        Files are sent in chunks while they are read, without loading
+        the whole file in memory.
+        The file objects which cannot be rewound, like the pipes, are sent
+        only once, without repeating the failed uploads.
+        If an upload cache is set, the results of a previous upload with
+        the same data, filename and content type are reused.
+
+        :param content_type: HTTP content_type or None to detect it from
+                             the filename
+        :param filename: filename for the uploaded file or None to use the
+                         name of the file
+        :param data: raw data, path of the file or binary file object
+                     to upload
         :return: upload JSON results
         """
-        return self.request_raw(method='post',
-                                path='uploads.json',
-                                headers={'Content-Type': content_type},
-                                params={'filename': filename},
-                                data=data,
-                                json=None).json()
+        if isinstance(data, (str, os.PathLike)):
+            with open(data, 'rb') as file:
+                return self.upload(content_type=content_type,
+                                   filename=filename,
+                                   data=file)
+        if filename is None:
+            name = getattr(data, 'name', None)
+            filename = (os.path.basename(name)
+                        if isinstance(name, str)
+                        else 'attachment')
+        if content_type is None:
+            content_type = self.get_content_type(filename=filename)
+        key = None
+        if self.upload_cache is not None:
+            digest = self.get_digest(data=data)
+            if digest is not None:
+                key = self.upload_cache.get_key(digest=digest,
+                                                filename=filename,
+                                                content_type=content_type)
+                results = self.upload_cache.get(key=key)
+                if results is not None:
+                    return results
+        req = self.request_raw(method='post',
+                               path='uploads.json',
+                               headers={'Content-Type': content_type},
+                               params={'filename': filename},
+                               data=data,
+                               json=None)
+        results = self.codec.loads(req.content)
+        if key is not None and 'upload' in results:
+            self.upload_cache.set(key=key, results=results)
+        return results
+
+    def upload_many(self,
+                    attachments: list[AttachmentData],
+                    max_workers: int = 4) -> list[str]:
+        """
+        Upload many attachments concurrently, detecting the filename and
+        the content type for each of them
+
+        :param attachments: list of paths of the files or binary file
+                            objects to upload
+        :param max_workers: maximum number of concurrent uploads
+        :return: list of upload tokens in the same order of the attachments
+        :raise ApiError: if any upload returned an error
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda data: self.upload(content_type=None,
+                                         filename=None,
+                                         data=data),
+                attachments))
+        tokens = []
+        for upload_results in results:
+            if 'error' in upload_results:
+                raise ApiError(results=upload_results)
+            tokens.append(upload_results['upload']['token'])
+        return tokens
+
+    def get_attachments(self, records: Iterable[dict]) -> Iterator[dict]:
+        """
+        Get the attachments from many comments or tickets.
+        The comments of each ticket are requested page by page.
+
+        :param records: iterable over the comments, the tickets or the
+                        comments results (like the get_comments_all results)
+        :return: iterator over the attachments
+        :raise ApiError: if any ticket comments request returned an error
+        :raise ValueError: if any record is not a comment or a ticket
+        """
+        for record in records:
+            if 'comments' in record:
+                yield from self.get_attachments(records=record['comments'])
+            elif 'ticket' in record:
+                yield from self.get_attachments(records=[record['ticket']])
+            elif 'attachments' in record:
+                yield from record['attachments'] or []
+            elif 'requester_id' in record:
+                yield from self.get_attachments(
+                    records=self._iter_ticket_comments(
+                        ticket_id=record['id']))
+            else:
+                raise ValueError(f'Record {record.get("id")} is not '
+                                 f'a comment or a ticket')
+
+    def download(self,
+                 attachment: dict,
+                 directory: str,
+                 chunk_size: int = 65536,
+                 sha256: Optional[str] = None) -> dict:
+        """
+        Download an attachment to a file named with the attachment ID and
+        its filename, writing each chunk as soon as it arrives.
+        The data is written to a temporary .part file, and an interrupted
+        download resumes from the end of the partial file.
+        The size is verified if available in the attachment details.
+
+        :param attachment: dictionary with the attachment details
+        :param directory: path of the directory for the downloaded file
+        :param chunk_size: size of the chunks read from the response
+        :param sha256: expected SHA-256 hex digest or None to skip the check
+        :return: dictionary with the attachment, the downloaded filename,
+                 the success status and the result (size and SHA-256
+                 digest if successful, else error and description)
+        """
+        filename = os.path.join(
+            directory,
+            f'{attachment["id"]}_{os.path.basename(attachment["file_name"])}')
+        try:
+            result = self._download_file(url=attachment['content_url'],
+                                         filename=filename,
+                                         chunk_size=chunk_size)
+        except Exception as error:
+            result = {'error': type(error).__name__,
+                      'description': str(error)}
+        else:
+            expected_size = attachment.get('size')
+            if expected_size is not None and result['size'] != expected_size:
+                result = {'error': 'SizeMismatch',
+                          'description': f'Expected {expected_size} bytes, '
+                                         f'downloaded {result["size"]}'}
+            elif sha256 is not None and result['sha256'] != sha256.lower():
+                result = {'error': 'ChecksumMismatch',
+                          'description': f'Expected SHA-256 {sha256}, '
+                                         f'downloaded {result["sha256"]}'}
+            if 'error' in result:
+                os.remove(filename)
+        return {'attachment': attachment,
+                'filename': filename,
+                'success': 'error' not in result,
+                'result': result}
+
+    def iter_download_many(self,
+                           records: Iterable[dict],
+                           directory: str,
+                           max_workers: int = 4,
+                           chunk_size: int = 65536,
+                           checksums: Optional[dict[int, str]] = None
+                           ) -> Iterator[dict]:
+        """
+        Download the attachments of many comments or tickets concurrently,
+        yielding the results in the same order of the attachments.
+        The attachments already downloaded are skipped and the partial
+        downloads are resumed.
+
+        :param records: iterable over the comments, the tickets or the
+                        comments results (like the get_comments_all results)
+        :param directory: path of the directory for the downloaded files
+        :param max_workers: maximum number of concurrent downloads
+        :param chunk_size: size of the chunks read from the responses
+        :param checksums: dictionary with the expected SHA-256 hex digest
+                          for each attachment ID or None
+        :return: iterator over the dictionaries with the download results
+        """
+        os.makedirs(directory, exist_ok=True)
+        checksums = checksums or {}
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers) as executor:
+            # Limit the pending downloads to the ones being processed
+            futures = collections.deque()
+            for attachment in self.get_attachments(records=records):
+                futures.append(executor.submit(
+                    self.download,
+                    attachment=attachment,
+                    directory=directory,
+                    chunk_size=chunk_size,
+                    sha256=checksums.get(attachment['id'])))
+                if len(futures) >= max_workers * 2:
+                    yield futures.popleft().result()
+            while futures:
+                yield futures.popleft().result()
+
+    def download_many(self,
+                      records: Iterable[dict],
+                      directory: str,
+                      max_workers: int = 4,
+                      chunk_size: int = 65536,
+                      checksums: Optional[dict[int, str]] = None
+                      ) -> list[dict]:
+        """
+        Download the attachments of many comments or tickets concurrently
+
+        :param records: iterable over the comments, the tickets or the
+                        comments results (like the get_comments_all results)
+        :param directory: path of the directory for the downloaded files
+        :param max_workers: maximum number of concurrent downloads
+        :param chunk_size: size of the chunks read from the responses
+        :param checksums: dictionary with the expected SHA-256 hex digest
+                          for each attachment ID or None
+        :return: list of dictionaries with the download results
+        """
+        return list(self.iter_download_many(records=records,
+                                            directory=directory,
+                                            max_workers=max_workers,
+                                            chunk_size=chunk_size,
+                                            checksums=checksums))
+
+    def _iter_ticket_comments(self, ticket_id: int) -> Iterator[dict]:
+        """
+        Get all the comments of a ticket one at a time
+
+        :param ticket_id: ticket ID to get data from
+        :return: iterator over the ticket comments
+        :raise ApiError: if any page returned an error
+        """
+        return self.iter_records(
+            pages=self.paginate(
+                request_page=lambda page: self.request_get(
+                    path=f'tickets/{ticket_id}/comments.json?page={page}')),
+            key='comments')
+
+    def _download_file(self,
+                       url: str,
+                       filename: str,
+                       chunk_size: int) -> dict:
+        """
+        Download a file using a temporary .part file, resuming the partial
+        download and repeating the request after a transient error
+
+        :param url: absolute URL of the file
+        :param filename: path of the destination file
+        :param chunk_size: size of the chunks read from the response
+        :return: dictionary with the size and the SHA-256 hex digest
+        :raise requests.HTTPError: if the server returned an error
+        """
+        if os.path.exists(filename):
+            # Already downloaded
+            with open(filename, 'rb') as file:
+                return self._get_file_details(file=file)
+        partial_filename = f'{filename}.part'
+        failures = 0
+        while True:
+            offset = (os.path.getsize(partial_filename)
+                      if os.path.exists(partial_filename)
+                      else 0)
+            req = self.request_url(
+                method='get',
+                url=url,
+                headers={'Range': f'bytes={offset}-'} if offset else {},
+                params=None,
+                data=None,
+                json=None,
+                stream=True,
+                rate_limited=False)
+            with req:
+                if req.status_code == 416 and offset:
+                    # Range not satisfiable, the partial file is complete
+                    break
+                req.raise_for_status()
+                try:
+                    with open(partial_filename,
+                              'ab' if req.status_code == 206 else 'wb'
+                              ) as file:
+                        for chunk in req.iter_content(chunk_size=chunk_size):
+                            file.write(chunk)
+                    break
+                except requests.RequestException as error:
+                    failures += 1
+                    if (self.retry_policy is None or
+                            not self.retry_policy.should_retry(
+                                method='get',
+                                attempt=failures,
+                                exception=error)):
+                        raise
+                    delay = self.retry_policy.get_delay(attempt=failures)
+                    logging.debug(f'Resuming download after {error!r} '
+                                  f'in {delay:.3f} seconds')
+                    time.sleep(delay)
+        with open(partial_filename, 'rb') as file:
+            details = self._get_file_details(file=file)
+        os.replace(partial_filename, filename)
+        return details
+
+    def _get_file_details(self, file: BinaryIO) -> dict:
+        """
+        Get the size and the SHA-256 digest for a file
+
+        :param file: binary file object
+        :return: dictionary with the size and the SHA-256 hex digest
+        """
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in iter(lambda: file.read(65536), b''):
+            digest.update(chunk)
+            size += len(chunk)
+        return {'size': size,
+                'sha256': digest.hexdigest()}
+
+    def get_digest(self, data: Union[bytes, BinaryIO]) -> Optional[str]:
+        """
+        Get the SHA-256 digest for the data to upload, reading the file
+        objects in chunks and restoring their position
+
+        :param data: raw data or binary file object
+        :return: hex digest or None for the not seekable file objects
+        """
+        if isinstance(data, (bytes, bytearray)):
+            return hashlib.sha256(data).hexdigest()
+        if not data.seekable():
+            return None
+        position = data.tell()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: data.read(65536), b''):
+            digest.update(chunk)
+        data.seek(position)
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_content_type(filename: str) -> str:
+        """
+        Get the content type for a filename
+
+        :param filename: filename to check
+        :return: content type detected from the file extension or
+                 application/octet-stream if unknown
+        """
+        return (mimetypes.guess_type(filename)[0] or
+                'application/octet-stream')
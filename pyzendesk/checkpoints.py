@@ -0,0 +1,123 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import json
+import os
+import threading
+from typing import Optional
+
+
+class CheckpointStore(object):
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a saved checkpoint
+
+        :param key: checkpoint name
+        :return: saved checkpoint value or None if missing
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Save a checkpoint
+
+        :param key: checkpoint name
+        :param value: checkpoint value
+        :return: None
+        """
+        raise NotImplementedError
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    def __init__(self):
+        """
+        Checkpoints store kept in memory
+        """
+        self._checkpoints = {}
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a saved checkpoint
+
+        :param key: checkpoint name
+        :return: saved checkpoint value or None if missing
+        """
+        return self._checkpoints.get(key)
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Save a checkpoint
+
+        :param key: checkpoint name
+        :param value: checkpoint value
+        :return: None
+        """
+        self._checkpoints[key] = value
+
+
+class FileCheckpointStore(CheckpointStore):
+    def __init__(self, filename: str):
+        """
+        Checkpoints store saved in a JSON file
+
+        :param filename: path of the JSON file containing the checkpoints
+        """
+        self.filename = filename
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        """
+        Load all the checkpoints from the file
+
+        :return: dictionary with all the checkpoints
+        """
+        try:
+            with open(self.filename, 'r') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a saved checkpoint
+
+        :param key: checkpoint name
+        :return: saved checkpoint value or None if missing
+        """
+        with self._lock:
+            return self._load().get(key)
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Save a checkpoint, replacing the file atomically
+
+        :param key: checkpoint name
+        :param value: checkpoint value
+        :return: None
+        """
+        with self._lock:
+            checkpoints = self._load()
+            checkpoints[key] = value
+            temporary_filename = f'{self.filename}.tmp'
+            with open(temporary_filename, 'w') as file:
+                json.dump(checkpoints, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary_filename, self.filename)
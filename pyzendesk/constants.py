@@ -29,3 +29,8 @@ APP_COPYRIGHT = f'Copyright 2021-2025 {APP_AUTHOR}'
 URL_AUTHOR = 'http://www.muflone.com/'
 URL_APPLICATION = f'{URL_AUTHOR}{APP_DOMAIN}/'
 URL_SOURCES = f'https://github.com/muflone/{APP_DOMAIN}/'
+
+# Maximum number of IDs accepted by the show many requests
+SHOW_MANY_MAX_IDS = 100
+# Maximum number of remembered requester addresses for referenced tickets
+REFERENCED_EMAILS_MAX_ENTRIES = 10000
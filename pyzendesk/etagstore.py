@@ -0,0 +1,164 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import collections
+import hashlib
+import json
+import os
+import threading
+from typing import Optional
+
+# Validators and content of a stored response:
+# (ETag, Last-Modified, response content)
+StoredResponse = tuple[Optional[str], Optional[str], bytes]
+
+
+class EtagStore(object):
+    def get(self, path: str) -> Optional[StoredResponse]:
+        """
+        Get a stored response
+
+        :param path: API path
+        :return: tuple with ETag, Last-Modified and content or None
+        """
+        raise NotImplementedError
+
+    def set(self,
+            path: str,
+            etag: Optional[str],
+            last_modified: Optional[str],
+            content: bytes) -> None:
+        """
+        Store a response with its validators
+
+        :param path: API path
+        :param etag: ETag header value
+        :param last_modified: Last-Modified header value
+        :param content: response content
+        :return: None
+        """
+        raise NotImplementedError
+
+
+class MemoryEtagStore(EtagStore):
+    def __init__(self, max_entries: int = 1024):
+        """
+        Store for the responses validators kept in memory
+
+        :param max_entries: maximum number of stored responses
+        """
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> Optional[StoredResponse]:
+        """
+        Get a stored response
+
+        :param path: API path
+        :return: tuple with ETag, Last-Modified and content or None
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                self._entries.move_to_end(path)
+            return entry
+
+    def set(self,
+            path: str,
+            etag: Optional[str],
+            last_modified: Optional[str],
+            content: bytes) -> None:
+        """
+        Store a response with its validators
+
+        :param path: API path
+        :param etag: ETag header value
+        :param last_modified: Last-Modified header value
+        :param content: response content
+        :return: None
+        """
+        with self._lock:
+            self._entries[path] = (etag, last_modified, content)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DirectoryEtagStore(EtagStore):
+    def __init__(self, directory: str):
+        """
+        Store for the responses validators saved in a directory
+
+        :param directory: path of the directory containing the responses
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def get_filename(self, path: str) -> str:
+        """
+        Get the file name used to save the response for an API path
+
+        :param path: API path
+        :return: file path for the stored response
+        """
+        return os.path.join(self.directory,
+                            hashlib.sha256(path.encode('utf-8')).hexdigest())
+
+    def get(self, path: str) -> Optional[StoredResponse]:
+        """
+        Get a stored response
+
+        :param path: API path
+        :return: tuple with ETag, Last-Modified and content or None
+        """
+        try:
+            with open(self.get_filename(path=path), 'rb') as file:
+                # The first line contains the validators
+                validators = json.loads(file.readline())
+                content = file.read()
+        except (FileNotFoundError, ValueError):
+            return None
+        return validators['etag'], validators['last_modified'], content
+
+    def set(self,
+            path: str,
+            etag: Optional[str],
+            last_modified: Optional[str],
+            content: bytes) -> None:
+        """
+        Store a response with its validators, replacing the file atomically
+
+        :param path: API path
+        :param etag: ETag header value
+        :param last_modified: Last-Modified header value
+        :param content: response content
+        :return: None
+        """
+        filename = self.get_filename(path=path)
+        temporary_filename = (f'{filename}.{os.getpid()}.'
+                              f'{threading.get_ident()}.tmp')
+        with open(temporary_filename, 'wb') as file:
+            file.write(json.dumps({'etag': etag,
+                                   'last_modified': last_modified}
+                                  ).encode('utf-8'))
+            file.write(b'\n')
+            file.write(content)
+        os.replace(temporary_filename, filename)
@@ -0,0 +1,271 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import csv
+import gzip
+import io
+import json
+import os
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from .api import ApiError
+from .checkpoints import CheckpointStore
+
+
+class Exporter(object):
+    def __init__(self,
+                 filename: str,
+                 columns: Optional[list[str]] = None,
+                 compress: bool = False,
+                 checkpoint_store: Optional[CheckpointStore] = None,
+                 checkpoint_key: Optional[str] = None):
+        """
+        Export the records to a file as soon as each page arrives.
+        The records are written to a temporary .part file which replaces
+        the destination file only when the export is complete.
+        When a checkpoint store is passed, the cursor and the file offset
+        are saved after every written page and an interrupted export
+        resumes from the last written page.
+
+        :param filename: path of the destination file
+        :param columns: list of the record keys to export or None for all
+        :param compress: compress the file using gzip
+        :param checkpoint_store: store to load and save the export state
+                                 or None to always start a new export
+        :param checkpoint_key: checkpoint name used to save the export state
+                               or None to use the filename
+        """
+        self.filename = filename
+        self.columns = columns
+        self.compress = compress
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_key = checkpoint_key or filename
+
+    def encode_header(self) -> bytes:
+        """
+        Encode the file header written before the records
+
+        :return: header data
+        """
+        return b''
+
+    def encode_records(self, records: list[dict]) -> bytes:
+        """
+        Encode the records for a page
+
+        :param records: list of records to encode
+        :return: encoded data
+        """
+        raise NotImplementedError
+
+    def get_values(self, record: dict) -> dict:
+        """
+        Get the record values for the exported columns
+
+        :param record: dictionary with the record details
+        :return: dictionary with the projected record
+        """
+        if self.columns is None:
+            return record
+        return {column: record.get(column) for column in self.columns}
+
+    def export(self,
+               request_pages: Callable[[Optional[str]], Iterator[dict]],
+               key: str,
+               get_cursor: Callable[[dict], Optional[str]]) -> int:
+        """
+        Export all the records for many pages, resuming the export from
+        the saved cursor
+
+        :param request_pages: function to get the pages after the passed
+                              cursor or from the first page for None
+        :param key: results key containing the records
+        :param get_cursor: function to get the cursor of the next page from
+                           the page results or None after the last page
+        :return: number of records written by the whole export, including
+                 the records written before resuming it
+        :raise ApiError: if any page returned an error
+        """
+        partial_filename = f'{self.filename}.part'
+        state = self._load_state()
+        if state and os.path.exists(partial_filename):
+            # Resume the export discarding any data after the last page
+            file = open(partial_filename, 'r+b')
+            file.truncate(state['offset'])
+            file.seek(state['offset'])
+        else:
+            state = None
+            file = open(partial_filename, 'wb')
+        # Records written before resuming the export
+        count = state.get('count', 0) if state else 0
+        try:
+            if state is None:
+                self._write_data(file=file, data=self.encode_header())
+            if state is None or state['cursor'] is not None:
+                for page_results in request_pages(
+                        state['cursor'] if state else None):
+                    if 'error' in page_results:
+                        raise ApiError(results=page_results)
+                    records = page_results[key]
+                    self._write_data(file=file,
+                                     data=self.encode_records(records))
+                    count += len(records)
+                    file.flush()
+                    os.fsync(file.fileno())
+                    cursor = get_cursor(page_results)
+                    self._save_state(state={'cursor': cursor,
+                                            'offset': file.tell(),
+                                            'count': count})
+                    if cursor is None:
+                        break
+        finally:
+            file.close()
+        os.replace(partial_filename, self.filename)
+        self._save_state(state=None)
+        return count
+
+    def _write_data(self, file: io.BufferedIOBase, data: bytes) -> None:
+        """
+        Write the data to the file, using a separate gzip member for
+        each write to allow truncating the file after it
+
+        :param file: file object opened in binary mode
+        :param data: data to write
+        :return: None
+        """
+        if not data:
+            return
+        if self.compress:
+            with gzip.GzipFile(filename='',
+                               mode='wb',
+                               fileobj=file,
+                               mtime=0) as member:
+                member.write(data)
+        else:
+            file.write(data)
+
+    def _load_state(self) -> Optional[dict]:
+        """
+        Load the export state from the checkpoint store
+
+        :return: dictionary with cursor, offset and records count or None
+                 if missing
+        """
+        if self.checkpoint_store is None:
+            return None
+        value = self.checkpoint_store.get(key=self.checkpoint_key)
+        return json.loads(value) if value else None
+
+    def _save_state(self, state: Optional[dict]) -> None:
+        """
+        Save the export state to the checkpoint store
+
+        :param state: dictionary with cursor, offset and records count or
+                      None to clear it
+        :return: None
+        """
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.set(
+                key=self.checkpoint_key,
+                value=json.dumps(state) if state is not None else '')
+
+
+class JsonLinesExporter(Exporter):
+    def encode_records(self, records: list[dict]) -> bytes:
+        """
+        Encode the records for a page with a JSON object for each line
+
+        :param records: list of records to encode
+        :return: encoded data
+        """
+        return ''.join(f'{json.dumps(self.get_values(record=record))}\n'
+                       for record in records).encode('utf-8')
+
+
+class CsvExporter(Exporter):
+    def __init__(self,
+                 filename: str,
+                 columns: list[str],
+                 compress: bool = False,
+                 checkpoint_store: Optional[CheckpointStore] = None,
+                 checkpoint_key: Optional[str] = None,
+                 delimiter: str = ','):
+        """
+        Export the records to a CSV file as soon as each page arrives.
+        The nested values are written as JSON data.
+
+        :param filename: path of the destination file
+        :param columns: list of the record keys to export
+        :param compress: compress the file using gzip
+        :param checkpoint_store: store to load and save the export state
+                                 or None to always start a new export
+        :param checkpoint_key: checkpoint name used to save the export state
+                               or None to use the filename
+        :param delimiter: fields delimiter character
+        """
+        super().__init__(filename=filename,
+                         columns=columns,
+                         compress=compress,
+                         checkpoint_store=checkpoint_store,
+                         checkpoint_key=checkpoint_key)
+        self.delimiter = delimiter
+
+    def encode_header(self) -> bytes:
+        """
+        Encode the columns header
+
+        :return: header data
+        """
+        return self._encode_rows(rows=[self.columns])
+
+    def encode_records(self, records: list[dict]) -> bytes:
+        """
+        Encode the records for a page with a CSV row for each record
+
+        :param records: list of records to encode
+        :return: encoded data
+        """
+        return self._encode_rows(
+            rows=([self._get_text(value=record.get(column))
+                   for column in self.columns]
+                  for record in records))
+
+    def _encode_rows(self, rows: Iterable[list]) -> bytes:
+        """
+        Encode many CSV rows
+
+        :param rows: iterable over the list of values for each row
+        :return: encoded data
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=self.delimiter)
+        writer.writerows(rows)
+        return buffer.getvalue().encode('utf-8')
+
+    def _get_text(self, value: Any) -> Any:
+        """
+        Get the CSV value for a record value
+
+        :param value: record value
+        :return: JSON data for nested values or the value itself
+        """
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return value
@@ -0,0 +1,171 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import urllib.parse
+from typing import Iterator, Optional
+
+from .checkpoints import CheckpointStore
+from .exporters import Exporter
+
+
+class IncrementalExportMixin(object):
+    """
+    Cursor based incremental export for the API objects of the exportable
+    resources, like tickets and users, using the Api requests
+    """
+
+    def incremental_export_resource(self,
+                                    resource: str,
+                                    start_time: int = 0,
+                                    cursor: Optional[str] = None) -> dict:
+        """
+        Get the records of a resource changed after a start time or
+        a cursor using the cursor based incremental export API
+
+        :param resource: exported resource (like tickets or users)
+        :param start_time: UNIX time to start from for the first request
+        :param cursor: cursor returned by a previous request or None to use
+                       the start time
+        :return: dictionary with the records details found
+        """
+        return self.request_get(path=self._get_incremental_export_path(
+            resource=resource,
+            start_time=start_time,
+            cursor=cursor))
+
+    def incremental_export_resource_pages(self,
+                                          resource: str,
+                                          start_time: int = 0,
+                                          cursor: Optional[str] = None
+                                          ) -> Iterator[dict]:
+        """
+        Get the pages of a resource changed after a start time or a cursor
+        using the cursor based incremental export API
+
+        :param resource: exported resource (like tickets or users)
+        :param start_time: UNIX time to start from for the first request
+        :param cursor: cursor returned by a previous request or None to use
+                       the start time
+        :return: iterator over the pages results
+        """
+        return self.paginate_incremental(
+            request_page=lambda after_cursor: self.incremental_export_resource(
+                resource=resource,
+                start_time=start_time,
+                cursor=after_cursor),
+            after_cursor=cursor)
+
+    def iter_incremental_export_resource(
+            self,
+            resource: str,
+            start_time: int = 0,
+            cursor: Optional[str] = None,
+            checkpoint_store: Optional[CheckpointStore] = None,
+            checkpoint_key: Optional[str] = None,
+            stream: bool = False) -> Iterator[dict]:
+        """
+        Get the records of a resource changed after a start time or a cursor
+        one at a time using the cursor based incremental export API.
+        When a checkpoint store is passed, the export resumes from the saved
+        cursor and the cursor is saved after every processed page.
+        When stream is set, each record is decoded as soon as it arrives
+        instead of loading the whole page.
+
+        :param resource: exported resource (like tickets or users)
+        :param start_time: UNIX time to start from if no cursor is available
+        :param cursor: cursor to start from or None to use the saved
+                       checkpoint or the start time
+        :param checkpoint_store: store to load and save the cursor or None
+        :param checkpoint_key: checkpoint name used to save the cursor or
+                               None to use the resource name
+        :param stream: decode the records incrementally from the responses
+        :return: iterator over the records found
+        :raise ApiError: if any page returned an error
+        """
+        if checkpoint_key is None:
+            checkpoint_key = resource
+        if cursor is None and checkpoint_store is not None:
+            cursor = checkpoint_store.get(key=checkpoint_key)
+        if stream:
+            return self.iter_stream_records(
+                request_page=lambda after_cursor: self.request_stream(
+                    method='get',
+                    path=self._get_incremental_export_path(
+                        resource=resource,
+                        start_time=start_time,
+                        cursor=after_cursor),
+                    key=resource),
+                get_cursor=self.get_next_incremental_cursor,
+                cursor=cursor,
+                checkpoint_store=checkpoint_store,
+                checkpoint_key=checkpoint_key)
+        return self.iter_incremental_records(
+            pages=self.incremental_export_resource_pages(
+                resource=resource,
+                start_time=start_time,
+                cursor=cursor),
+            key=resource,
+            checkpoint_store=checkpoint_store,
+            checkpoint_key=checkpoint_key)
+
+    def save_incremental_export_resource(self,
+                                         resource: str,
+                                         exporter: Exporter,
+                                         start_time: int = 0) -> int:
+        """
+        Save the records of a resource changed after a start time to a file
+        using the cursor based incremental export API, writing each page
+        as soon as it arrives.
+        The export resumes from the last written page if the exporter
+        has a checkpoint store.
+
+        :param resource: exported resource (like tickets or users)
+        :param exporter: exporter used to write the records
+        :param start_time: UNIX time to start from
+        :return: number of records written
+        :raise ApiError: if any page returned an error
+        """
+        return exporter.export(
+            request_pages=lambda cursor: (
+                self.incremental_export_resource_pages(
+                    resource=resource,
+                    start_time=start_time,
+                    cursor=cursor)),
+            key=resource,
+            get_cursor=self.get_next_incremental_cursor)
+
+    def _get_incremental_export_path(self,
+                                     resource: str,
+                                     start_time: int,
+                                     cursor: Optional[str]) -> str:
+        """
+        Get the API path for the cursor based incremental export
+
+        :param resource: exported resource (like tickets or users)
+        :param start_time: UNIX time to start from for the first request
+        :param cursor: cursor returned by a previous request or None to use
+                       the start time
+        :return: API path for the incremental export page
+        """
+        if cursor is None:
+            query = f'start_time={start_time}'
+        else:
+            query = f'cursor={urllib.parse.quote(cursor)}'
+        return f'incremental/{resource}/cursor.json?{query}'
@@ -0,0 +1,327 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import collections
+import time
+from typing import Callable, Iterable, Iterator, Optional
+
+from .api import Api, ApiError
+from .constants import SHOW_MANY_MAX_IDS
+
+JOB_STATUS_QUEUED = 'queued'
+JOB_STATUS_WORKING = 'working'
+JOB_STATUS_FAILED = 'failed'
+JOB_STATUS_COMPLETED = 'completed'
+JOB_STATUS_KILLED = 'killed'
+
+
+class JobSubmitError(ApiError):
+    def __init__(self, results: dict, jobs: list['JobStatus']):
+        """
+        Error returned by Zendesk while submitting a job, keeping the jobs
+        already submitted and not returned yet
+
+        :param results: dictionary with the error details
+        :param jobs: list of handles for the jobs already submitted
+        """
+        super().__init__(results=results)
+        self.jobs = jobs
+
+
+class JobStatus(object):
+    def __init__(self, api: Api, status: dict):
+        """
+        Handle for a background job processed by Zendesk
+
+        :param api: API object used to check the job status
+        :param status: dictionary with the job status details
+        """
+        self.api = api
+        self.status = status
+
+    def __repr__(self) -> str:
+        return f'JobStatus(id={self.id!r}, status={self.status["status"]!r})'
+
+    @property
+    def id(self) -> str:
+        """
+        Job ID
+
+        :return: job ID
+        """
+        return self.status['id']
+
+    @property
+    def is_done(self) -> bool:
+        """
+        Check if the job is finished
+
+        :return: True if the job was completed, failed or killed
+        """
+        return self.status['status'] in (JOB_STATUS_COMPLETED,
+                                         JOB_STATUS_FAILED,
+                                         JOB_STATUS_KILLED)
+
+    @property
+    def results(self) -> list[dict]:
+        """
+        Job results for each processed item
+
+        :return: list of dictionaries with the job results
+        """
+        return self.status.get('results') or []
+
+    def get_items_results(self, items: list) -> list[dict]:
+        """
+        Get the results for each item submitted to a finished job.
+        The results are matched by index, by ID for the IDs based jobs or
+        by id, external_id or email for the records based jobs; the items
+        without a matching result are reported as unmatched.
+
+        :param items: list of items or IDs submitted to the job
+        :return: list of dictionaries with the result for each item, in the
+                 same order of the items
+        """
+        results = [{'item': item,
+                    'success': False,
+                    'result': None}
+                   for item in items]
+        # Positions of the items by identifying value
+        positions = {}
+        for position, item in enumerate(items):
+            if isinstance(item, int):
+                positions.setdefault(('id', item), position)
+            elif isinstance(item, dict):
+                for key in ('id', 'external_id', 'email'):
+                    if item.get(key) is not None:
+                        positions.setdefault((key, item[key]), position)
+        for result in self.results:
+            if 'index' in result:
+                index = result['index']
+            else:
+                index = next((positions[(key, result[key])]
+                              for key in ('id', 'external_id', 'email')
+                              if (key, result.get(key)) in positions),
+                             None)
+            if index is not None and 0 <= index < len(items):
+                results[index]['success'] = (
+                    'error' not in result and
+                    result.get('success', True) is not False)
+                results[index]['result'] = result
+        for item_results in results:
+            if item_results['result'] is None:
+                if self.status['status'] != JOB_STATUS_COMPLETED:
+                    # Failed or killed job, report the job message
+                    item_results['result'] = {
+                        'error': self.status['status'],
+                        'details': self.status.get('message')}
+                else:
+                    item_results['result'] = {
+                        'error': 'Unmatched',
+                        'details': 'No job result found for the item'}
+        return results
+
+    def refresh(self) -> dict:
+        """
+        Update the job status
+
+        :return: dictionary with the job status details
+        :raise ApiError: if the request returned an error
+        """
+        results = self.api.request_get(path=f'job_statuses/{self.id}.json')
+        if 'error' in results:
+            raise ApiError(results=results)
+        self.status = results['job_status']
+        return self.status
+
+    def wait(self,
+             poll_interval: float = 1.0,
+             max_interval: float = 30.0,
+             timeout: Optional[float] = None) -> dict:
+        """
+        Wait for the job to finish
+
+        :param poll_interval: delay in seconds before the first check,
+                              doubled after each check
+        :param max_interval: maximum delay in seconds between the checks
+        :param timeout: maximum number of seconds to wait or None
+        :return: dictionary with the job status details
+        :raise TimeoutError: if the job is not finished before the timeout
+        """
+        self.wait_many(jobs=[self],
+                       poll_interval=poll_interval,
+                       max_interval=max_interval,
+                       timeout=timeout)
+        return self.status
+
+    @staticmethod
+    def refresh_many(jobs: Iterable['JobStatus']) -> None:
+        """
+        Update the status for many jobs using a request for every
+        100 jobs. The jobs missing from the results are marked as failed.
+
+        :param jobs: list of job handles to update
+        :return: None
+        :raise ApiError: if any request returned an error
+        """
+        jobs = list(jobs)
+        for index in range(0, len(jobs), SHOW_MANY_MAX_IDS):
+            chunk = {job.id: job
+                     for job in jobs[index:index + SHOW_MANY_MAX_IDS]}
+            results = chunk[next(iter(chunk))].api.request_get(
+                path=f'job_statuses/show_many.json?ids={",".join(chunk)}')
+            if 'error' in results:
+                raise ApiError(results=results)
+            for status in results['job_statuses']:
+                if status['id'] in chunk:
+                    chunk.pop(status['id']).status = status
+            for job in chunk.values():
+                # Job status not available anymore, consider it failed
+                job.status = {**job.status,
+                              'status': JOB_STATUS_FAILED,
+                              'message': 'Job status not found'}
+
+    @staticmethod
+    def wait_many(jobs: Iterable['JobStatus'],
+                  poll_interval: float = 1.0,
+                  max_interval: float = 30.0,
+                  timeout: Optional[float] = None) -> list['JobStatus']:
+        """
+        Wait for many jobs to finish, checking all the pending jobs together
+
+        :param jobs: list of job handles to wait
+        :param poll_interval: delay in seconds before the first check,
+                              doubled after each check
+        :param max_interval: maximum delay in seconds between the checks
+        :param timeout: maximum number of seconds to wait or None
+        :return: list of job handles
+        :raise TimeoutError: if any job is not finished before the timeout
+        """
+        jobs = list(jobs)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = poll_interval
+        pending = [job for job in jobs if not job.is_done]
+        while pending:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f'{len(pending)} jobs not finished')
+                interval = min(interval, remaining)
+            time.sleep(interval)
+            JobStatus.refresh_many(jobs=pending)
+            pending = [job for job in pending if not job.is_done]
+            interval = min(interval * 2, max_interval)
+        return jobs
+
+    @staticmethod
+    def iter_run_many(submit: Callable[[list], 'JobStatus'],
+                      chunks: Iterable[list],
+                      max_jobs: int = 10,
+                      poll_interval: float = 1.0,
+                      max_interval: float = 30.0
+                      ) -> Iterator[tuple[list, 'JobStatus']]:
+        """
+        Submit a job for each chunk of items, keeping a limited number of
+        jobs in progress, and get the finished jobs in the submission order
+
+        :param submit: function to submit a job for a chunk of items
+        :param chunks: iterable over the chunks of items
+        :param max_jobs: maximum number of jobs in progress
+        :param poll_interval: delay in seconds before the first check,
+                              doubled after each check
+        :param max_interval: maximum delay in seconds between the checks
+        :return: iterator over tuples with the chunk of items and its
+                 finished job
+        :raise JobSubmitError: if any job submission returned an error,
+                               with the jobs still in progress
+        """
+        chunks = iter(chunks)
+        in_progress = collections.deque()
+        exhausted = False
+        interval = poll_interval
+        while True:
+            # Submit new jobs while less than max_jobs are not finished
+            pending = [job for _, job in in_progress if not job.is_done]
+            while not exhausted and len(pending) < max_jobs:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                else:
+                    try:
+                        job = submit(chunk)
+                    except ApiError as error:
+                        # Keep the jobs in progress available to the caller
+                        raise JobSubmitError(
+                            results=error.results,
+                            jobs=[job for _, job in in_progress]) from error
+                    in_progress.append((chunk, job))
+                    if not job.is_done:
+                        pending.append(job)
+                    interval = poll_interval
+            # Get the finished jobs in the submission order
+            while in_progress and in_progress[0][1].is_done:
+                yield in_progress.popleft()
+            if not in_progress:
+                if exhausted:
+                    break
+                continue
+            time.sleep(interval)
+            JobStatus.refresh_many(jobs=pending)
+            interval = min(interval * 2, max_interval)
+
+    @staticmethod
+    def iter_run_many_ids(api: Api,
+                          method: str,
+                          path: str,
+                          ids: Iterable[int],
+                          chunk_size: int = SHOW_MANY_MAX_IDS,
+                          max_jobs: int = 10,
+                          poll_interval: float = 1.0) -> Iterator[dict]:
+        """
+        Submit a job for each chunk of IDs to a bulk API, keeping a limited
+        number of jobs in progress, and get the results for each ID
+
+        :param api: API object used to submit the jobs
+        :param method: REST method to use (post, put, delete)
+        :param path: API path for the bulk request
+        :param ids: list of IDs to process
+        :param chunk_size: maximum number of IDs for each job
+        :param max_jobs: maximum number of jobs in progress
+        :param poll_interval: delay in seconds before the first job check
+        :return: iterator over the results for each ID, in the same order
+                 of the IDs
+        :raise JobSubmitError: if any job submission returned an error
+        """
+        def submit(chunk: list[int]) -> JobStatus:
+            results = api.request(
+                method=method,
+                path=f'{path}?ids={",".join(map(str, chunk))}',
+                json=None)
+            if 'error' in results:
+                raise ApiError(results=results)
+            return JobStatus(api=api, status=results['job_status'])
+
+        for chunk, job in JobStatus.iter_run_many(
+                submit=submit,
+                chunks=api.iter_chunks(items=dict.fromkeys(ids),
+                                       chunk_size=chunk_size),
+                max_jobs=max_jobs,
+                poll_interval=poll_interval):
+            yield from job.get_items_results(items=chunk)
@@ -0,0 +1,108 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec(object):
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object to JSON data
+
+        :param obj: object to encode
+        :return: UTF-8 encoded JSON data
+        """
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode an object from JSON data
+
+        :param data: raw JSON data
+        :return: decoded object
+        """
+        raise NotImplementedError
+
+
+class StandardJsonCodec(JsonCodec):
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object to JSON data using the standard library
+
+        :param obj: object to encode
+        :return: UTF-8 encoded JSON data
+        """
+        return json.dumps(obj,
+                          separators=(',', ':'),
+                          allow_nan=False).encode('utf-8')
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode an object from JSON data using the standard library
+
+        :param data: raw JSON data
+        :return: decoded object
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    def __init__(self):
+        """
+        JSON codec using the orjson library
+
+        :raise ImportError: if orjson is not installed
+        """
+        if orjson is None:
+            raise ImportError('orjson is not installed')
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object to JSON data using orjson
+
+        :param obj: object to encode
+        :return: UTF-8 encoded JSON data
+        """
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode an object from JSON data using orjson
+
+        :param data: raw JSON data
+        :return: decoded object
+        """
+        return orjson.loads(data)
+
+
+def get_default_codec() -> JsonCodec:
+    """
+    Get the fastest JSON codec available, using orjson when installed
+    and falling back to the standard library
+
+    :return: JSON codec
+    """
+    return StandardJsonCodec() if orjson is None else OrjsonCodec()
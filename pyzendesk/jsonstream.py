@@ -0,0 +1,164 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+# Matches the whitespaces between the JSON tokens
+WHITESPACE = json.decoder.WHITESPACE
+
+
+class JsonStream(object):
+    def __init__(self, chunks: Iterable[bytes], key: str):
+        """
+        Decode a JSON object incrementally from a stream of chunks,
+        yielding each record of the array under the key as soon as it was
+        decoded, without loading the whole response.
+        The other keys of the object are available in results after all
+        the records were processed.
+
+        :param chunks: iterable over the raw JSON data chunks
+        :param key: object key containing the records
+        """
+        self.key = key
+        self.results = {}
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._position = 0
+        self._finished = False
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Get the records one at a time
+
+        :return: iterator over the records
+        :raise json.JSONDecodeError: if the data is not a valid JSON object
+        """
+        self._expect(token='{')
+        while True:
+            token = self._peek()
+            if token == '}':
+                break
+            if token == ',':
+                self._position += 1
+                continue
+            key = self._decode()
+            self._expect(token=':')
+            if key == self.key and self._peek() == '[':
+                self._position += 1
+                yield from self._iter_array()
+            else:
+                self.results[key] = self._decode()
+
+    def _iter_array(self) -> Iterator[Any]:
+        """
+        Get the array values one at a time
+
+        :return: iterator over the array values
+        """
+        while True:
+            token = self._peek()
+            if token == ']':
+                self._position += 1
+                break
+            if token == ',':
+                self._position += 1
+                continue
+            yield self._decode()
+
+    def _read(self) -> bool:
+        """
+        Append the next chunk to the buffer, discarding the processed data
+
+        :return: False if the stream was already finished
+        """
+        if self._finished:
+            return False
+        self._buffer = self._buffer[self._position:]
+        self._position = 0
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._finished = True
+            self._buffer += self._text_decoder.decode(b'', final=True)
+        else:
+            self._buffer += self._text_decoder.decode(chunk)
+        return True
+
+    def _peek(self) -> str:
+        """
+        Get the next token character without consuming it
+
+        :return: next token character
+        :raise json.JSONDecodeError: if the stream was finished
+        """
+        while True:
+            self._position = WHITESPACE.match(self._buffer,
+                                              self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read():
+                raise json.JSONDecodeError(msg='Unexpected end of data',
+                                           doc=self._buffer,
+                                           pos=self._position)
+
+    def _expect(self, token: str) -> None:
+        """
+        Consume the expected token character
+
+        :param token: expected token character
+        :return: None
+        :raise json.JSONDecodeError: if a different token was found
+        """
+        if self._peek() != token:
+            raise json.JSONDecodeError(msg=f'Expecting {token!r}',
+                                       doc=self._buffer,
+                                       pos=self._position)
+        self._position += 1
+
+    def _decode(self) -> Any:
+        """
+        Decode the next JSON value, reading more chunks until the value is
+        complete. A value is complete only if it's followed by other data,
+        to avoid truncating the numbers split across the chunks.
+
+        :return: decoded value
+        :raise json.JSONDecodeError: if the value is not valid
+        """
+        self._peek()
+        # Minimum buffer length before retrying a failed decode, doubled
+        # every time to avoid decoding large values too many times
+        required_length = 0
+        while True:
+            available = len(self._buffer) - self._position
+            if available >= required_length or self._finished:
+                try:
+                    value, end = self._decoder.raw_decode(self._buffer,
+                                                          self._position)
+                    if end < len(self._buffer) or self._finished:
+                        self._position = end
+                        return value
+                except json.JSONDecodeError:
+                    if self._finished:
+                        raise
+                required_length = available * 2
+            self._read()
@@ -0,0 +1,288 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import collections
+import re
+import threading
+import time
+import urllib.parse
+from typing import Any, Optional
+
+# Matches the numeric path segments, replaced by {id} in the endpoints
+NUMERIC_SEGMENT = re.compile(r'(?<=/)\d+(?=/|\.|$)')
+
+
+class RequestInfo(object):
+    def __init__(self,
+                 method: str,
+                 url: str,
+                 endpoint: str,
+                 bytes_sent: Optional[int]):
+        """
+        Details of a request sent to Zendesk, completed after the response
+
+        :param method: REST method used
+        :param url: absolute URL of the request
+        :param endpoint: endpoint template (like tickets/{id}.json)
+        :param bytes_sent: size of the request data or None if unknown
+        """
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.bytes_sent = bytes_sent
+        self.bytes_received = None
+        self.status = None
+        self.retries = 0
+        self.rate_limit = None
+        self.rate_limit_remaining = None
+        self.error = None
+        self.duration = None
+        self.started = time.monotonic()
+
+    def set_response(self,
+                     status: int,
+                     headers: Any,
+                     size: Optional[int]) -> None:
+        """
+        Save the response details
+
+        :param status: HTTP status code
+        :param headers: response headers
+        :param size: size of the response data or None if unknown
+        :return: None
+        """
+        self.status = status
+        self.bytes_received = size
+        for header, attribute in (('X-Rate-Limit', 'rate_limit'),
+                                  ('X-Rate-Limit-Remaining',
+                                   'rate_limit_remaining')):
+            try:
+                setattr(self, attribute, int(headers[header]))
+            except (KeyError, TypeError, ValueError):
+                pass
+
+    @staticmethod
+    def get_endpoint(website: str, url: str) -> str:
+        """
+        Get the endpoint template for an URL, removing the API base URL and
+        the query string and replacing the numeric segments with {id}
+
+        :param website: Zendesk website URL
+        :param url: absolute URL of the request
+        :return: endpoint template (like tickets/{id}.json) or the host name
+                 for the URLs outside of the API
+        """
+        base_url = f'{website}/api/v2/'
+        if not url.startswith(base_url):
+            return urllib.parse.urlsplit(url).netloc
+        path = url[len(base_url):].split('?', 1)[0]
+        return NUMERIC_SEGMENT.sub('{id}', f'/{path}')[1:]
+
+
+class RequestObserver(object):
+    def before_request(self, info: RequestInfo) -> None:
+        """
+        Called before sending a request
+
+        :param info: request details
+        :return: None
+        """
+        pass
+
+    def after_request(self, info: RequestInfo) -> None:
+        """
+        Called after the request was completed or failed, including the
+        repeated attempts
+
+        :param info: request details, including the response details
+        :return: None
+        """
+        pass
+
+
+class MetricsObserver(RequestObserver):
+    def __init__(self, max_samples: int = 1024):
+        """
+        In memory aggregator for the requests metrics by method and
+        endpoint, with the durations percentiles computed over the most
+        recent requests
+
+        :param max_samples: number of recent durations kept for each endpoint
+        """
+        self.max_samples = max_samples
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def after_request(self, info: RequestInfo) -> None:
+        """
+        Aggregate the metrics for a completed request
+
+        :param info: request details, including the response details
+        :return: None
+        """
+        with self._lock:
+            key = (info.method.lower(), info.endpoint)
+            metrics = self._metrics.get(key)
+            if metrics is None:
+                metrics = {'count': 0,
+                           'errors': 0,
+                           'statuses': collections.Counter(),
+                           'durations': collections.deque(
+                               maxlen=self.max_samples),
+                           'duration_sum': 0.0,
+                           'bytes_sent': 0,
+                           'bytes_received': 0,
+                           'retries': 0,
+                           'rate_limit_remaining': None}
+                self._metrics[key] = metrics
+            metrics['count'] += 1
+            if info.error is not None:
+                metrics['errors'] += 1
+            else:
+                metrics['statuses'][info.status] += 1
+            metrics['durations'].append(info.duration)
+            metrics['duration_sum'] += info.duration
+            metrics['bytes_sent'] += info.bytes_sent or 0
+            metrics['bytes_received'] += info.bytes_received or 0
+            metrics['retries'] += info.retries
+            if info.rate_limit_remaining is not None:
+                metrics['rate_limit_remaining'] = info.rate_limit_remaining
+
+    def get_stats(self,
+                  percentiles: tuple[float, ...] = (50, 90, 99)
+                  ) -> dict[tuple[str, str], dict]:
+        """
+        Get the aggregated metrics
+
+        :param percentiles: list of the durations percentiles to compute
+        :return: dictionary with the metrics for each method and endpoint
+        """
+        with self._lock:
+            stats = {}
+            for key, metrics in self._metrics.items():
+                durations = sorted(metrics['durations'])
+                stats[key] = {
+                    'count': metrics['count'],
+                    'errors': metrics['errors'],
+                    'statuses': dict(metrics['statuses']),
+                    'duration_sum': metrics['duration_sum'],
+                    'duration_percentiles': {
+                        percentile: self._get_percentile(
+                            values=durations,
+                            percentile=percentile)
+                        for percentile in percentiles},
+                    'bytes_sent': metrics['bytes_sent'],
+                    'bytes_received': metrics['bytes_received'],
+                    'retries': metrics['retries'],
+                    'rate_limit_remaining': metrics['rate_limit_remaining']}
+            return stats
+
+    def get_prometheus_text(self, prefix: str = 'pyzendesk') -> str:
+        """
+        Get the aggregated metrics using the Prometheus text format
+
+        :param prefix: prefix for the metrics names
+        :return: text with the metrics
+        """
+        stats = self.get_stats(percentiles=(50, 90, 99))
+        lines = [f'# HELP {prefix}_request_duration_seconds '
+                 f'Duration of the requests including the retries',
+                 f'# TYPE {prefix}_request_duration_seconds summary']
+        for (method, endpoint), metrics in stats.items():
+            labels = self._get_labels(method=method, endpoint=endpoint)
+            for percentile, value in metrics[
+                    'duration_percentiles'].items():
+                lines.append(f'{prefix}_request_duration_seconds'
+                             f'{{{labels},quantile="{percentile / 100}"}} '
+                             f'{value}')
+            lines.append(f'{prefix}_request_duration_seconds_sum{{{labels}}} '
+                         f'{metrics["duration_sum"]}')
+            lines.append(f'{prefix}_request_duration_seconds_count'
+                         f'{{{labels}}} {metrics["count"]}')
+        lines.extend((f'# HELP {prefix}_requests_total '
+                      f'Number of the requests by status',
+                      f'# TYPE {prefix}_requests_total counter'))
+        for (method, endpoint), metrics in stats.items():
+            labels = self._get_labels(method=method, endpoint=endpoint)
+            for status, count in metrics['statuses'].items():
+                lines.append(f'{prefix}_requests_total'
+                             f'{{{labels},status="{status}"}} {count}')
+            if metrics['errors']:
+                lines.append(f'{prefix}_requests_total'
+                             f'{{{labels},status="error"}} '
+                             f'{metrics["errors"]}')
+        for name, key, kind, description in (
+                ('request_bytes_sent_total', 'bytes_sent', 'counter',
+                 'Size of the requests data'),
+                ('request_bytes_received_total', 'bytes_received', 'counter',
+                 'Size of the responses data'),
+                ('request_retries_total', 'retries', 'counter',
+                 'Number of the repeated requests'),
+                ('rate_limit_remaining', 'rate_limit_remaining', 'gauge',
+                 'Remaining requests for the rate limit')):
+            lines.extend((f'# HELP {prefix}_{name} {description}',
+                          f'# TYPE {prefix}_{name} {kind}'))
+            for (method, endpoint), metrics in stats.items():
+                if metrics[key] is not None:
+                    labels = self._get_labels(method=method,
+                                              endpoint=endpoint)
+                    lines.append(f'{prefix}_{name}{{{labels}}} '
+                                 f'{metrics[key]}')
+        return '\n'.join(lines) + '\n'
+
+    def clear(self) -> None:
+        """
+        Remove all the aggregated metrics
+
+        :return: None
+        """
+        with self._lock:
+            self._metrics.clear()
+
+    def _get_labels(self, method: str, endpoint: str) -> str:
+        """
+        Get the Prometheus labels for a method and an endpoint
+
+        :param method: REST method used
+        :param endpoint: endpoint template
+        :return: labels text
+        """
+        values = []
+        for name, value in (('method', method), ('endpoint', endpoint)):
+            value = (value.replace('\\', '\\\\')
+                     .replace('"', '\\"')
+                     .replace('\n', '\\n'))
+            values.append(f'{name}="{value}"')
+        return ','.join(values)
+
+    def _get_percentile(self,
+                        values: list[float],
+                        percentile: float) -> Optional[float]:
+        """
+        Get a percentile using the nearest rank method
+
+        :param values: sorted list of values
+        :param percentile: percentile to compute (between 0 and 100)
+        :return: percentile value or None without values
+        """
+        if not values:
+            return None
+        rank = max(0, -(-len(values) * percentile // 100) - 1)
+        return values[min(int(rank), len(values) - 1)]
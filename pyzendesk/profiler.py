@@ -0,0 +1,382 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import contextlib
+import socket
+import threading
+import time
+from typing import Iterator, Optional
+
+import requests
+import requests.adapters
+import urllib3.connection
+import urllib3.connectionpool
+
+# Phases recorded for each page, in the order of a request
+PROFILE_PHASES = ('rate_limit_wait',
+                  'retry_wait',
+                  'connect',
+                  'tls',
+                  'ttfb',
+                  'transfer',
+                  'decode',
+                  'merge')
+
+# Page being profiled in the current thread
+_current = threading.local()
+
+
+class PageProfile(object):
+    def __init__(self, method: str, endpoint: str):
+        """
+        Time spent in each phase for a single page request
+
+        :param method: REST method used
+        :param endpoint: endpoint template (like tickets/{id}.json)
+        """
+        self.method = method
+        self.endpoint = endpoint
+        self.status = None
+        self.phases = dict.fromkeys(PROFILE_PHASES, 0.0)
+        # Connection time recorded during the current attempt
+        self.attempt_connect = 0.0
+
+    def add(self, phase: str, duration: float) -> None:
+        """
+        Add the time spent in a phase
+
+        :param phase: phase name
+        :param duration: time spent in seconds
+        :return: None
+        """
+        self.phases[phase] += duration
+
+    def to_dict(self) -> dict:
+        """
+        Get the page details as dictionary
+
+        :return: dictionary with the page details
+        """
+        return {'method': self.method,
+                'endpoint': self.endpoint,
+                'status': self.status,
+                'duration': sum(self.phases.values()),
+                'phases': dict(self.phases)}
+
+
+class CallProfile(object):
+    def __init__(self, name: Optional[str], timed: bool = True):
+        """
+        Pages requested by a single paginated call
+
+        :param name: call name or None to use the first page endpoint
+        :param timed: measure the call duration, else the call duration is
+                      the sum of the pages durations
+        """
+        self.name = name
+        self.pages = []
+        self.started = time.perf_counter() if timed else None
+        self.duration = None
+
+    def to_dict(self) -> dict:
+        """
+        Get the call details as dictionary, including the time not spent
+        in any of the phases as other
+
+        :return: dictionary with the call details
+        """
+        phases = dict.fromkeys(PROFILE_PHASES, 0.0)
+        for page in self.pages:
+            for phase, duration in page.phases.items():
+                phases[phase] += duration
+        if self.started is None:
+            duration = sum(phases.values())
+        elif self.duration is None:
+            # Call still in progress
+            duration = time.perf_counter() - self.started
+        else:
+            duration = self.duration
+        phases['other'] = max(0.0, duration - sum(phases.values()))
+        return {'name': self.name,
+                'duration': duration,
+                'phases': phases,
+                'pages': [page.to_dict() for page in self.pages]}
+
+
+class TimedHTTPConnection(urllib3.connection.HTTPConnection):
+    def _new_conn(self) -> socket.socket:
+        """
+        Open the socket, recording the connection time for the page
+        being profiled
+
+        :return: connected socket
+        """
+        started = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            page = getattr(_current, 'page', None)
+            if page is not None:
+                duration = time.perf_counter() - started
+                page.add(phase='connect', duration=duration)
+                page.attempt_connect += duration
+
+
+class TimedHTTPSConnection(urllib3.connection.HTTPSConnection):
+    def _new_conn(self) -> socket.socket:
+        """
+        Open the socket, saving the connection time
+
+        :return: connected socket
+        """
+        started = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            self._connected_time = time.perf_counter() - started
+
+    def connect(self) -> None:
+        """
+        Open the socket and complete the TLS handshake, recording the
+        connection and the handshake times for the page being profiled
+
+        :return: None
+        """
+        self._connected_time = 0.0
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            page = getattr(_current, 'page', None)
+            if page is not None:
+                duration = time.perf_counter() - started
+                page.add(phase='connect', duration=self._connected_time)
+                page.add(phase='tls',
+                         duration=duration - self._connected_time)
+                page.attempt_connect += duration
+
+
+class TimedHTTPConnectionPool(urllib3.connectionpool.HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(urllib3.connectionpool.HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class Profiler(object):
+    def __init__(self):
+        """
+        Profiler recording the time spent in each phase for every page
+        request, grouped by paginated call
+        """
+        self.calls = []
+        self._calls_by_endpoint = {}
+        self._lock = threading.Lock()
+        # Original pool classes and number of installs for each adapter
+        self._installed = {}
+
+    def install(self, session: requests.Session) -> None:
+        """
+        Use the timed connections for the new connections of a session,
+        to record the connection and the TLS handshake times
+
+        :param session: session to profile
+        :return: None
+        """
+        with self._lock:
+            for adapter in set(session.adapters.values()):
+                if not isinstance(adapter, requests.adapters.HTTPAdapter):
+                    continue
+                if adapter in self._installed:
+                    # Already installed by another object sharing the adapter
+                    self._installed[adapter][1] += 1
+                    continue
+                self._installed[adapter] = [
+                    adapter.poolmanager.pool_classes_by_scheme, 1]
+                adapter.poolmanager.pool_classes_by_scheme = {
+                    'http': TimedHTTPConnectionPool,
+                    'https': TimedHTTPSConnectionPool}
+
+    def uninstall(self, session: requests.Session) -> None:
+        """
+        Restore the original connections of a session after the last
+        object sharing it stopped using the profiler, closing the timed
+        connection pools
+
+        :param session: session to stop profiling
+        :return: None
+        """
+        with self._lock:
+            for adapter in set(session.adapters.values()):
+                if adapter not in self._installed:
+                    continue
+                self._installed[adapter][1] -= 1
+                if self._installed[adapter][1] == 0:
+                    pool_classes, _ = self._installed.pop(adapter)
+                    adapter.poolmanager.pool_classes_by_scheme = pool_classes
+                    adapter.poolmanager.clear()
+
+    @contextlib.contextmanager
+    def call(self, name: Optional[str] = None) -> Iterator[CallProfile]:
+        """
+        Group the pages requested in the current thread in a call
+
+        :param name: call name or None to use the first page endpoint
+        :return: context manager returning the call profile
+        """
+        profile = CallProfile(name=name)
+        with self._lock:
+            self.calls.append(profile)
+        previous = getattr(_current, 'call', None)
+        _current.call = profile
+        try:
+            yield profile
+        finally:
+            profile.duration = time.perf_counter() - profile.started
+            _current.call = previous
+
+    def start_page(self,
+                   method: str,
+                   endpoint: str) -> Optional[PageProfile]:
+        """
+        Start recording the phases for a page request in the current thread
+
+        :param method: REST method used
+        :param endpoint: endpoint template (like tickets/{id}.json)
+        :return: page profile or None if a page is already being recorded
+        """
+        if getattr(_current, 'page', None) is not None:
+            return None
+        page = PageProfile(method=method, endpoint=endpoint)
+        call = getattr(_current, 'call', None)
+        with self._lock:
+            if call is None:
+                # Group the pages outside of any call by endpoint
+                call = self._calls_by_endpoint.get(endpoint)
+                if call is None:
+                    call = CallProfile(name=endpoint, timed=False)
+                    self._calls_by_endpoint[endpoint] = call
+                    self.calls.append(call)
+            elif call.name is None:
+                call.name = endpoint
+            call.pages.append(page)
+        _current.page = page
+        return page
+
+    def stop_page(self,
+                  page: Optional[PageProfile],
+                  status: Optional[int]) -> None:
+        """
+        Stop recording the phases for a page request in the current thread
+
+        :param page: page profile returned by start_page
+        :param status: HTTP status code or None after an error
+        :return: None
+        """
+        if page is not None:
+            page.status = status
+            _current.page = None
+            _current.last_page = page
+
+    def record(self, phase: str, duration: float) -> None:
+        """
+        Add the time spent in a phase for the page being recorded in the
+        current thread, or for the last recorded page
+
+        :param phase: phase name
+        :param duration: time spent in seconds
+        :return: None
+        """
+        page = (getattr(_current, 'page', None) or
+                getattr(_current, 'last_page', None))
+        if page is not None:
+            page.add(phase=phase, duration=duration)
+
+    def record_attempt(self, duration: float) -> None:
+        """
+        Add the time spent waiting for the response headers, excluding the
+        connection time, for the page being recorded in the current thread
+
+        :param duration: time spent sending the request in seconds
+        :return: None
+        """
+        page = getattr(_current, 'page', None)
+        if page is not None:
+            page.add(phase='ttfb',
+                     duration=max(0.0, duration - page.attempt_connect))
+            page.attempt_connect = 0.0
+
+    def get_report(self) -> list[dict]:
+        """
+        Get the recorded calls with the time spent in each phase
+
+        :return: list of dictionaries with the calls details
+        """
+        with self._lock:
+            return [call.to_dict() for call in self.calls]
+
+    def get_summary(self, width: int = 40) -> str:
+        """
+        Get a flame style text summary of the recorded calls, with a bar
+        for the time spent in each phase
+
+        :param width: width of the bars for the whole call duration
+        :return: text summary
+        """
+        lines = []
+        for call in self.get_report():
+            duration = call['duration']
+            lines.append(f'{call["name"]}: {len(call["pages"])} pages '
+                         f'in {duration:.3f} s')
+            for phase, phase_duration in call['phases'].items():
+                share = phase_duration / duration if duration else 0.0
+                lines.append(f'  {phase:<16}{phase_duration:9.3f} s '
+                             f'{share:7.1%} {"#" * round(share * width)}')
+        return '\n'.join(lines) + '\n'
+
+    def get_folded(self) -> str:
+        """
+        Get the recorded phases using the folded stacks format used by the
+        flame graph tools, with the times in microseconds
+
+        :return: text with a line for each call, page and phase
+        """
+        lines = []
+        for call in self.get_report():
+            for number, page in enumerate(call['pages'], start=1):
+                for phase, duration in page['phases'].items():
+                    if duration > 0:
+                        lines.append(f'{call["name"]};page {number};'
+                                     f'{phase} {round(duration * 1e6)}')
+            if call['phases']['other'] > 0:
+                lines.append(f'{call["name"]};other '
+                             f'{round(call["phases"]["other"] * 1e6)}')
+        return '\n'.join(lines) + '\n'
+
+    def clear(self) -> None:
+        """
+        Remove all the recorded calls
+
+        :return: None
+        """
+        with self._lock:
+            self.calls.clear()
+            self._calls_by_endpoint.clear()
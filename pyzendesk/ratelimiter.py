@@ -0,0 +1,130 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import threading
+import time
+from typing import Mapping, Optional
+
+
+class RateLimiter(object):
+    # Shared rate limiters for each account
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self,
+                 limit: int = 200,
+                 period: float = 60.0,
+                 max_retries: int = 3):
+        """
+        Client side token bucket scheduler for the requests of an account
+
+        :param limit: initial number of requests allowed for each period,
+                      updated from the X-Rate-Limit header
+        :param period: period duration in seconds
+        :param max_retries: number of times a throttled request is repeated
+        """
+        self.limit = limit
+        self.period = period
+        self.max_retries = max_retries
+        self.tokens = float(limit)
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, website: str, username: str) -> 'RateLimiter':
+        """
+        Get the rate limiter shared by all the objects using the same account
+
+        :param website: Zendesk website URL
+        :param username: user name for login
+        :return: rate limiter for the account
+        """
+        with cls._instances_lock:
+            key = (website, username)
+            if key not in cls._instances:
+                cls._instances[key] = cls()
+            return cls._instances[key]
+
+    def _refill(self, now: float) -> None:
+        """
+        Add the tokens accrued since the last update
+
+        :param now: current monotonic time
+        :return: None
+        """
+        elapsed = now - self._updated
+        self._updated = now
+        self.tokens = min(float(self.limit),
+                          self.tokens + elapsed * self.limit / self.period)
+
+    def reserve(self) -> float:
+        """
+        Reserve a token for a new request
+
+        :return: number of seconds to wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now=now)
+            self.tokens -= 1
+            delay = max(0.0, self.blocked_until - now)
+            if self.tokens < 0:
+                # Wait until the reserved token will be available
+                delay = max(delay, -self.tokens * self.period / self.limit)
+            return delay
+
+    def update(self, status: int, headers: Mapping[str, str]) -> None:
+        """
+        Update the scheduler using the rate limit response headers
+
+        :param status: HTTP status code
+        :param headers: dictionary with HTTP response headers
+        :return: None
+        """
+        limit = headers.get('X-Rate-Limit')
+        remaining = headers.get('X-Rate-Limit-Remaining')
+        retry_after = self.get_retry_after(headers=headers)
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now=now)
+            if limit and limit.isdigit() and int(limit) > 0:
+                self.limit = int(limit)
+            if remaining and remaining.isdigit():
+                self.tokens = min(self.tokens, float(remaining))
+            if status == 429:
+                # Throttled request, no more requests for this period
+                self.tokens = min(self.tokens, 0.0)
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until,
+                                         now + retry_after)
+
+    @staticmethod
+    def get_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Get the number of seconds from the Retry-After header
+
+        :param headers: dictionary with HTTP response headers
+        :return: number of seconds to wait or None if missing
+        """
+        try:
+            return max(0.0, float(headers.get('Retry-After')))
+        except (TypeError, ValueError):
+            return None
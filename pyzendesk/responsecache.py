@@ -0,0 +1,156 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import collections
+import threading
+import time
+from typing import Optional
+
+
+class ResponseCache(object):
+    def __init__(self,
+                 ttl: float = 60.0,
+                 ttls: Optional[dict[str, float]] = None,
+                 max_entries: int = 1024,
+                 max_bytes: Optional[int] = None):
+        """
+        In memory cache for the responses, with least recently used eviction
+
+        :param ttl: default time to live in seconds for the cached responses
+        :param ttls: dictionary with the time to live for each resource,
+                     using the first part of the API path as key
+                     (like tickets, users or deleted_users)
+        :param max_entries: maximum number of cached responses
+        :param max_bytes: maximum size of the cached responses or None
+        """
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_ttl(self, path: str) -> float:
+        """
+        Get the time to live for an API path
+
+        :param path: API path
+        :return: time to live in seconds
+        """
+        return self.ttls.get(path.split('/', 1)[0], self.ttl)
+
+    def get(self, method: str, path: str) -> Optional[bytes]:
+        """
+        Get a cached response
+
+        :param method: REST method used
+        :param path: API path
+        :return: cached response content or None if missing or expired
+        """
+        key = (method.lower(), path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                # Expired entry
+                self._remove(key=key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, method: str, path: str, content: bytes) -> None:
+        """
+        Save a response in the cache
+
+        :param method: REST method used
+        :param path: API path
+        :param content: response content
+        :return: None
+        """
+        key = (method.lower(), path)
+        if self.max_bytes is not None and len(content) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key=key)
+            self._entries[key] = (time.monotonic() + self.get_ttl(path=path),
+                                  content)
+            self.size += len(content)
+            # Evict the least recently used entries
+            while (len(self._entries) > self.max_entries or
+                   (self.max_bytes is not None and
+                    self.size > self.max_bytes)):
+                self._remove(key=next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, path: str) -> None:
+        """
+        Remove the cached responses for an entity and its sub-resources
+
+        :param path: API path of the entity (like tickets/1 or users/1)
+        :return: None
+        """
+        with self._lock:
+            for key in list(self._entries):
+                cached_path = key[1]
+                if (cached_path == path or
+                        (cached_path.startswith(path) and
+                         cached_path[len(path)] in './?')):
+                    self._remove(key=key)
+
+    def clear(self) -> None:
+        """
+        Remove all the cached responses
+
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def get_stats(self) -> dict:
+        """
+        Get the cache statistics
+
+        :return: dictionary with the cache statistics
+        """
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'entries': len(self._entries),
+                    'bytes': self.size}
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        """
+        Remove a cached response
+
+        :param key: cached response key
+        :return: None
+        """
+        _, content = self._entries.pop(key)
+        self.size -= len(content)
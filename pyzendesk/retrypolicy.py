@@ -0,0 +1,110 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import asyncio
+import random
+from typing import Optional
+
+import requests
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+RETRY_EXCEPTIONS = (requests.ConnectionError,
+                    requests.Timeout,
+                    requests.exceptions.ChunkedEncodingError)
+if aiohttp is not None:
+    RETRY_EXCEPTIONS += (aiohttp.ClientConnectionError,
+                         aiohttp.ClientPayloadError,
+                         asyncio.TimeoutError)
+RETRY_METHODS = ('get', 'head', 'options')
+
+
+class RetryPolicy(object):
+    def __init__(self,
+                 max_attempts: int = 3,
+                 backoff_base: float = 0.5,
+                 backoff_cap: float = 30.0,
+                 jitter: bool = True,
+                 status_codes: tuple[int, ...] = RETRY_STATUS_CODES,
+                 exceptions: tuple[type, ...] = RETRY_EXCEPTIONS,
+                 methods: tuple[str, ...] = RETRY_METHODS):
+        """
+        Policy to repeat the requests failed for transient errors
+
+        :param max_attempts: maximum number of attempts for each request
+        :param backoff_base: delay in seconds before the first retry,
+                             doubled for each following attempt
+        :param backoff_cap: maximum delay in seconds between the attempts
+        :param jitter: randomize the delay between zero and the backoff
+        :param status_codes: HTTP status codes to retry
+        :param exceptions: exception types to retry
+        :param methods: REST methods safe to retry (add put to opt-in)
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.status_codes = status_codes
+        self.exceptions = exceptions
+        self.methods = tuple(method.lower() for method in methods)
+
+    def should_retry(self,
+                     method: str,
+                     attempt: int,
+                     status: Optional[int] = None,
+                     exception: Optional[Exception] = None) -> bool:
+        """
+        Check if a failed request can be repeated
+
+        :param method: REST method used (get, post, put, delete)
+        :param attempt: number of attempts already done
+        :param status: HTTP status code of the response
+        :param exception: exception raised in place of the response
+        :return: True if the request can be repeated
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if method.lower() not in self.methods:
+            return False
+        if exception is not None:
+            return isinstance(exception, self.exceptions)
+        return status in self.status_codes
+
+    def get_delay(self,
+                  attempt: int,
+                  retry_after: Optional[float] = None) -> float:
+        """
+        Get the delay before the next attempt
+
+        :param attempt: number of attempts already done
+        :param retry_after: delay requested by the server
+        :return: number of seconds to wait
+        """
+        delay = min(self.backoff_cap,
+                    self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
@@ -0,0 +1,53 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import asyncio
+import os
+
+from pyzendesk import AsyncTickets as ZendeskAsyncTickets
+
+
+async def main():
+    # Instance zendesk object with at most 20 requests in progress
+    async with ZendeskAsyncTickets(website=os.environ['ZENDESK_SERVER'],
+                                   max_concurrency=20) as zendesk:
+        # Authenticate user
+        zendesk.authenticate(username=os.environ['ZENDESK_USERNAME'],
+                             password=os.environ['ZENDESK_PASSWORD'])
+
+        # Get the tickets count from 2021-01-01 to 2021-01-31
+        count = await zendesk.count(criteria_list=['created>=2021-01-01',
+                                                   'created<=2021-01-31'])
+        print('tickets count found:', count)
+
+        # Get all the tickets IDs from 2021-01-01 to 2021-01-31
+        ticket_ids = [ticket['id']
+                      async for ticket in zendesk.iter_search_export_all(
+                          criteria_list=['created>=2021-01-01',
+                                         'created<=2021-01-31'])]
+        print('tickets found:', len(ticket_ids))
+
+        # Get the details for all the tickets concurrently
+        tickets = await asyncio.gather(*(zendesk.get(ticket_id=ticket_id)
+                                         for ticket_id in ticket_ids))
+        print('tickets details:', len(tickets))
+
+
+asyncio.run(main())
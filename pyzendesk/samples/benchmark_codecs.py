@@ -0,0 +1,69 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import timeit
+
+from pyzendesk import OrjsonCodec, StandardJsonCodec
+
+
+def build_page(count: int) -> dict:
+    """
+    Build a search export page with sample tickets
+
+    :param count: number of tickets in the page
+    :return: dictionary with the page results
+    """
+    return {
+        'results': [{
+            'id': ticket_id,
+            'url': f'https://example.zendesk.com/api/v2/tickets/'
+                   f'{ticket_id}.json',
+            'subject': f'Sample ticket {ticket_id}',
+            'description': 'Lorem ipsum dolor sit amet àèìòù € ' * 40,
+            'status': 'open',
+            'requester_id': 1000000 + ticket_id,
+            'tags': ['sample', 'benchmark', f'tag{ticket_id % 10}'],
+            'custom_fields': [{'id': field_id, 'value': str(field_id)}
+                              for field_id in range(20)],
+            'via': {'channel': 'email',
+                    'source': {'from': {'address': 'user@example.com'}}},
+            'created_at': '2021-01-01T00:00:00Z'}
+            for ticket_id in range(count)],
+        'meta': {'has_more': True, 'after_cursor': 'abcdef'}}
+
+
+codecs = {'stdlib': StandardJsonCodec()}
+try:
+    codecs['orjson'] = OrjsonCodec()
+except ImportError:
+    print('orjson is not installed, skipping it')
+for count in (100, 1000):
+    data = StandardJsonCodec().dumps(build_page(count=count))
+    page = StandardJsonCodec().loads(data)
+    print(f'Page with {count} tickets, {len(data) / 1024:.0f} KiB')
+    for name, codec in codecs.items():
+        loads = min(timeit.repeat(lambda: codec.loads(data),
+                                  number=10,
+                                  repeat=3)) / 10
+        dumps = min(timeit.repeat(lambda: codec.dumps(page),
+                                  number=10,
+                                  repeat=3)) / 10
+        print(f'  {name:<8} loads: {loads * 1000:8.2f} ms   '
+              f'dumps: {dumps * 1000:8.2f} ms')
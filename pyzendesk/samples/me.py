@@ -21,6 +21,7 @@
 import json
 import os
 
+from pyzendesk import MetricsObserver
 from pyzendesk import Users as ZendeskUsers
 
 
@@ -29,6 +30,11 @@ zendesk = ZendeskUsers(website=os.environ['ZENDESK_SERVER'])
 # Authenticate user
 zendesk.authenticate(username=os.environ['ZENDESK_USERNAME'],
                      password=os.environ['ZENDESK_PASSWORD'])
+# Collect the requests metrics
+metrics = MetricsObserver()
+zendesk.add_observer(observer=metrics)
 # Check my own status
 print(json.dumps(obj=zendesk.me(),
                  indent=4))
+# Show the requests metrics
+print(metrics.get_prometheus_text())
@@ -21,6 +21,10 @@
 import os
 
 from pyzendesk import Attachments as ZendeskAttachments
+from pyzendesk import FileCheckpointStore
+from pyzendesk import JsonLinesExporter
+from pyzendesk import MemoryUploadCache
+from pyzendesk import Profiler
 from pyzendesk import Tickets as ZendeskTickets
 from pyzendesk import (TICKET_STATUS_NEW,
                        TICKET_STATUS_OPEN,
@@ -51,6 +55,14 @@ tickets = zendesk.search_all(criteria_list=['created>=2021-01-01',
                                             'created<=2021-01-31'])
 print('tickets details:', len(tickets['results']))
 
+# Get all the tickets with their requesters and assignees
+tickets = zendesk.search_all(criteria_list=['created>=2021-01-01',
+                                            'created<=2021-01-31'],
+                             include=['users'])
+users = zendesk.index_sideloads(results=tickets, sideloads=['users'])['users']
+for ticket in tickets['results']:
+    print('ticket requester:', users[ticket['requester_id']]['email'])
+
 # Get the tickets details from 2021-01-01 to 2021-01-31 using export API
 tickets = zendesk.search_export(criteria_list=['created>=2021-01-01',
                                                'created<=2021-01-31'])
@@ -61,6 +73,37 @@ tickets = zendesk.search_export_all(criteria_list=['created>=2021-01-01',
                                                    'created<=2021-01-31'])
 print('tickets details:', len(tickets['results']))
 
+# Show where the time is spent for each page of the export
+profiler = Profiler()
+zendesk.set_profiler(profiler=profiler)
+tickets = zendesk.search_export_all(criteria_list=['created>=2021-01-01',
+                                                   'created<=2021-01-31'])
+zendesk.set_profiler(profiler=None)
+print(profiler.get_summary())
+
+# Process the tickets from 2021-01-01 to 2021-01-31 one at a time
+for ticket in zendesk.iter_search_export_all(
+        criteria_list=['created>=2021-01-01',
+                       'created<=2021-01-31']):
+    print('ticket details:', ticket['id'])
+
+# Process the tickets changed since the last run using the incremental export
+checkpoints = FileCheckpointStore(filename='checkpoints.json')
+for ticket in zendesk.iter_incremental_export(start_time=1609459200,
+                                              checkpoint_store=checkpoints):
+    print('ticket changed:', ticket['id'])
+
+# Save the tickets from 2021 to a compressed JSONL file, resuming the
+# export from the last written page if it was interrupted
+exporter = JsonLinesExporter(filename='tickets-2021.jsonl.gz',
+                             columns=['id', 'subject', 'status'],
+                             compress=True,
+                             checkpoint_store=checkpoints)
+count = zendesk.save_search_export(exporter=exporter,
+                                   criteria_list=['created>=2021-01-01',
+                                                  'created<=2021-12-31'])
+print('tickets saved:', count)
+
 # Get details for the first ticket using its ID
 ticket_id = tickets['results'][0]['id']
 ticket = zendesk.get(ticket_id=ticket_id)
@@ -94,13 +137,19 @@ print('ticket details:', ticket)
 attachments = ZendeskAttachments(website=os.environ['ZENDESK_SERVER'])
 attachments.authenticate(username=os.environ['ZENDESK_USERNAME'],
                          password=os.environ['ZENDESK_PASSWORD'])
-with open(__file__, 'rb') as file:
-    attachment_content = file.read()
+# Reuse the upload tokens for the files already uploaded
+attachments.set_upload_cache(upload_cache=MemoryUploadCache())
+
+# Download the attachments of the first ticket comments
+for download in attachments.iter_download_many(records=[comments],
+                                               directory='attachments'):
+    print('attachment downloaded:', download['filename'],
+          download['success'])
 
 # Add private comment to a ticket with attachments
 attachment = attachments.upload(content_type='text/plain',
                                 filename='test.py',
-                                data=attachment_content)
+                                data=__file__)
 attachment_token = attachment['upload']['token']
 ticket = zendesk.add_private_comment(ticket_id=ticket_id,
                                      text='With attachment',
@@ -109,9 +158,10 @@ ticket = zendesk.add_private_comment(ticket_id=ticket_id,
 print('tickets details:', ticket)
 
 # Add public comment to a ticket with attachments
-attachment = attachments.upload(content_type='text/plain',
-                                filename='test.py',
-                                data=attachment_content)
+with open(__file__, 'rb') as file:
+    attachment = attachments.upload(content_type='text/plain',
+                                    filename='test.py',
+                                    data=file)
 attachment_token = attachment['upload']['token']
 ticket = zendesk.add_public_comment(ticket_id=ticket_id,
                                     text='With attachment',
@@ -119,6 +169,15 @@ ticket = zendesk.add_public_comment(ticket_id=ticket_id,
                                     status=TICKET_STATUS_PENDING)
 print('ticket details:', ticket)
 
+# Add public comment to a ticket with many attachments uploaded concurrently
+attachment_tokens = attachments.upload_many(attachments=[__file__,
+                                                         'README.md'])
+ticket = zendesk.add_public_comment(ticket_id=ticket_id,
+                                    text='With many attachments',
+                                    attachments=attachment_tokens,
+                                    status=TICKET_STATUS_PENDING)
+print('ticket details:', ticket)
+
 # Change ticket status
 for status in (TICKET_STATUS_NEW,
                TICKET_STATUS_OPEN,
@@ -22,6 +22,7 @@ import json
 import os
 
 from pyzendesk import constants
+from pyzendesk import FileCheckpointStore
 from pyzendesk import Users as ZendeskUsers
 
 
@@ -46,6 +47,12 @@ users = zendesk.search_all(criteria_list=['created>=2021-01-01',
                                           'created<=2021-01-31'])
 print('users details:', len(users['users']))
 
+# Process the users changed since the last run using the incremental export
+checkpoints = FileCheckpointStore(filename='checkpoints.json')
+for user in zendesk.iter_incremental_export(start_time=1609459200,
+                                            checkpoint_store=checkpoints):
+    print('user changed:', user['id'])
+
 # Get user details
 user = zendesk.get(user_id=users['users'][0]['id'])
 print(json.dumps(obj=user,
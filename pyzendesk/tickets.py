@@ -18,9 +18,15 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 ##
 
-from typing import Any, Optional
+import collections
+from typing import Any, Callable, Iterable, Iterator, Optional
 
-from .api import Api
+from .api import Api, ApiError
+from .checkpoints import CheckpointStore
+from .constants import REFERENCED_EMAILS_MAX_ENTRIES, SHOW_MANY_MAX_IDS
+from .exporters import Exporter
+from .incremental import IncrementalExportMixin
+from .jobs import JobStatus, JobSubmitError
 
 TICKET_STATUS_NEW = 'new'
 TICKET_STATUS_OPEN = 'open'
@@ -30,15 +36,76 @@ TICKET_STATUS_SOLVED = 'solved'
 TICKET_STATUS_CLOSED = 'closed'
 
 
-class Tickets(Api):
-    def get(self, ticket_id: int) -> dict:
+class Tickets(Api, IncrementalExportMixin):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Requester email addresses for the referenced tickets, with least
+        # recently used eviction
+        self._referenced_emails = collections.OrderedDict()
+
+    def get(self,
+            ticket_id: int,
+            include: Optional[list[str]] = None) -> dict:
         """
         Get a ticket details
 
         :param ticket_id: ticket ID to get data from
+        :param include: list of related records to side-load
+                        (like users, groups, organizations) or None
         :return: dictionary with the ticket details
         """
-        return self.request_get(path=f'tickets/{ticket_id}.json')
+        query = f'?include={",".join(include)}' if include else ''
+        return self.request_get(path=f'tickets/{ticket_id}.json{query}',
+                                cached=True)
+
+    def get_many(self,
+                 ticket_ids: Iterable[int],
+                 chunk_size: int = SHOW_MANY_MAX_IDS,
+                 max_workers: int = 4) -> dict:
+        """
+        Get many tickets details using concurrent requests for chunks of IDs
+
+        :param ticket_ids: list of tickets ID to get data from
+        :param chunk_size: maximum number of IDs for each request
+        :param max_workers: maximum number of concurrent requests
+        :return: dictionary with the tickets details in the same order
+                 of the IDs and the list of the IDs not found
+        """
+        missing_ids = []
+        try:
+            tickets = list(self.iter_many(ticket_ids=ticket_ids,
+                                          chunk_size=chunk_size,
+                                          max_workers=max_workers,
+                                          missing_ids=missing_ids))
+        except ApiError as error:
+            return error.results
+        return {'tickets': tickets,
+                'count': len(tickets),
+                'missing_ids': missing_ids}
+
+    def iter_many(self,
+                  ticket_ids: Iterable[int],
+                  chunk_size: int = SHOW_MANY_MAX_IDS,
+                  max_workers: int = 4,
+                  missing_ids: Optional[list[int]] = None) -> Iterator[dict]:
+        """
+        Get many tickets details one at a time using concurrent requests for
+        chunks of IDs
+
+        :param ticket_ids: list of tickets ID to get data from
+        :param chunk_size: maximum number of IDs for each request
+        :param max_workers: maximum number of concurrent requests
+        :param missing_ids: list to fill with the IDs not found or None
+        :return: iterator over the tickets details in the same order of
+                 the IDs
+        :raise ApiError: if any request returned an error
+        """
+        return self.iter_show_many(path='tickets/show_many.json',
+                                   key='tickets',
+                                   ids=ticket_ids,
+                                   chunk_size=chunk_size,
+                                   max_workers=max_workers,
+                                   missing_ids=missing_ids)
 
     def get_comments(self, ticket_id: int) -> dict:
         """
@@ -47,7 +114,8 @@ class Tickets(Api):
         :param ticket_id: ticket ID to get data from
         :return: dictionary with the ticket details
         """
-        return self.request_get(path=f'tickets/{ticket_id}/comments.json')
+        return self.request_get(path=f'tickets/{ticket_id}/comments.json',
+                                cached=True)
 
     def get_comments_all(self, ticket_id: int) -> dict:
         """
@@ -56,31 +124,32 @@ class Tickets(Api):
         :param ticket_id: ticket ID to get data from
         :return: dictionary with the ticket details
         """
-        results = {}
-        current_page = 0
-        next_page_url = 'initial value'
-        # Copy the criteria list which will be changed during the loop
-        while next_page_url:
-            current_page += 1
-            search_results = self.request_get(
-                path=f'tickets/{ticket_id}/comments.json?page={current_page}')
-            if not results:
-                # First page of results
-                results = search_results
-            elif 'error' in search_results:
-                # Too many results, search interrupted server side
-                results['error'] = search_results['error']
-                results['description'] = search_results['description']
-            else:
-                # Append results
-                results['comments'].extend(search_results['comments'])
-            if 'error' not in search_results:
-                # Continue processing the next page
-                next_page_url = search_results['next_page']
-            else:
-                # Stop search if any error occurred
-                next_page_url = None
-        return results
+        return self.merge_pages(
+            pages=self.get_comments_pages(ticket_id=ticket_id),
+            key='comments')
+
+    def get_comments_pages(self, ticket_id: int) -> Iterator[dict]:
+        """
+        Get all ticket comments pages
+
+        :param ticket_id: ticket ID to get data from
+        :return: iterator over the comments pages
+        """
+        return self.paginate(
+            request_page=lambda page: self.request_get(
+                path=f'tickets/{ticket_id}/comments.json?page={page}'))
+
+    def iter_comments_all(self, ticket_id: int) -> Iterator[dict]:
+        """
+        Get all ticket comments one at a time, as soon as each page arrives
+
+        :param ticket_id: ticket ID to get data from
+        :return: iterator over the ticket comments
+        :raise ApiError: if any page returned an error
+        """
+        return self.iter_records(
+            pages=self.get_comments_pages(ticket_id=ticket_id),
+            key='comments')
 
     def count(self, criteria_list: list) -> Optional[int]:
         """
@@ -94,52 +163,70 @@ class Tickets(Api):
             path=f'search/count?query=type:ticket {criteria}')
         return results.get('count')
 
-    def search(self, criteria_list: list) -> dict:
+    def search(self,
+               criteria_list: list,
+               include: Optional[list[str]] = None) -> dict:
         """
         Get the tickets matching the specified criterias
 
         :param criteria_list: list of string criterias
+        :param include: list of related records to side-load
+                        (like users, groups, organizations) or None
         :return: dictionary with tickets details found
         """
         criteria = ' '.join(criteria_list)
+        query = f'&include=tickets({",".join(include)})' if include else ''
         return self.request_get(
-            path=f'search?query=type:ticket {criteria}')
+            path=f'search?query=type:ticket {criteria}{query}')
 
-    def search_all(self, criteria_list: list) -> dict:
+    def search_all(self,
+                   criteria_list: list,
+                   include: Optional[list[str]] = None) -> dict:
         """
         Get the tickets matching the specified criterias processing all the
-        results by requesting also the next pages
+        results by requesting also the next pages.
+        The side-loaded records are merged across the pages and they can be
+        indexed by ID using index_sideloads.
 
         :param criteria_list: list of string criterias
+        :param include: list of related records to side-load
+                        (like users, groups, organizations) or None
         :return: dictionary with tickets details found
         """
-        results = {}
-        current_page = 0
-        next_page_url = 'initial value'
-        # Copy the criteria list which will be changed during the loop
-        criteria_list = criteria_list.copy()
-        while next_page_url:
-            current_page += 1
-            criteria_list.append(f'&page={current_page}')
-            search_results = self.search(criteria_list=criteria_list)
-            if not results:
-                # First page of results
-                results = search_results
-            elif 'error' in search_results:
-                # Too many results, search interrupted server side
-                results['error'] = search_results['error']
-                results['description'] = search_results['description']
-            else:
-                # Append results
-                results['results'].extend(search_results['results'])
-            if 'error' not in search_results:
-                # Continue processing the next page
-                next_page_url = search_results['next_page']
-            else:
-                # Stop search if any error occurred
-                next_page_url = None
-            criteria_list.remove(f'&page={current_page}')
-        return results
+        return self.merge_pages(
+            pages=self.search_pages(criteria_list=criteria_list,
+                                    include=include),
+            key='results',
+            sideloads=include)
+
+    def search_pages(self,
+                     criteria_list: list,
+                     include: Optional[list[str]] = None) -> Iterator[dict]:
+        """
+        Get the tickets pages matching the specified criterias
+
+        :param criteria_list: list of string criterias
+        :param include: list of related records to side-load
+                        (like users, groups, organizations) or None
+        :return: iterator over the tickets pages
+        """
+        return self.paginate(
+            request_page=lambda page: self.search(
+                criteria_list=[*criteria_list, f'&page={page}'],
+                include=include))
+
+    def iter_search_all(self, criteria_list: list) -> Iterator[dict]:
+        """
+        Get the tickets matching the specified criterias one at a time,
+        as soon as each page arrives
+
+        :param criteria_list: list of string criterias
+        :return: iterator over the tickets found
+        :raise ApiError: if any page returned an error
+        """
+        return self.iter_records(
+            pages=self.search_pages(criteria_list=criteria_list),
+            key='results')
 
     def search_export(self, criteria_list: list) -> dict:
         """
@@ -149,9 +236,8 @@ class Tickets(Api):
         :param criteria_list: list of string criterias
         :return: dictionary with tickets details found
         """
-        criteria = ' '.join(criteria_list)
-        return self.request_get(
-            path=f'search/export?filter[type]=ticket&query={criteria}')
+        return self.request_get(path=self._get_search_export_path(
+            criteria_list=criteria_list))
 
     def search_export_all(self, criteria_list: list) -> dict:
         """
@@ -161,32 +247,163 @@ class Tickets(Api):
         :param criteria_list: list of string criterias
         :return: dictionary with tickets details found
         """
-        results = {}
-        next_token = 'initial value'
-        # Copy the criteria list which will be changed during the loop
-        criteria_list = criteria_list.copy()
-        while next_token:
-            search_results = self.search_export(criteria_list=criteria_list)
-            if not results:
-                # First page of results
-                results = search_results
-            elif 'error' in search_results:
-                # Too many results, search interrupted server side
-                results['error'] = search_results['error']
-                results['description'] = search_results['description']
-            else:
-                # Append results
-                results['results'].extend(search_results['results'])
-            if f'&page[after]={next_token}' in criteria_list:
-                criteria_list.remove(f'&page[after]={next_token}')
-            if search_results['meta']['has_more']:
-                # Continue processing the next page
-                next_token = search_results['meta']['after_cursor']
-            else:
-                # Stop search if any error occurred
-                next_token = None
-            criteria_list.append(f'&page[after]={next_token}')
-        return results
+        return self.merge_pages(
+            pages=self.search_export_pages(criteria_list=criteria_list),
+            key='results')
+
+    def search_export_pages(self,
+                            criteria_list: list,
+                            after_cursor: Optional[str] = None
+                            ) -> Iterator[dict]:
+        """
+        Get the tickets pages matching the specified criterias
+        using the search export API
+
+        :param criteria_list: list of string criterias
+        :param after_cursor: cursor to start from or None for the first page
+        :return: iterator over the tickets pages
+        """
+        return self.paginate_cursor(
+            request_page=lambda cursor: self.search_export(
+                criteria_list=(criteria_list
+                               if cursor is None
+                               else [*criteria_list,
+                                     f'&page[after]={cursor}'])),
+            after_cursor=after_cursor)
+
+    def iter_search_export_all(self,
+                               criteria_list: list,
+                               stream: bool = False) -> Iterator[dict]:
+        """
+        Get the tickets matching the specified criterias one at a time
+        using the search export API, as soon as each page arrives.
+        When stream is set, each record is decoded as soon as it arrives
+        instead of loading the whole page.
+
+        :param criteria_list: list of string criterias
+        :param stream: decode the records incrementally from the responses
+        :return: iterator over the tickets found
+        :raise ApiError: if any page returned an error
+        """
+        if stream:
+            return self.iter_stream_records(
+                request_page=lambda cursor: self.request_stream(
+                    method='get',
+                    path=self._get_search_export_path(
+                        criteria_list=(criteria_list
+                                       if cursor is None
+                                       else [*criteria_list,
+                                             f'&page[after]={cursor}'])),
+                    key='results'),
+                get_cursor=self.get_next_cursor)
+        return self.iter_records(
+            pages=self.search_export_pages(criteria_list=criteria_list),
+            key='results')
+
+    def save_search_export(self,
+                           exporter: Exporter,
+                           criteria_list: list) -> int:
+        """
+        Save the tickets matching the specified criterias to a file
+        using the search export API, writing each page as soon as it arrives.
+        The export resumes from the last written page if the exporter
+        has a checkpoint store.
+
+        :param exporter: exporter used to write the tickets
+        :param criteria_list: list of string criterias
+        :return: number of tickets written
+        :raise ApiError: if any page returned an error
+        """
+        return exporter.export(
+            request_pages=lambda cursor: self.search_export_pages(
+                criteria_list=criteria_list,
+                after_cursor=cursor),
+            key='results',
+            get_cursor=self.get_next_cursor)
+
+    def incremental_export(self,
+                           start_time: int = 0,
+                           cursor: Optional[str] = None) -> dict:
+        """
+        Get the tickets changed after a start time or a cursor
+        using the cursor based incremental export API
+
+        :param start_time: UNIX time to start from for the first request
+        :param cursor: cursor returned by a previous request or None to use
+                       the start time
+        :return: dictionary with tickets details found
+        """
+        return self.incremental_export_resource(resource='tickets',
+                                                start_time=start_time,
+                                                cursor=cursor)
+
+    def incremental_export_pages(self,
+                                 start_time: int = 0,
+                                 cursor: Optional[str] = None
+                                 ) -> Iterator[dict]:
+        """
+        Get the tickets pages changed after a start time or a cursor
+        using the cursor based incremental export API
+
+        :param start_time: UNIX time to start from for the first request
+        :param cursor: cursor returned by a previous request or None to use
+                       the start time
+        :return: iterator over the tickets pages
+        """
+        return self.incremental_export_resource_pages(resource='tickets',
+                                                      start_time=start_time,
+                                                      cursor=cursor)
+
+    def iter_incremental_export(
+            self,
+            start_time: int = 0,
+            cursor: Optional[str] = None,
+            checkpoint_store: Optional[CheckpointStore] = None,
+            checkpoint_key: str = 'tickets',
+            stream: bool = False) -> Iterator[dict]:
+        """
+        Get the tickets changed after a start time or a cursor one at a time
+        using the cursor based incremental export API.
+        When a checkpoint store is passed, the export resumes from the saved
+        cursor and the cursor is saved after every processed page.
+        When stream is set, each record is decoded as soon as it arrives
+        instead of loading the whole page.
+
+        :param start_time: UNIX time to start from if no cursor is available
+        :param cursor: cursor to start from or None to use the saved
+                       checkpoint or the start time
+        :param checkpoint_store: store to load and save the cursor or None
+        :param checkpoint_key: checkpoint name used to save the cursor
+        :param stream: decode the records incrementally from the responses
+        :return: iterator over the tickets found
+        :raise ApiError: if any page returned an error
+        """
+        return self.iter_incremental_export_resource(
+            resource='tickets',
+            start_time=start_time,
+            cursor=cursor,
+            checkpoint_store=checkpoint_store,
+            checkpoint_key=checkpoint_key,
+            stream=stream)
+
+    def save_incremental_export(self,
+                                exporter: Exporter,
+                                start_time: int = 0) -> int:
+        """
+        Save the tickets changed after a start time to a file
+        using the cursor based incremental export API, writing each page
+        as soon as it arrives.
+        The export resumes from the last written page if the exporter
+        has a checkpoint store.
+
+        :param exporter: exporter used to write the tickets
+        :param start_time: UNIX time to start from
+        :return: number of tickets written
+        :raise ApiError: if any page returned an error
+        """
+        return self.save_incremental_export_resource(resource='tickets',
+                                                     exporter=exporter,
+                                                     start_time=start_time)
 
     def add_comment(self,
                     ticket_id: int,
@@ -215,8 +432,11 @@ class Tickets(Api):
         }
         if status is not None:
             ticket_data['ticket']['status'] = status
-        return self.request_put(path=f'tickets/{ticket_id}.json',
-                                json=ticket_data)
+        results = self.request_put(path=f'tickets/{ticket_id}.json',
+                                   json=ticket_data)
+        if 'error' not in results:
+            self.invalidate_cache(path=f'tickets/{ticket_id}')
+        return results
 
     def add_private_comment(self,
                             ticket_id: int,
@@ -266,12 +486,15 @@ class Tickets(Api):
         :param status: new ticket status
         :return: updated ticket details
         """
-        return self.request_put(path=f'tickets/{ticket_id}.json',
-                                json={
-                                    'ticket': {
-                                        'status': status
-                                    }
-                                })
+        results = self.request_put(path=f'tickets/{ticket_id}.json',
+                                   json={
+                                       'ticket': {
+                                           'status': status
+                                       }
+                                   })
+        if 'error' not in results:
+            self.invalidate_cache(path=f'tickets/{ticket_id}')
+        return results
 
     def get_custom_field(self,
                          ticket: dict,
@@ -285,9 +508,65 @@ class Tickets(Api):
         :param default: default value for value not found
         :return: custom field value or default value
         """
-        return ([field['value']
-                 for field in ticket['custom_fields']
-                 if field['id'] == field_id] or [default])[0]
+        return next((field['value']
+                     for field in ticket['custom_fields']
+                     if field['id'] == field_id), default)
+
+    def get_custom_fields(self, ticket: dict) -> dict[int, Any]:
+        """
+        Get all the custom field values from a Zendesk ticket body,
+        indexed by field ID for repeated lookups
+
+        :param ticket: dictionary with ticket body
+        :return: dictionary with the custom field values by field ID
+        """
+        return {field['id']: field['value']
+                for field in ticket['custom_fields']}
+
+    def extract_custom_fields(
+            self,
+            tickets: Iterable[dict],
+            field_ids: list[int],
+            defaults: Optional[dict[int, Any]] = None,
+            converters: Optional[dict[int, Callable[[Any], Any]]] = None
+            ) -> dict[Any, list]:
+        """
+        Extract the custom field values from many Zendesk ticket bodies as
+        columns, processing every ticket only once
+
+        :param tickets: iterable over the dictionaries with ticket body
+        :param field_ids: list of field IDs to extract
+        :param defaults: dictionary with the default value for each field
+                         ID, for the values not found or empty
+        :param converters: dictionary with the function to convert the
+                           values found for each field ID, like int or float
+        :return: dictionary with the list of ticket IDs under the id key and
+                 the list of values under each field ID key
+        """
+        defaults = defaults or {}
+        converters = converters or {}
+        ticket_ids = []
+        columns = {'id': ticket_ids}
+        extractors = []
+        for field_id in field_ids:
+            columns[field_id] = []
+            extractors.append((field_id,
+                               columns[field_id].append,
+                               defaults.get(field_id),
+                               converters.get(field_id)))
+        for ticket in tickets:
+            ticket_ids.append(ticket['id'])
+            values = {field['id']: field['value']
+                      for field in ticket['custom_fields']}
+            for field_id, append, default, converter in extractors:
+                value = values.get(field_id)
+                if value is None:
+                    append(default)
+                elif converter is None:
+                    append(value)
+                else:
+                    append(converter(value))
+        return columns
 
     def update_custom_fields(self, ticket_id: int, fields: dict) -> dict:
         """
@@ -299,12 +578,283 @@ class Tickets(Api):
         """
         data = [{'id': key, 'value': value}
                 for key, value in fields.items()]
-        return self.request_put(path=f'tickets/{ticket_id}.json',
-                                json={
-                                    'ticket': {
-                                        'custom_fields': data
-                                    }
-                                })
+        results = self.request_put(path=f'tickets/{ticket_id}.json',
+                                   json={
+                                       'ticket': {
+                                           'custom_fields': data
+                                       }
+                                   })
+        if 'error' not in results:
+            self.invalidate_cache(path=f'tickets/{ticket_id}')
+        return results
+
+    def update_many(self,
+                    ticket_ids: Iterable[int],
+                    ticket: dict,
+                    chunk_size: int = SHOW_MANY_MAX_IDS,
+                    max_jobs: int = 10,
+                    poll_interval: float = 1.0) -> list[JobStatus]:
+        """
+        Apply the same changes to many tickets using background jobs,
+        splitting the IDs in chunks and keeping a limited number of jobs
+        in progress
+
+        :param ticket_ids: list of tickets ID to update
+        :param ticket: dictionary with the changes to apply to every ticket
+        :param chunk_size: maximum number of tickets for each job
+        :param max_jobs: maximum number of jobs in progress
+        :param poll_interval: delay in seconds before the first job check
+        :return: list of finished job handles
+        :raise JobSubmitError: if any request returned an error, with all
+                               the jobs already submitted
+        """
+        def submit(chunk: list[int]) -> JobStatus:
+            results = self.request_put(
+                path=f'tickets/update_many.json?'
+                     f'ids={",".join(map(str, chunk))}',
+                json={'ticket': ticket})
+            if 'error' in results:
+                raise ApiError(results=results)
+            for ticket_id in chunk:
+                self.invalidate_cache(path=f'tickets/{ticket_id}')
+            return JobStatus(api=self, status=results['job_status'])
+
+        return self._run_update_jobs(
+            submit=submit,
+            chunks=self.iter_chunks(items=dict.fromkeys(ticket_ids),
+                                    chunk_size=chunk_size),
+            max_jobs=max_jobs,
+            poll_interval=poll_interval)
+
+    def update_many_individually(self,
+                                 tickets: Iterable[dict],
+                                 chunk_size: int = SHOW_MANY_MAX_IDS,
+                                 max_jobs: int = 10,
+                                 poll_interval: float = 1.0
+                                 ) -> list[JobStatus]:
+        """
+        Apply different changes to many tickets using background jobs,
+        splitting the tickets in chunks and keeping a limited number of
+        jobs in progress
+
+        :param tickets: list of dictionaries with the changes to apply,
+                        each one containing the ticket ID
+        :param chunk_size: maximum number of tickets for each job
+        :param max_jobs: maximum number of jobs in progress
+        :param poll_interval: delay in seconds before the first job check
+        :return: list of finished job handles
+        :raise JobSubmitError: if any request returned an error, with all
+                               the jobs already submitted
+        """
+        def submit(chunk: list[dict]) -> JobStatus:
+            results = self.request_put(path='tickets/update_many.json',
+                                       json={'tickets': chunk})
+            if 'error' in results:
+                raise ApiError(results=results)
+            for ticket in chunk:
+                self.invalidate_cache(path=f'tickets/{ticket["id"]}')
+            return JobStatus(api=self, status=results['job_status'])
+
+        return self._run_update_jobs(
+            submit=submit,
+            chunks=self.iter_chunks(items=tickets, chunk_size=chunk_size),
+            max_jobs=max_jobs,
+            poll_interval=poll_interval)
+
+    def _run_update_jobs(self,
+                         submit: Callable[[list], JobStatus],
+                         chunks: Iterable[list],
+                         max_jobs: int,
+                         poll_interval: float) -> list[JobStatus]:
+        """
+        Submit the update jobs for many chunks of tickets, keeping a
+        limited number of jobs in progress
+
+        :param submit: function to submit a job for a chunk of tickets
+        :param chunks: iterable over the chunks of tickets
+        :param max_jobs: maximum number of jobs in progress
+        :param poll_interval: delay in seconds before the first job check
+        :return: list of finished job handles
+        :raise JobSubmitError: if any request returned an error, with all
+                               the jobs already submitted
+        """
+        jobs = []
+        try:
+            for _, job in JobStatus.iter_run_many(
+                    submit=submit,
+                    chunks=chunks,
+                    max_jobs=max_jobs,
+                    poll_interval=poll_interval):
+                jobs.append(job)
+        except JobSubmitError as error:
+            # Include the jobs already finished
+            error.jobs[:0] = jobs
+            raise
+        return jobs
+
+    def add_comment_many(self,
+                         ticket_ids: Iterable[int],
+                         public: bool,
+                         text: str,
+                         attachments: Optional[list[str]],
+                         status: str = None) -> list[JobStatus]:
+        """
+        Add the same comment to many tickets using background jobs
+
+        :param ticket_ids: list of tickets ID to update
+        :param public: boolean value to make the comment public
+        :param text: text to add to the tickets
+        :param attachments: list of tokens for attached files
+        :param status: new status after the saving the comment
+        :return: list of finished job handles
+        :raise JobSubmitError: if any request returned an error, with all
+                               the jobs already submitted
+        """
+        ticket_data = {
+            'comment': {
+                'public': public,
+                'body': text,
+                'uploads': attachments
+            }
+        }
+        if status is not None:
+            ticket_data['status'] = status
+        return self.update_many(ticket_ids=ticket_ids,
+                                ticket=ticket_data)
+
+    def set_status_many(self,
+                        ticket_ids: Iterable[int],
+                        status: str) -> list[JobStatus]:
+        """
+        Update many tickets status using background jobs
+
+        :param ticket_ids: list of tickets ID to update
+        :param status: new tickets status
+        :return: list of finished job handles
+        :raise JobSubmitError: if any request returned an error, with all
+                               the jobs already submitted
+        """
+        return self.update_many(ticket_ids=ticket_ids,
+                                ticket={'status': status})
+
+    def update_custom_fields_many(self,
+                                  ticket_ids: Iterable[int],
+                                  fields: dict) -> list[JobStatus]:
+        """
+        Update the same custom fields for many tickets using background jobs
+
+        :param ticket_ids: list of tickets ID to update
+        :param fields: dictionary object with key as field ID
+        :return: list of finished job handles
+        :raise JobSubmitError: if any request returned an error, with all
+                               the jobs already submitted
+        """
+        data = [{'id': key, 'value': value}
+                for key, value in fields.items()]
+        return self.update_many(ticket_ids=ticket_ids,
+                                ticket={'custom_fields': data})
+
+    def delete_many(self,
+                    ticket_ids: Iterable[int],
+                    chunk_size: int = SHOW_MANY_MAX_IDS,
+                    max_jobs: int = 10,
+                    poll_interval: float = 1.0) -> list[dict]:
+        """
+        Delete many tickets using background jobs for chunks of IDs
+
+        :param ticket_ids: list of tickets ID to delete
+        :param chunk_size: maximum number of tickets for each job
+        :param max_jobs: maximum number of jobs in progress
+        :param poll_interval: delay in seconds before the first job check
+        :return: list with the results for each ticket ID
+        :raise ApiError: if any job submission returned an error
+        """
+        return list(self.iter_delete_many(ticket_ids=ticket_ids,
+                                          chunk_size=chunk_size,
+                                          max_jobs=max_jobs,
+                                          poll_interval=poll_interval))
+
+    def iter_delete_many(self,
+                         ticket_ids: Iterable[int],
+                         chunk_size: int = SHOW_MANY_MAX_IDS,
+                         max_jobs: int = 10,
+                         poll_interval: float = 1.0) -> Iterator[dict]:
+        """
+        Delete many tickets using background jobs for chunks of IDs,
+        keeping a limited number of jobs in progress
+
+        :param ticket_ids: list of tickets ID to delete
+        :param chunk_size: maximum number of tickets for each job
+        :param max_jobs: maximum number of jobs in progress
+        :param poll_interval: delay in seconds before the first job check
+        :return: iterator over the results for each ticket ID, in the same
+                 order of the IDs, with the ticket ID, the success status
+                 and the job result
+        :raise ApiError: if any job submission returned an error
+        """
+        for item_results in JobStatus.iter_run_many_ids(
+                api=self,
+                method='delete',
+                path='tickets/destroy_many.json',
+                ids=ticket_ids,
+                chunk_size=chunk_size,
+                max_jobs=max_jobs,
+                poll_interval=poll_interval):
+            self.invalidate_cache(path=f'tickets/{item_results["item"]}')
+            yield {'ticket_id': item_results['item'],
+                   'success': item_results['success'],
+                   'result': item_results['result']}
+
+    def purge_many(self,
+                   ticket_ids: Iterable[int],
+                   chunk_size: int = SHOW_MANY_MAX_IDS,
+                   max_jobs: int = 10,
+                   poll_interval: float = 1.0) -> list[dict]:
+        """
+        Permanently delete many deleted tickets using background jobs for
+        chunks of IDs
+
+        :param ticket_ids: list of tickets ID to delete permanently
+        :param chunk_size: maximum number of tickets for each job
+        :param max_jobs: maximum number of jobs in progress
+        :param poll_interval: delay in seconds before the first job check
+        :return: list with the results for each ticket ID
+        :raise ApiError: if any job submission returned an error
+        """
+        return list(self.iter_purge_many(ticket_ids=ticket_ids,
+                                         chunk_size=chunk_size,
+                                         max_jobs=max_jobs,
+                                         poll_interval=poll_interval))
+
+    def iter_purge_many(self,
+                        ticket_ids: Iterable[int],
+                        chunk_size: int = SHOW_MANY_MAX_IDS,
+                        max_jobs: int = 10,
+                        poll_interval: float = 1.0) -> Iterator[dict]:
+        """
+        Permanently delete many deleted tickets using background jobs for
+        chunks of IDs, keeping a limited number of jobs in progress
+
+        :param ticket_ids: list of tickets ID to delete permanently
+        :param chunk_size: maximum number of tickets for each job
+        :param max_jobs: maximum number of jobs in progress
+        :param poll_interval: delay in seconds before the first job check
+        :return: iterator over the results for each ticket ID, in the same
+                 order of the IDs, with the ticket ID, the success status
+                 and the job result
+        :raise ApiError: if any job submission returned an error
+        """
+        for item_results in JobStatus.iter_run_many_ids(
+                api=self,
+                method='delete',
+                path='deleted_tickets/destroy_many',
+                ids=ticket_ids,
+                chunk_size=chunk_size,
+                max_jobs=max_jobs,
+                poll_interval=poll_interval):
+            yield {'ticket_id': item_results['item'],
+                   'success': item_results['success'],
+                   'result': item_results['result']}
 
     def get_requester_email(self, ticket: dict) -> Optional[str]:
         """
@@ -322,12 +872,118 @@ class Tickets(Api):
                 result = from_data['address'].lower()
             elif 'ticket_id' in from_data:
                 # Missing requester address, check in the referenced ticket
-                search_results = self.get(ticket_id=from_data['ticket_id'])
-                from_data = search_results['ticket']['via']['source']['from']
-                result = from_data['address'].lower()
+                referenced_id = from_data['ticket_id']
+                if referenced_id in self._referenced_emails:
+                    self._referenced_emails.move_to_end(referenced_id)
+                    result = self._referenced_emails[referenced_id]
+                else:
+                    search_results = self.get(ticket_id=referenced_id)
+                    result = self.get_source_address(
+                        ticket=search_results['ticket'])
+                    self._remember_referenced_email(ticket_id=referenced_id,
+                                                    email=result)
             else:
                 # Missing fields for email address
                 raise KeyError
         except KeyError:
             result = None
         return result
+
+    def get_requester_emails(self,
+                             tickets: Iterable[dict],
+                             max_workers: int = 4) -> dict[int, Optional[str]]:
+        """
+        Get the sender addresses for many ticket dictionaries.
+        The tickets referenced by the followups missing a valid address are
+        requested only once, in bulk, and the addresses of the tickets found
+        are remembered for the following calls.
+
+        :param tickets: list of dictionaries with ticket body
+        :param max_workers: maximum number of concurrent requests
+        :return: dictionary with the requester email address for each
+                 ticket ID
+        :raise ApiError: if any request returned an error
+        """
+        results = {}
+        referenced = {}
+        for ticket in tickets:
+            try:
+                from_data = ticket['via']['source']['from']
+            except KeyError:
+                from_data = {}
+            if 'address' in from_data:
+                # Requester email address
+                results[ticket['id']] = from_data['address'].lower()
+            elif 'ticket_id' in from_data:
+                # Missing requester address, check in the referenced ticket
+                referenced[ticket['id']] = from_data['ticket_id']
+            else:
+                # Missing fields for email address
+                results[ticket['id']] = None
+        emails = {}
+        missing_ids = []
+        for referenced_id in dict.fromkeys(referenced.values()):
+            if referenced_id in self._referenced_emails:
+                self._referenced_emails.move_to_end(referenced_id)
+                emails[referenced_id] = self._referenced_emails[referenced_id]
+            else:
+                missing_ids.append(referenced_id)
+        if missing_ids:
+            for referenced_ticket in self.iter_many(ticket_ids=missing_ids,
+                                                    max_workers=max_workers):
+                emails[referenced_ticket['id']] = self.get_source_address(
+                    ticket=referenced_ticket)
+                self._remember_referenced_email(
+                    ticket_id=referenced_ticket['id'],
+                    email=emails[referenced_ticket['id']])
+        for ticket_id, referenced_id in referenced.items():
+            # The referenced tickets not found are not remembered
+            results[ticket_id] = emails.get(referenced_id)
+        return results
+
+    def get_source_address(self, ticket: Optional[dict]) -> Optional[str]:
+        """
+        Get the sender address from a ticket dictionary, without checking
+        the referenced tickets
+
+        :param ticket: dictionary with ticket body
+        :return: sender email address
+        """
+        try:
+            return ticket['via']['source']['from']['address'].lower()
+        except (KeyError, TypeError):
+            return None
+
+    def clear_requester_emails(self) -> None:
+        """
+        Forget the remembered addresses for the referenced tickets
+
+        :return: None
+        """
+        self._referenced_emails.clear()
+
+    def _remember_referenced_email(self,
+                                   ticket_id: int,
+                                   email: Optional[str]) -> None:
+        """
+        Remember the requester address of a referenced ticket, forgetting
+        the least recently used addresses above the limit
+
+        :param ticket_id: referenced ticket ID
+        :param email: requester email address
+        :return: None
+        """
+        self._referenced_emails[ticket_id] = email
+        self._referenced_emails.move_to_end(ticket_id)
+        while len(self._referenced_emails) > REFERENCED_EMAILS_MAX_ENTRIES:
+            self._referenced_emails.popitem(last=False)
+
+    def _get_search_export_path(self, criteria_list: list) -> str:
+        """
+        Get the API path for the search export
+
+        :param criteria_list: list of string criterias
+        :return: API path for the search export page
+        """
+        criteria = ' '.join(criteria_list)
+        return f'search/export?filter[type]=ticket&query={criteria}'
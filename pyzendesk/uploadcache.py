@@ -0,0 +1,177 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import collections
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+# Default time to live for the cached uploads, shorter than the
+# 60 minutes lifetime of the Zendesk upload tokens
+UPLOAD_TOKEN_TTL = 55 * 60.0
+
+
+class UploadCache(object):
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Get the results of a previous upload
+
+        :param key: upload key
+        :return: upload results or None if missing or expired
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, results: dict) -> None:
+        """
+        Save the results of an upload
+
+        :param key: upload key
+        :param results: upload results
+        :return: None
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def get_key(digest: str, filename: str, content_type: str) -> str:
+        """
+        Get the key identifying an upload
+
+        :param digest: SHA-256 hex digest of the uploaded data
+        :param filename: filename for the uploaded file
+        :param content_type: HTTP content_type
+        :return: upload key
+        """
+        return hashlib.sha256(
+            json.dumps([digest, filename, content_type]).encode('utf-8')
+        ).hexdigest()
+
+
+class MemoryUploadCache(UploadCache):
+    def __init__(self,
+                 ttl: float = UPLOAD_TOKEN_TTL,
+                 max_entries: int = 1024):
+        """
+        Cache for the uploads results kept in memory, with least recently
+        used eviction
+
+        :param ttl: time to live in seconds for the cached uploads
+        :param max_entries: maximum number of cached uploads
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Get the results of a previous upload
+
+        :param key: upload key
+        :return: upload results or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                # Expired entry
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, results: dict) -> None:
+        """
+        Save the results of an upload
+
+        :param key: upload key
+        :param results: upload results
+        :return: None
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DirectoryUploadCache(UploadCache):
+    def __init__(self, directory: str, ttl: float = UPLOAD_TOKEN_TTL):
+        """
+        Cache for the uploads results saved in a directory, to share the
+        upload tokens between many processes
+
+        :param directory: path of the directory containing the uploads
+        :param ttl: time to live in seconds for the cached uploads
+        """
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def get_filename(self, key: str) -> str:
+        """
+        Get the file name used to save the results for an upload
+
+        :param key: upload key
+        :return: file path for the upload results
+        """
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Get the results of a previous upload
+
+        :param key: upload key
+        :return: upload results or None if missing or expired
+        """
+        filename = self.get_filename(key=key)
+        try:
+            with open(filename, 'r') as file:
+                entry = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return None
+        if entry['expires'] < time.time():
+            # Expired entry
+            try:
+                os.remove(filename)
+            except FileNotFoundError:
+                pass
+            return None
+        return entry['results']
+
+    def set(self, key: str, results: dict) -> None:
+        """
+        Save the results of an upload, replacing the file atomically
+
+        :param key: upload key
+        :param results: upload results
+        :return: None
+        """
+        filename = self.get_filename(key=key)
+        temporary_filename = (f'{filename}.{os.getpid()}.'
+                              f'{threading.get_ident()}.tmp')
+        with open(temporary_filename, 'w') as file:
+            json.dump({'expires': time.time() + self.ttl,
+                       'results': results},
+                      file)
+        os.replace(temporary_filename, filename)
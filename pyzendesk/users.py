@@ -18,19 +18,26 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 ##
 
-from typing import Optional
+import concurrent.futures
+from typing import Iterable, Iterator, Optional
 
-from .api import Api
+from .api import Api, ApiError
+from .checkpoints import CheckpointStore
+from .constants import SHOW_MANY_MAX_IDS
+from .exporters import Exporter
+from .incremental import IncrementalExportMixin
+from .jobs import JobStatus
 
 
-class Users(Api):
+class Users(Api, IncrementalExportMixin):
     def me(self) -> dict:
         """
         Zendesk requester user information
 
         :return: user information
         """
-        return self.request_get(path='users/me.json')
+        return self.request_get(path='users/me.json',
+                                cached=True)
 
     def autocomplete(self, name: str) -> dict:
         """
@@ -48,49 +55,94 @@ class Users(Api):
         :param name: user name to match
         :return: dictionary with the user details
         """
-        results = {}
-        current_page = 0
-        next_page_url = 'initial value'
-        while next_page_url:
-            current_page += 1
-            search_results = self.autocomplete(name=f'{name}'
-                                                    f'&page={current_page}')
-            if not results:
-                # First page of results
-                results = search_results
-            elif 'error' in search_results:
-                # Too many results, search interrupted server side
-                results['error'] = search_results['error']
-                results['description'] = search_results['description']
-            else:
-                # Append results
-                results['users'].extend(search_results['users'])
-            if 'error' not in search_results:
-                # Continue processing the next page
-                next_page_url = search_results['next_page']
-            else:
-                # Stop search if any error occurred
-                next_page_url = None
-        return results
+        return self.merge_pages(pages=self.autocomplete_pages(name=name),
+                                key='users')
+
+    def autocomplete_pages(self, name: str) -> Iterator[dict]:
+        """
+        Get all the users pages with matching name
+
+        :param name: user name to match
+        :return: iterator over the users pages
+        """
+        return self.paginate(
+            request_page=lambda page: self.autocomplete(
+                name=f'{name}&page={page}'))
+
+    def iter_autocomplete_all(self, name: str) -> Iterator[dict]:
+        """
+        Get all the users with matching name one at a time,
+        as soon as each page arrives
 
-    def get(self, user_id: int) -> dict:
+        :param name: user name to match
+        :return: iterator over the users found
+        :raise ApiError: if any page returned an error
+        """
+        return self.iter_records(pages=self.autocomplete_pages(name=name),
+                                 key='users')
+
+    def get(self,
+            user_id: int,
+            include: Optional[list[str]] = None) -> dict:
         """
         Get a user's details
 
         :param user_id: user ID to get data from
+        :param include: list of related records to side-load
+                        (like organizations, groups, identities) or None
         :return: dictionary with the user details
         """
-        return self.request_get(path=f'users/{user_id}')
+        query = f'?include={",".join(include)}' if include else ''
+        return self.request_get(path=f'users/{user_id}{query}',
+                                cached=True)
 
-    def get_many(self, user_ids: list[int]) -> dict:
+    def get_many(self,
+                 user_ids: Iterable[int],
+                 chunk_size: int = SHOW_MANY_MAX_IDS,
+                 max_workers: int = 4) -> dict:
         """
-        Get many users' details
+        Get many users' details using concurrent requests for chunks of IDs
 
         :param user_ids: list of users ID to get data from
-        :return: dictionary with the user details
-        """
-        ids = ','.join(map(str, user_ids))
-        return self.request_get(path=f'users/show_many?ids={ids}')
+        :param chunk_size: maximum number of IDs for each request
+        :param max_workers: maximum number of concurrent requests
+        :return: dictionary with the user details in the same order of the
+                 IDs and the list of the IDs not found
+        """
+        missing_ids = []
+        try:
+            users = list(self.iter_many(user_ids=user_ids,
+                                        chunk_size=chunk_size,
+                                        max_workers=max_workers,
+                                        missing_ids=missing_ids))
+        except ApiError as error:
+            return error.results
+        return {'users': users,
+                'count': len(users),
+                'missing_ids': missing_ids}
+
+    def iter_many(self,
+                  user_ids: Iterable[int],
+                  chunk_size: int = SHOW_MANY_MAX_IDS,
+                  max_workers: int = 4,
+                  missing_ids: Optional[list[int]] = None) -> Iterator[dict]:
+        """
+        Get many users' details one at a time using concurrent requests for
+        chunks of IDs
+
+        :param user_ids: list of users ID to get data from
+        :param chunk_size: maximum number of IDs for each request
+        :param max_workers: maximum number of concurrent requests
+        :param missing_ids: list to fill with the IDs not found or None
+        :return: iterator over the user details in the same order of the IDs
+        :raise ApiError: if any request returned an error
+        """
+        return self.iter_show_many(path='users/show_many',
+                                   key='users',
+                                   ids=user_ids,
+                                   chunk_size=chunk_size,
+                                   max_workers=max_workers,
+                                   missing_ids=missing_ids)
 
     def get_related(self, user_id: int) -> dict:
         """
@@ -99,7 +151,8 @@ class Users(Api):
         :param user_id: user ID to get data from
         :return: dictionary with the user related details
         """
-        return self.request_get(path=f'users/{user_id}/related')
+        return self.request_get(path=f'users/{user_id}/related',
+                                cached=True)
 
     def merge(self, user_id: int, user_id_final: int) -> dict:
         """
@@ -109,9 +162,13 @@ class Users(Api):
         :param user_id_final: final user ID to merge data to
         :return: dictionary with the user related details
         """
-        return self.request_put(path=f'users/{user_id}/merge',
-                                json={'user': {
-                                    'id': user_id_final}})
+        results = self.request_put(path=f'users/{user_id}/merge',
+                                   json={'user': {
+                                       'id': user_id_final}})
+        if 'error' not in results:
+            self.invalidate_cache(path=f'users/{user_id}')
+            self.invalidate_cache(path=f'users/{user_id_final}')
+        return results
 
     def get_deleted(self, user_id: int) -> dict:
         """
@@ -120,7 +177,8 @@ class Users(Api):
         :param user_id: user ID to get data from
         :return: dictionary with the user related details
         """
-        return self.request_get(path=f'deleted_users/{user_id}')
+        return self.request_get(path=f'deleted_users/{user_id}',
+                                cached=True)
 
     def list_deleted(self) -> dict:
         """
@@ -130,6 +188,36 @@ class Users(Api):
         """
         return self.request_get(path='deleted_users')
 
+    def list_deleted_all(self) -> dict:
+        """
+        Get the deleted users list processing all the results by requesting
+        also the next pages
+
+        :return: dictionary with the deleted users details
+        """
+        return self.merge_pages(pages=self.list_deleted_pages(),
+                                key='deleted_users')
+
+    def list_deleted_pages(self) -> Iterator[dict]:
+        """
+        Get all the deleted users pages
+
+        :return: iterator over the deleted users pages
+        """
+        return self.paginate(
+            request_page=lambda page: self.request_get(
+                path=f'deleted_users?page={page}'))
+
+    def iter_deleted_all(self) -> Iterator[dict]:
+        """
+        Get all the deleted users one at a time, as soon as each page arrives
+
+        :return: iterator over the deleted users
+        :raise ApiError: if any page returned an error
+        """
+        return self.iter_records(pages=self.list_deleted_pages(),
+                                 key='deleted_users')
+
     def count(self, criteria_list: list) -> Optional[int]:
         """
         Get the number of users matching the specified criterias
@@ -142,52 +230,178 @@ class Users(Api):
             path=f'users/search?query={criteria}')
         return results.get('count')
 
-    def search(self, criteria_list: list) -> dict:
+    def search(self,
+               criteria_list: list,
+               include: Optional[list[str]] = None) -> dict:
         """
         Get the users matching the specified criterias
 
         :param criteria_list: list of string criterias
+        :param include: list of related records to side-load
+                        (like organizations, groups, identities) or None
         :return: dictionary with users details found
         """
         criteria = ' '.join(criteria_list)
+        query = f'&include={",".join(include)}' if include else ''
         return self.request_get(
-            path=f'users/search?query={criteria}')
+            path=f'users/search?query={criteria}{query}')
 
-    def search_all(self, criteria_list: list) -> dict:
+    def search_all(self,
+                   criteria_list: list,
+                   include: Optional[list[str]] = None) -> dict:
         """
         Get the users matching the specified criterias processing all the
         results by requesting also the next pages.
+        The side-loaded records are merged across the pages and they can be
+        indexed by ID using index_sideloads.
 
         :param criteria_list: list of string criterias
+        :param include: list of related records to side-load
+                        (like organizations, groups, identities) or None
         :return: dictionary with users details found
         """
-        results = {}
-        current_page = 0
-        next_page_url = 'initial value'
-        # Copy the criteria list which will be changed during the loop
-        criteria_list = criteria_list.copy()
-        while next_page_url:
-            current_page += 1
-            criteria_list.append(f'&page={current_page}')
-            search_results = self.search(criteria_list=criteria_list)
-            if not results:
-                # First page of results
-                results = search_results
-            elif 'error' in search_results:
-                # Too many results, search interrupted server side
-                results['error'] = search_results['error']
-                results['description'] = search_results['description']
-            else:
-                # Append results
-                results['users'].extend(search_results['users'])
-            if 'error' not in search_results:
-                # Continue processing the next page
-                next_page_url = search_results['next_page']
-            else:
-                # Stop search if any error occurred
-                next_page_url = None
-            criteria_list.remove(f'&page={current_page}')
-        return results
+        return self.merge_pages(
+            pages=self.search_pages(criteria_list=criteria_list,
+                                    include=include),
+            key='users',
+            sideloads=include)
+
+    def search_pages(self,
+                     criteria_list: list,
+                     include: Optional[list[str]] = None,
+                     page: int = 1) -> Iterator[dict]:
+        """
+        Get the users pages matching the specified criterias
+
+        :param criteria_list: list of string criterias
+        :param include: list of related records to side-load
+                        (like organizations, groups, identities) or None
+        :param page: page number to start from
+        :return: iterator over the users pages
+        """
+        return self.paginate(
+            request_page=lambda current_page: self.search(
+                criteria_list=[*criteria_list, f'&page={current_page}'],
+                include=include),
+            page=page)
+
+    def iter_search_all(self, criteria_list: list) -> Iterator[dict]:
+        """
+        Get the users matching the specified criterias one at a time,
+        as soon as each page arrives
+
+        :param criteria_list: list of string criterias
+        :return: iterator over the users found
+        :raise ApiError: if any page returned an error
+        """
+        return self.iter_records(
+            pages=self.search_pages(criteria_list=criteria_list),
+            key='users')
+
+    def save_search(self,
+                    exporter: Exporter,
+                    criteria_list: list) -> int:
+        """
+        Save the users matching the specified criterias to a file,
+        writing each page as soon as it arrives.
+        The export resumes from the last written page if the exporter
+        has a checkpoint store.
+
+        :param exporter: exporter used to write the users
+        :param criteria_list: list of string criterias
+        :return: number of users written
+        :raise ApiError: if any page returned an error
+        """
+        return exporter.export(
+            request_pages=lambda page: self.search_pages(
+                criteria_list=criteria_list,
+                page=int(page or 1)),
+            key='users',
+            get_cursor=self.get_next_page)
+
+    def incremental_export(self,
+                           start_time: int = 0,
+                           cursor: Optional[str] = None) -> dict:
+        """
+        Get the users changed after a start time or a cursor
+        using the cursor based incremental export API
+
+        :param start_time: UNIX time to start from for the first request
+        :param cursor: cursor returned by a previous request or None to use
+                       the start time
+        :return: dictionary with users details found
+        """
+        return self.incremental_export_resource(resource='users',
+                                                start_time=start_time,
+                                                cursor=cursor)
+
+    def incremental_export_pages(self,
+                                 start_time: int = 0,
+                                 cursor: Optional[str] = None
+                                 ) -> Iterator[dict]:
+        """
+        Get the users pages changed after a start time or a cursor
+        using the cursor based incremental export API
+
+        :param start_time: UNIX time to start from for the first request
+        :param cursor: cursor returned by a previous request or None to use
+                       the start time
+        :return: iterator over the users pages
+        """
+        return self.incremental_export_resource_pages(resource='users',
+                                                      start_time=start_time,
+                                                      cursor=cursor)
+
+    def iter_incremental_export(
+            self,
+            start_time: int = 0,
+            cursor: Optional[str] = None,
+            checkpoint_store: Optional[CheckpointStore] = None,
+            checkpoint_key: str = 'users',
+            stream: bool = False) -> Iterator[dict]:
+        """
+        Get the users changed after a start time or a cursor one at a time
+        using the cursor based incremental export API.
+        When a checkpoint store is passed, the export resumes from the saved
+        cursor and the cursor is saved after every processed page.
+        When stream is set, each record is decoded as soon as it arrives
+        instead of loading the whole page.
+
+        :param start_time: UNIX time to start from if no cursor is available
+        :param cursor: cursor to start from or None to use the saved
+                       checkpoint or the start time
+        :param checkpoint_store: store to load and save the cursor or None
+        :param checkpoint_key: checkpoint name used to save the cursor
+        :param stream: decode the records incrementally from the responses
+        :return: iterator over the users found
+        :raise ApiError: if any page returned an error
+        """
+        return self.iter_incremental_export_resource(
+            resource='users',
+            start_time=start_time,
+            cursor=cursor,
+            checkpoint_store=checkpoint_store,
+            checkpoint_key=checkpoint_key,
+            stream=stream)
+
+    def save_incremental_export(self,
+                                exporter: Exporter,
+                                start_time: int = 0) -> int:
+        """
+        Save the users changed after a start time to a file
+        using the cursor based incremental export API, writing each page
+        as soon as it arrives.
+        The export resumes from the last written page if the exporter
+        has a checkpoint store.
+
+        :param exporter: exporter used to write the users
+        :param start_time: UNIX time to start from
+        :return: number of users written
+        :raise ApiError: if any page returned an error
+        """
+        return self.save_incremental_export_resource(resource='users',
+                                                     exporter=exporter,
+                                                     start_time=start_time)
 
     def create(self, user: dict) -> dict:
         """
@@ -209,6 +423,30 @@ class Users(Api):
         return self.request_post(path='users/create_many',
                                  json={'users': users})
 
+    def iter_create_many(self,
+                         users: Iterable[dict],
+                         chunk_size: int = SHOW_MANY_MAX_IDS,
+                         max_jobs: int = 10,
+                         poll_interval: float = 1.0) -> Iterator[dict]:
+        """
+        Create many new users using background jobs for chunks of users,
+        keeping a limited number of jobs in progress
+
+        :param users: user details list of dictionaries
+        :param chunk_size: maximum number of users for each job
+        :param max_jobs: maximum number of jobs in progress
+        :param poll_interval: delay in seconds before the first job check
+        :return: iterator over the results for each user, in the same order
+                 of the users, with the user details, the success status
+                 and the job result
+        :raise ApiError: if any job submission returned an error
+        """
+        return self.iter_bulk_jobs(path='users/create_many',
+                                   users=users,
+                                   chunk_size=chunk_size,
+                                   max_jobs=max_jobs,
+                                   poll_interval=poll_interval)
+
     def create_or_update(self, user: dict) -> dict:
         """
         Create a new user or update an existing user
@@ -229,6 +467,67 @@ class Users(Api):
         return self.request_post(path='users/create_or_update_many',
                                  json={'users': users})
 
+    def iter_create_or_update_many(self,
+                                   users: Iterable[dict],
+                                   chunk_size: int = SHOW_MANY_MAX_IDS,
+                                   max_jobs: int = 10,
+                                   poll_interval: float = 1.0
+                                   ) -> Iterator[dict]:
+        """
+        Create many new users or update many existing users using background
+        jobs for chunks of users, keeping a limited number of jobs in progress
+
+        :param users: user details list of dictionaries
+        :param chunk_size: maximum number of users for each job
+        :param max_jobs: maximum number of jobs in progress
+        :param poll_interval: delay in seconds before the first job check
+        :return: iterator over the results for each user, in the same order
+                 of the users, with the user details, the success status
+                 and the job result
+        :raise ApiError: if any job submission returned an error
+        """
+        return self.iter_bulk_jobs(path='users/create_or_update_many',
+                                   users=users,
+                                   chunk_size=chunk_size,
+                                   max_jobs=max_jobs,
+                                   poll_interval=poll_interval)
+
+    def iter_bulk_jobs(self,
+                       path: str,
+                       users: Iterable[dict],
+                       chunk_size: int,
+                       max_jobs: int,
+                       poll_interval: float) -> Iterator[dict]:
+        """
+        Submit many users to a bulk API using background jobs for chunks
+        of users, keeping a limited number of jobs in progress
+
+        :param path: API path for the bulk request
+        :param users: user details list of dictionaries
+        :param chunk_size: maximum number of users for each job
+        :param max_jobs: maximum number of jobs in progress
+        :param poll_interval: delay in seconds before the first job check
+        :return: iterator over the results for each user, in the same order
+                 of the users
+        :raise ApiError: if any job submission returned an error
+        """
+        def submit(chunk: list[dict]) -> JobStatus:
+            results = self.request_post(path=path,
+                                        json={'users': chunk})
+            if 'error' in results:
+                raise ApiError(results=results)
+            return JobStatus(api=self, status=results['job_status'])
+
+        for chunk, job in JobStatus.iter_run_many(
+                submit=submit,
+                chunks=self.iter_chunks(items=users, chunk_size=chunk_size),
+                max_jobs=max_jobs,
+                poll_interval=poll_interval):
+            for item_results in job.get_items_results(items=chunk):
+                yield {'user': item_results['item'],
+                       'success': item_results['success'],
+                       'result': item_results['result']}
+
     def delete(self, user_id: int) -> dict:
         """
         Delete a user
@@ -236,7 +535,61 @@ class Users(Api):
         :param user_id: user ID to delete
         :return: deleted user details
         """
-        return self.request_delete(path=f'users/{user_id}')
+        results = self.request_delete(path=f'users/{user_id}')
+        if 'error' not in results:
+            self.invalidate_cache(path=f'users/{user_id}')
+        return results
+
+    def delete_many(self,
+                    user_ids: Iterable[int],
+                    chunk_size: int = SHOW_MANY_MAX_IDS,
+                    max_jobs: int = 10,
+                    poll_interval: float = 1.0) -> list[dict]:
+        """
+        Delete many users using background jobs for chunks of IDs
+
+        :param user_ids: list of users ID to delete
+        :param chunk_size: maximum number of users for each job
+        :param max_jobs: maximum number of jobs in progress
+        :param poll_interval: delay in seconds before the first job check
+        :return: list with the results for each user ID
+        :raise ApiError: if any job submission returned an error
+        """
+        return list(self.iter_delete_many(user_ids=user_ids,
+                                          chunk_size=chunk_size,
+                                          max_jobs=max_jobs,
+                                          poll_interval=poll_interval))
+
+    def iter_delete_many(self,
+                         user_ids: Iterable[int],
+                         chunk_size: int = SHOW_MANY_MAX_IDS,
+                         max_jobs: int = 10,
+                         poll_interval: float = 1.0) -> Iterator[dict]:
+        """
+        Delete many users using background jobs for chunks of IDs,
+        keeping a limited number of jobs in progress
+
+        :param user_ids: list of users ID to delete
+        :param chunk_size: maximum number of users for each job
+        :param max_jobs: maximum number of jobs in progress
+        :param poll_interval: delay in seconds before the first job check
+        :return: iterator over the results for each user ID, in the same
+                 order of the IDs, with the user ID, the success status and
+                 the job result
+        :raise ApiError: if any job submission returned an error
+        """
+        for item_results in JobStatus.iter_run_many_ids(
+                api=self,
+                method='delete',
+                path='users/destroy_many.json',
+                ids=user_ids,
+                chunk_size=chunk_size,
+                max_jobs=max_jobs,
+                poll_interval=poll_interval):
+            self.invalidate_cache(path=f'users/{item_results["item"]}')
+            yield {'user_id': item_results['item'],
+                   'success': item_results['success'],
+                   'result': item_results['result']}
 
     def purge(self, user_id: int) -> dict:
         """
@@ -245,7 +598,49 @@ class Users(Api):
         :param user_id: user ID to delete permanently
         :return: deleted user details
         """
-        return self.request_delete(path=f'deleted_users/{user_id}')
+        results = self.request_delete(path=f'deleted_users/{user_id}')
+        if 'error' not in results:
+            self.invalidate_cache(path=f'deleted_users/{user_id}')
+        return results
+
+    def purge_many(self,
+                   user_ids: Iterable[int],
+                   max_workers: int = 4) -> list[dict]:
+        """
+        Permanently delete many deleted users using concurrent requests
+
+        :param user_ids: list of users ID to delete permanently
+        :param max_workers: maximum number of concurrent requests
+        :return: list with the results for each user ID
+        """
+        return list(self.iter_purge_many(user_ids=user_ids,
+                                         max_workers=max_workers))
+
+    def iter_purge_many(self,
+                        user_ids: Iterable[int],
+                        max_workers: int = 4) -> Iterator[dict]:
+        """
+        Permanently delete many deleted users using concurrent requests.
+        Zendesk has no bulk API to permanently delete users, so each user is
+        deleted with its own request.
+
+        :param user_ids: list of users ID to delete permanently
+        :param max_workers: maximum number of concurrent requests
+        :return: iterator over the results for each user ID, in the same
+                 order of the IDs, with the user ID, the success status and
+                 the response
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers) as executor:
+            for chunk in self.iter_chunks(items=dict.fromkeys(user_ids),
+                                          chunk_size=max_workers * 2):
+                for user_id, results in zip(
+                        chunk,
+                        executor.map(lambda item: self.purge(user_id=item),
+                                     chunk)):
+                    yield {'user_id': user_id,
+                           'success': 'error' not in results,
+                           'result': results}
 
     def update(self, user_id: int, user: dict) -> dict:
         """
@@ -255,5 +650,8 @@ class Users(Api):
         :param user: user details dictionary
         :return: updated user details
         """
-        return self.request_put(path=f'users/{user_id}',
-                                json={'user': user})
+        results = self.request_put(path=f'users/{user_id}',
+                                   json={'user': user})
+        if 'error' not in results:
+            self.invalidate_cache(path=f'users/{user_id}')
+        return results
@@ -0,0 +1,88 @@
+##
+#     Project: PyZendesk
+# Description: API for Zendesk
+#      Author: Fabio Castelli (Muflone) <muflone@muflone.com>
+#   Copyright: 2021-2025 Fabio Castelli
+#     License: GPL-3+
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##
+
+import os
+import tempfile
+import unittest
+
+try:
+    import aiohttp
+    import aiohttp.web
+except ImportError:
+    aiohttp = None
+
+from pyzendesk import AsyncAttachments
+
+
+@unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+class TestAsyncAttachmentsUpload(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.uploads = []
+        app = aiohttp.web.Application()
+        app.router.add_post('/api/v2/uploads.json', self.handle_upload)
+        self.runner = aiohttp.web.AppRunner(app)
+        await self.runner.setup()
+        site = aiohttp.web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.zendesk = AsyncAttachments(website=f'http://127.0.0.1:{port}')
+        # Authentication enables the rate limits
+        self.zendesk.authenticate(username='user', password='password')
+        with tempfile.NamedTemporaryFile(suffix='.txt',
+                                         delete=False) as file:
+            file.write(b'attachment data')
+        self.filename = file.name
+
+    async def asyncTearDown(self):
+        await self.zendesk.close()
+        await self.runner.cleanup()
+        os.remove(self.filename)
+
+    async def handle_upload(self,
+                            request: 'aiohttp.web.Request'
+                            ) -> 'aiohttp.web.Response':
+        self.uploads.append(await request.read())
+        if len(self.uploads) == 1:
+            # Throttle the first upload
+            return aiohttp.web.json_response(data={'error': 'Throttled'},
+                                             status=429,
+                                             headers={'Retry-After': '0'})
+        return aiohttp.web.json_response(data={'upload': {'token': 'abc'}},
+                                         status=201)
+
+    async def test_upload_path_throttled(self):
+        results = await self.zendesk.upload(content_type=None,
+                                            filename=None,
+                                            data=self.filename)
+        self.assertEqual(results, {'upload': {'token': 'abc'}})
+        self.assertEqual(self.uploads, [b'attachment data'] * 2)
+
+    async def test_upload_file_throttled(self):
+        with open(self.filename, 'rb') as file:
+            results = await self.zendesk.upload(content_type=None,
+                                                filename=None,
+                                                data=file)
+            self.assertFalse(file.closed)
+        self.assertEqual(results, {'upload': {'token': 'abc'}})
+        self.assertEqual(self.uploads, [b'attachment data'] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()